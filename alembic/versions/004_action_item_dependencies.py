@@ -0,0 +1,27 @@
+"""Add depends_on column to action_items
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "action_items",
+        sa.Column("depends_on", JSONB, server_default="[]", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("action_items", "depends_on")
@@ -0,0 +1,34 @@
+"""Add meeting_checkpoints table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "meeting_checkpoints",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("thread_id", UUID(as_uuid=True), sa.ForeignKey("threads.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("round", sa.Integer, nullable=False),
+        sa.Column("label", sa.Text, nullable=False),
+        sa.Column("role", sa.Text, nullable=False),
+        sa.Column("output", sa.Text, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("thread_id", "round", name="uq_meeting_checkpoints_thread_round"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("meeting_checkpoints")
@@ -0,0 +1,32 @@
+"""Turn events into a transactional outbox
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("published_at", sa.DateTime(timezone=True), nullable=True))
+    # Everything written before the relay existed was already published
+    op.execute("UPDATE events SET published_at = created_at")
+    op.create_index(
+        "ix_events_unpublished",
+        "events",
+        ["created_at"],
+        postgresql_where=sa.text("published_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_unpublished", table_name="events")
+    op.drop_column("events", "published_at")
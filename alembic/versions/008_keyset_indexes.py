@@ -0,0 +1,53 @@
+"""Indexes for keyset pagination of list endpoints
+
+Every list is ordered by (created_at, id) within its parent, so each gets a
+matching composite index and a page is a single index range scan.  The
+indexes are built CONCURRENTLY so tables stay writable during the upgrade;
+the two older indexes they supersede are dropped afterwards.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    ("ix_projects_created", "projects", ["created_at", "id"]),
+    ("ix_agents_project_created", "agents", ["project_id", "created_at", "id"]),
+    ("ix_messages_thread_created", "messages", ["thread_id", "created_at", "id"]),
+    ("ix_memos_project_created", "memos", ["project_id", "created_at", "id"]),
+    ("ix_events_project_created_id", "events", ["project_id", "created_at", "id"]),
+    ("ix_tasks_project_created", "tasks", ["project_id", "created_at", "id"]),
+    ("ix_tasks_project_status_created", "tasks", ["project_id", "status", "created_at", "id"]),
+    ("ix_artifacts_project_created", "artifacts", ["project_id", "created_at", "id"]),
+]
+
+# Prefixes of the new indexes, kept only until those exist
+_SUPERSEDED = [
+    ("ix_events_project_created", "events", ["project_id", "created_at"]),
+    ("ix_tasks_project_status", "tasks", ["project_id", "status"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in _SUPERSEDED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _SUPERSEDED:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,61 @@
+"""Cache memo size and executive summary for memo lists
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+"""
+import re
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH = 200
+
+_memos = sa.table(
+    "memos",
+    sa.column("id"),
+    sa.column("content_markdown", sa.Text),
+    sa.column("size_bytes", sa.Integer),
+    sa.column("executive_summary", sa.Text),
+)
+
+
+# Frozen copy of app.workers.meeting._extract_executive_summary
+def _executive_summary(memo_markdown: str) -> str:
+    match = re.search(r"## Executive Summary\s*\n(.*?)(?=\n## |\Z)", memo_markdown, re.DOTALL)
+    if match:
+        return match.group(1).strip()
+    return memo_markdown[:500].strip()
+
+
+def upgrade() -> None:
+    op.add_column("memos", sa.Column("size_bytes", sa.Integer, nullable=False, server_default="0"))
+    op.add_column("memos", sa.Column("executive_summary", sa.Text, nullable=False, server_default=""))
+
+    conn = op.get_bind()
+    last_id = None
+    while True:
+        query = sa.select(_memos.c.id, _memos.c.content_markdown).order_by(_memos.c.id).limit(_BATCH)
+        if last_id is not None:
+            query = query.where(_memos.c.id > last_id)
+        rows = conn.execute(query).all()
+        for memo_id, content in rows:
+            conn.execute(
+                _memos.update()
+                .where(_memos.c.id == memo_id)
+                .values(size_bytes=len(content.encode()), executive_summary=_executive_summary(content))
+            )
+        if len(rows) < _BATCH:
+            break
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    op.drop_column("memos", "executive_summary")
+    op.drop_column("memos", "size_bytes")
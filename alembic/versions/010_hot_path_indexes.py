@@ -0,0 +1,43 @@
+"""Indexes for the remaining worker and router lookups
+
+* agents by (project_id, role): ``_get_agent_for_role`` on every round
+* decisions by project: ``_parse_ceo_approvals``
+* open action items by project, oldest first: ``execute_action_items``
+* artifacts by task: task detail and the task -> artifacts relationship
+
+Built CONCURRENTLY so the tables stay writable during the upgrade.
+``scripts/check_query_plans.py`` checks that none of these queries falls
+back to a sequential scan.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    ("ix_agents_project_role", "agents", ["project_id", "role"]),
+    ("ix_decisions_project_created", "decisions", ["project_id", "created_at"]),
+    ("ix_action_items_project_status_created", "action_items", ["project_id", "status", "created_at"]),
+    ("ix_artifacts_task", "artifacts", ["task_id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
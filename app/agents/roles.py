@@ -22,6 +22,10 @@ class RoleConfig:
     can_modify_files: bool = False
     can_run_commands: bool = False
     can_git_push: bool = False
+    # Read-only roles whose identical turns may be served from the response cache
+    cacheable: bool = False
+    # Approximate tokens of meeting transcript this role receives per turn
+    context_token_budget: int = 2500
 
 
 ROLE_CONFIGS: dict[str, RoleConfig] = {
@@ -39,6 +43,8 @@ ROLE_CONFIGS: dict[str, RoleConfig] = {
             "output APPROVED or REJECTED with a one-line rationale. "
             "Re-prioritize action items if needed. Be decisive and concise."
         ),
+        cacheable=True,
+        context_token_budget=2000,
     ),
     "pm": RoleConfig(
         persona=(
@@ -70,6 +76,7 @@ ROLE_CONFIGS: dict[str, RoleConfig] = {
         can_modify_files=True,
         can_run_commands=True,
         can_git_push=True,
+        context_token_budget=2000,
     ),
     "designer": RoleConfig(
         persona=(
@@ -85,6 +92,7 @@ ROLE_CONFIGS: dict[str, RoleConfig] = {
             "or design system documentation. Write files to the workspace."
         ),
         can_modify_files=True,
+        context_token_budget=2000,
     ),
     "analyst": RoleConfig(
         persona=(
@@ -99,6 +107,7 @@ ROLE_CONFIGS: dict[str, RoleConfig] = {
         ),
         can_modify_files=True,
         can_run_commands=True,
+        context_token_budget=2000,
     ),
     "memo_writer": RoleConfig(
         persona=(
@@ -108,6 +117,19 @@ ROLE_CONFIGS: dict[str, RoleConfig] = {
         tools_allowed=["read"],
         tools_denied=["edit", "write", "exec"],
         tool_profile="full",
+        cacheable=True,
+        context_token_budget=3000,
+    ),
+    "system": RoleConfig(
+        persona=(
+            "You are the meeting facilitator. You condense the user's prompt "
+            "and project context into a brief for the product team."
+        ),
+        tools_allowed=["read"],
+        tools_denied=["edit", "write", "exec"],
+        tool_profile="full",
+        cacheable=True,
+        context_token_budget=1500,
     ),
 }
 
@@ -0,0 +1,275 @@
+"""Per-process fan-out of project events to live API clients.
+
+``EventHub`` holds one Redis pattern subscription (``project:*:events``) for
+the whole API process and routes each message to the subscribers of that
+project, instead of every connected client opening its own connection and
+polling it.  The reader task starts with the first subscriber and
+reconnects with backoff if Redis goes away.
+
+Every subscriber gets a bounded queue (``WS_CLIENT_QUEUE_SIZE``).  A client
+too slow to keep up is cut off rather than slowing down delivery to the
+others: its queue is discarded and its next ``get`` raises
+``SubscriberOverflow``.
+
+``stream`` is what endpoints iterate.  It subscribes and waits until the
+pattern subscription is confirmed, then replays the project's Redis Stream
+after the client's ``last_id`` (so nothing published in between is lost),
+sends a ``STREAM_READY`` marker and switches to live messages, skipping any
+the replay already covered.  ``STREAM_READY`` carries the stream position to
+resume from and ``reset: true`` when ``last_id`` is older than the capped
+stream, in which case the client should reload the event history over REST.
+
+When the reader reconnects after losing Redis, every subscriber is told to
+resync: its stream replays what was published after the last event it
+delivered before going live again (with another ``STREAM_READY`` carrying
+``reset: true`` if the gap has already been trimmed away).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import redis.asyncio as aioredis
+import structlog
+
+from app.config import settings
+from app.events import stream_key, with_stream_id
+
+logger = structlog.get_logger(__name__)
+
+_PATTERN = "project:*:events"
+_OVERFLOW = object()
+_RESYNC = object()
+_STREAM_ID = re.compile(r"^\d+-\d+$")
+_STREAM_ID_PREFIX = '{"stream_id":"'
+_REPLAY_PAGE = 500
+
+
+def _parse_stream_id(stream_id: str) -> tuple[int, int]:
+    ms, _, seq = stream_id.partition("-")
+    return int(ms), int(seq)
+
+
+def stream_id_of(data: str) -> str | None:
+    """Stream id of a published event (ephemeral messages have none)."""
+    if not data.startswith(_STREAM_ID_PREFIX):
+        return None
+    end = data.find('"', len(_STREAM_ID_PREFIX))
+    return data[len(_STREAM_ID_PREFIX):end] if end > 0 else None
+
+
+def valid_stream_id(stream_id: str | None) -> bool:
+    return bool(stream_id) and bool(_STREAM_ID.match(stream_id))  # type: ignore[arg-type]
+
+
+class SubscriberOverflow(Exception):
+    """The subscriber fell more than its queue size behind and was dropped."""
+
+
+def _stream_ready(position: str | None, replayed: int, reset: bool) -> str:
+    return json.dumps({
+        "type": "STREAM_READY",
+        "payload_json": {"stream_id": position, "replayed": replayed, "reset": reset},
+    })
+
+
+class Subscription:
+    """One client's view of a project's events."""
+
+    def __init__(self, project_id: str, maxsize: int):
+        self.project_id = project_id
+        self._queue: asyncio.Queue[object] = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def put(self, data: str) -> None:
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_OVERFLOW)
+
+    def resync(self) -> None:
+        """Tell the reader that live messages may have been missed."""
+        if not self.overflowed:
+            self.put(_RESYNC)  # type: ignore[arg-type]
+
+    async def get(self) -> str | None:
+        """Next message, or ``None`` after a reconnect (messages may be missing)."""
+        data = await self._queue.get()
+        if data is _OVERFLOW:
+            raise SubscriberOverflow(self.project_id)
+        if data is _RESYNC:
+            return None
+        return data  # type: ignore[return-value]
+
+
+class EventHub:
+    """One pattern subscription shared by every client of this process."""
+
+    def __init__(self, redis_url: str = "", queue_size: int = 0):
+        self.redis_url = redis_url or settings.redis_url
+        self.queue_size = queue_size or settings.ws_client_queue_size
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._reader: aioredis.Redis | None = None
+        # Set while the pattern subscription is confirmed by Redis
+        self._subscribed = asyncio.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    @asynccontextmanager
+    async def subscribe(self, project_id: str) -> AsyncIterator[Subscription]:
+        self._ensure_started()
+        sub = Subscription(project_id, self.queue_size)
+        self._subscribers.setdefault(project_id, set()).add(sub)
+        try:
+            await self._subscribed.wait()
+            yield sub
+        finally:
+            subs = self._subscribers.get(project_id)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[project_id]
+
+    async def stream(self, project_id: str, last_id: str | None = None) -> AsyncIterator[str]:
+        """Replay after ``last_id``, then ``STREAM_READY``, then live messages."""
+        async with self.subscribe(project_id) as sub:
+            position: str | None = None
+            reset = False
+            replayed = 0
+            if valid_stream_id(last_id):
+                reset = await self._trimmed_past(project_id, last_id)  # type: ignore[arg-type]
+                position = last_id
+                async for entry_id, data in self._replay(project_id, last_id):  # type: ignore[arg-type]
+                    position = entry_id
+                    replayed += 1
+                    yield data
+            else:
+                position = await self._tail_id(project_id)
+
+            yield _stream_ready(position, replayed, reset)
+
+            high_water = _parse_stream_id(position) if replayed else None
+            while True:
+                data = await sub.get()
+                if data is None:
+                    # The hub reconnected: replay whatever was published
+                    # after the last event this client got
+                    reset = position is not None and await self._trimmed_past(project_id, position)
+                    replayed = 0
+                    async for entry_id, entry in self._replay(project_id, position or "0-0"):
+                        position = entry_id
+                        replayed += 1
+                        yield entry
+                    if replayed:
+                        high_water = _parse_stream_id(position)  # type: ignore[arg-type]
+                    if reset:
+                        yield _stream_ready(position, replayed, reset)
+                    logger.info("event_hub_resynced", project_id=project_id, replayed=replayed, reset=reset)
+                    continue
+                entry_id = stream_id_of(data)
+                if entry_id is not None:
+                    if high_water is not None:
+                        if _parse_stream_id(entry_id) <= high_water:
+                            continue
+                        high_water = None
+                    position = entry_id
+                yield data
+
+    def _redis(self) -> aioredis.Redis:
+        if self._reader is None:
+            self._reader = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._reader
+
+    async def _replay(self, project_id: str, last_id: str) -> AsyncIterator[tuple[str, str]]:
+        start = f"({last_id}"
+        while True:
+            entries = await self._redis().xrange(stream_key(project_id), start, "+", count=_REPLAY_PAGE)
+            for entry_id, fields in entries:
+                yield entry_id, with_stream_id(entry_id, fields["data"])
+            if len(entries) < _REPLAY_PAGE:
+                return
+            start = f"({entries[-1][0]}"
+
+    async def _tail_id(self, project_id: str) -> str | None:
+        entries = await self._redis().xrevrange(stream_key(project_id), "+", "-", count=1)
+        return entries[0][0] if entries else None
+
+    async def _trimmed_past(self, project_id: str, last_id: str) -> bool:
+        entries = await self._redis().xrange(stream_key(project_id), "-", "+", count=1)
+        return bool(entries) and _parse_stream_id(entries[0][0]) > _parse_stream_id(last_id)
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._subscribed = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="event-hub")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._reader is not None:
+            await self._reader.aclose()
+            self._reader = None
+
+    def _resync_all(self) -> None:
+        for subs in list(self._subscribers.values()):
+            for sub in list(subs):
+                sub.resync()
+
+    def _dispatch(self, channel: str, data: str) -> None:
+        project_id = channel.split(":", 2)[1]
+        for sub in list(self._subscribers.get(project_id, ())):
+            if sub.overflowed:
+                continue
+            sub.put(data)
+            if sub.overflowed:
+                logger.warning("event_hub_subscriber_overflow", project_id=project_id)
+
+    async def _run(self) -> None:
+        backoff = 0.5
+        reconnect = False
+        while True:
+            client = aioredis.from_url(self.redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(_PATTERN)
+                async for msg in pubsub.listen():
+                    if msg["type"] == "pmessage":
+                        self._dispatch(msg["channel"], msg["data"])
+                    elif msg["type"] == "psubscribe":
+                        # Only now are new messages guaranteed to reach us
+                        logger.info("event_hub_subscribed", pattern=_PATTERN, reconnect=reconnect)
+                        backoff = 0.5
+                        self._subscribed.set()
+                        if reconnect:
+                            self._resync_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("event_hub_disconnected", error=str(exc), retry_in=backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                reconnect = reconnect or self._subscribed.is_set()
+                self._subscribed.clear()
+                await pubsub.aclose()
+                await client.aclose()
+
+
+hub = EventHub()
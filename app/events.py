@@ -0,0 +1,250 @@
+"""Shared Redis publisher for project events.
+
+Live subscribers read the project's ``project:<id>:events`` channel.
+``Event`` rows reach it through the outbox relay (``app.workers.outbox``),
+which calls ``publish_batch`` for each batch it claims.  Each event is also
+appended to the project's Redis Stream (``project:<id>:stream``, trimmed to
+about ``EVENT_STREAM_MAXLEN`` entries) by a Lua script that publishes the
+message with the entry's id as ``stream_id``.  Clients that reconnect resume
+from the last ``stream_id`` they saw (see ``app.event_hub``).  Ephemeral messages
+that are never stored, such as ``AGENT_OUTPUT_DELTA``, go through
+``publish``: it only enqueues the message, and a background thread per
+process drains the queue and sends each burst as one pipelined round trip
+over the process-wide connection pool of ``get_redis()``.  A burst is
+whatever is queued, waiting at most ``EVENT_PUBLISH_LINGER_MS`` for more and
+capped at ``EVENT_PUBLISH_BATCH_MAX`` messages.  A single thread keeps
+messages in the order they were published.
+
+``publish`` is best effort: a failed batch is logged and dropped, and a full
+queue (``EVENT_PUBLISH_QUEUE_MAX``) drops new messages rather than blocking
+the worker.  Publish latency, batch sizes and drop counts are kept in Redis
+so every process contributes to the same totals; ``publish_stats`` reads
+them for ``/metrics/events``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+import structlog
+
+from app.config import settings
+from app.redis_client import get_redis
+
+logger = structlog.get_logger(__name__)
+
+_STATS_KEY = "events:publish:stats"
+# Upper bounds (ms) of the latency histogram; the last bucket is open-ended
+_LATENCY_BUCKETS_MS = (1, 5, 25, 100, 500)
+
+
+# XADD to the stream and PUBLISH the same message with the entry id spliced
+# in as its first field, atomically.  ARGV: maxlen, channel, message JSON.
+_STREAM_PUBLISH_LUA = """
+local id = redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', 'data', ARGV[3])
+redis.call('PUBLISH', ARGV[2], '{"stream_id":"' .. id .. '",' .. string.sub(ARGV[3], 2))
+return id
+"""
+_stream_publish: Any = None
+
+
+def channel(project_id: str) -> str:
+    return f"project:{project_id}:events"
+
+
+def stream_key(project_id: str) -> str:
+    return f"project:{project_id}:stream"
+
+
+def with_stream_id(stream_id: str, data: str) -> str:
+    """The published form of a stream entry (what the Lua script sends)."""
+    return f'{{"stream_id":"{stream_id}",{data[1:]}'
+
+
+def event_message(event: Any) -> dict[str, Any]:
+    """Wire form of an ``Event`` row, as sent to WebSocket clients."""
+    return {
+        "id": str(event.id),
+        "project_id": str(event.project_id),
+        "type": event.type,
+        "payload_json": event.payload_json,
+        "created_at": event.created_at.isoformat() if event.created_at else None,
+    }
+
+
+def _bucket(latency_ms: float) -> str:
+    for bound in _LATENCY_BUCKETS_MS:
+        if latency_ms <= bound:
+            return f"le_{bound}ms"
+    return "inf"
+
+
+class EventPublisher:
+    """Queue plus background thread that publishes in pipelined batches."""
+
+    def __init__(
+        self,
+        batch_max: int | None = None,
+        linger_ms: float | None = None,
+        queue_max: int | None = None,
+    ):
+        self.batch_max = batch_max or settings.event_publish_batch_max
+        self.linger = (settings.event_publish_linger_ms if linger_ms is None else linger_ms) / 1000
+        self._queue: queue.Queue[tuple[str, str, float]] = queue.Queue(
+            maxsize=queue_max or settings.event_publish_queue_max,
+        )
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._dropped = 0
+
+    def publish(self, project_id: str, message: dict[str, Any]) -> None:
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((channel(project_id), json.dumps(message), time.monotonic()))
+        except queue.Full:
+            self._dropped += 1
+            logger.warning("event_publish_dropped", project_id=project_id, type=message.get("type"))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been sent (or dropped)."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="event-publisher", daemon=True)
+                self._thread.start()
+
+    def _next_batch(self) -> list[tuple[str, str, float]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_max:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._send(batch)
+            except Exception as exc:
+                logger.warning("redis_publish_failed", error=str(exc), batch=len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _send(self, batch: list[tuple[str, str, float]]) -> None:
+        _pipeline_publish([(chan, data) for chan, data, _ in batch])
+        now = time.monotonic()
+        dropped, self._dropped = self._dropped, 0
+        _record_stats([(now - queued) * 1000 for _, _, queued in batch], dropped)
+
+
+def _pipeline_publish(batch: list[tuple[str, str]]) -> None:
+    pipe = get_redis().pipeline(transaction=False)
+    for chan, data in batch:
+        pipe.publish(chan, data)
+    pipe.execute()
+
+
+def _record_stats(latencies_ms: list[float], dropped: int = 0) -> None:
+    try:
+        stats = get_redis().pipeline(transaction=False)
+        stats.hincrby(_STATS_KEY, "published", len(latencies_ms))
+        stats.hincrby(_STATS_KEY, "batches", 1)
+        stats.hincrbyfloat(_STATS_KEY, "latency_ms_sum", sum(latencies_ms))
+        for bucket, count in Counter(_bucket(latency) for latency in latencies_ms).items():
+            stats.hincrby(_STATS_KEY, bucket, count)
+        if dropped:
+            stats.hincrby(_STATS_KEY, "dropped", dropped)
+        stats.execute()
+    except Exception as exc:
+        logger.debug("event_publish_stats_failed", error=str(exc))
+
+
+def publish_batch(messages: list[tuple[str, dict[str, Any]]], latencies_ms: list[float]) -> None:
+    """Append ``(project_id, message)`` pairs to their project streams and
+    publish them now, in one pipelined round trip.
+
+    Unlike ``publish`` this raises when Redis is unavailable, so the caller
+    knows the batch was not delivered.
+    """
+    global _stream_publish
+    if not messages:
+        return
+    r = get_redis()
+    if _stream_publish is None:
+        _stream_publish = r.register_script(_STREAM_PUBLISH_LUA)
+    pipe = r.pipeline(transaction=False)
+    for project_id, message in messages:
+        _stream_publish(
+            keys=[stream_key(project_id)],
+            args=[settings.event_stream_maxlen, channel(project_id), json.dumps(message)],
+            client=pipe,
+        )
+    pipe.execute()
+    _record_stats(latencies_ms)
+
+
+_publisher: EventPublisher | None = None
+_publisher_pid = 0
+
+
+def get_publisher() -> EventPublisher:
+    """The publisher for this process (a forked child gets its own)."""
+    global _publisher, _publisher_pid
+    if _publisher is None or _publisher_pid != os.getpid():
+        _publisher = EventPublisher()
+        _publisher_pid = os.getpid()
+    return _publisher
+
+
+def publish(project_id: str, message: dict[str, Any]) -> None:
+    get_publisher().publish(project_id, message)
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    if _publisher is not None and _publisher_pid == os.getpid():
+        _publisher.flush(timeout=2.0)
+
+
+def publish_stats() -> dict[str, Any]:
+    """Cluster-wide publish counters and latency histogram."""
+    raw = {k.decode(): float(v) for k, v in get_redis().hgetall(_STATS_KEY).items()}
+    published = int(raw.get("published", 0))
+    batches = int(raw.get("batches", 0))
+    buckets = [f"le_{bound}ms" for bound in _LATENCY_BUCKETS_MS] + ["inf"]
+    return {
+        "published": published,
+        "batches": batches,
+        "dropped": int(raw.get("dropped", 0)),
+        "avg_batch_size": round(published / batches, 2) if batches else 0.0,
+        "avg_latency_ms": round(raw.get("latency_ms_sum", 0.0) / published, 3) if published else 0.0,
+        "latency_ms_histogram": {b: int(raw.get(b, 0)) for b in buckets},
+    }
@@ -0,0 +1,95 @@
+"""Conditional GET support: ETags, Last-Modified and 304 responses.
+
+Detail endpoints compute a strong ETag from the few columns that can change
+a resource (for memos and artifacts only the id and creation time, since
+they are written once) and check it before loading or serializing the
+body.  List endpoints get a weak ETag from the page they return: the ids
+of its items, whichever of their columns can change after insert (a task's
+status and ``completed_at``) and the page's cursors.  The page itself is
+one bounded index range scan, so the tag costs no extra query however long
+the list is; a 304 only saves serialising and sending it.  A request whose
+``If-None-Match`` (or, failing that, ``If-Modified-Since``) still matches is
+answered with an empty 304.
+
+Responses are sent with ``Cache-Control: no-cache`` so browsers keep them
+but revalidate every time, which is what SWR revalidation turns into.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+
+from app.pagination import Page
+
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_fresh(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """Whether the client's cached copy is still current (RFC 9110 weak comparison)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {_opaque(tag.strip()) for tag in if_none_match.split(",")}
+        return _opaque(etag) in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have whole-second precision
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def cache_headers(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+
+def conditional(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> Response | None:
+    """Return a 304 if the client is current, else set the validators on ``response``."""
+    headers = cache_headers(etag, last_modified)
+    if is_fresh(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def page_etag(page: Page[Any], fields: tuple[str, ...] = ("id",)) -> str:
+    """Weak ETag of a list page from ``fields`` of each item and its cursors.
+
+    ``fields`` must include every column of an item that can change after
+    it is inserted.
+    """
+    values = [getattr(item, field) for item in page.items for field in fields]
+    return make_etag(*values, page.next_cursor, page.prev_cursor, page.has_more, weak=True)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.routers import agents, artifacts, events, memos, projects, sessions, tasks, threads
+from app.event_hub import hub
+from app.routers import agents, artifacts, events, memos, metrics, projects, sessions, tasks, threads
+from app.sse import router as sse_router
 from app.websocket import router as ws_router
 
 structlog.configure(
@@ -21,10 +26,18 @@ structlog.configure(
     cache_logger_on_first_use=True,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await hub.stop()
+
+
 app = FastAPI(
     title="AI Product Team Dashboard",
     description="Multi-agent dashboard powered by OpenClaw",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -43,7 +56,9 @@ app.include_router(tasks.router)
 app.include_router(artifacts.router)
 app.include_router(memos.router)
 app.include_router(events.router)
+app.include_router(metrics.router)
 app.include_router(ws_router)
+app.include_router(sse_router)
 
 
 @app.get("/health")
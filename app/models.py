@@ -4,7 +4,7 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum as _SAEnum, ForeignKey, Index, Text, func
+from sqlalchemy import DateTime, Enum as _SAEnum, ForeignKey, Index, Integer, Text, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -98,6 +98,9 @@ class ArtifactType(str, enum.Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     name: Mapped[str] = mapped_column(Text, nullable=False)
@@ -116,6 +119,10 @@ class Project(Base):
 
 class Agent(Base):
     __tablename__ = "agents"
+    __table_args__ = (
+        Index("ix_agents_project_created", "project_id", "created_at", "id"),
+        Index("ix_agents_project_role", "project_id", "role"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -138,23 +145,80 @@ class Thread(Base):
 
     project: Mapped[Project] = relationship(back_populates="threads")
     messages: Mapped[list[Message]] = relationship(back_populates="thread", cascade="all, delete-orphan")
+    checkpoints: Mapped[list[MeetingCheckpoint]] = relationship(
+        back_populates="thread", cascade="all, delete-orphan",
+    )
+    agent_sessions: Mapped[list[AgentSession]] = relationship(
+        back_populates="thread", cascade="all, delete-orphan",
+    )
 
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_thread_created", "thread_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     thread_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("threads.id", ondelete="CASCADE"), nullable=False)
     author_type: Mapped[AuthorType] = mapped_column(_ValuesEnum(AuthorType), nullable=False)
     author_agent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Set on insert, like Event.created_at, so messages added in one
+    # transaction keep their order
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
 
     thread: Mapped[Thread] = relationship(back_populates="messages")
 
 
+class MeetingCheckpoint(Base):
+    """Output of one completed meeting round, used to resume a pipeline."""
+
+    __tablename__ = "meeting_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("thread_id", "round", name="uq_meeting_checkpoints_thread_round"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
+    thread_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("threads.id", ondelete="CASCADE"), nullable=False)
+    round: Mapped[int] = mapped_column(Integer, nullable=False)
+    label: Mapped[str] = mapped_column(Text, nullable=False)
+    role: Mapped[str] = mapped_column(Text, nullable=False)
+    output: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    thread: Mapped[Thread] = relationship(back_populates="checkpoints")
+
+
+class AgentSession(Base):
+    """Stable OpenClaw session of one agent within a meeting thread."""
+
+    __tablename__ = "agent_sessions"
+    __table_args__ = (
+        UniqueConstraint("thread_id", "role", name="uq_agent_sessions_thread_role"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
+    thread_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("threads.id", ondelete="CASCADE"), nullable=False)
+    agent_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("agents.id", ondelete="SET NULL"), nullable=True,
+    )
+    role: Mapped[str] = mapped_column(Text, nullable=False)
+    session_id: Mapped[str] = mapped_column(Text, nullable=False)
+    # Meeting rounds already in this session's history (sent to it or written by it)
+    rounds_seen: Mapped[list] = mapped_column(JSONB, default=list)
+    turns: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
+
+    thread: Mapped[Thread] = relationship(back_populates="agent_sessions")
+
+
 class Decision(Base):
     __tablename__ = "decisions"
+    __table_args__ = (
+        Index("ix_decisions_project_created", "project_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -169,12 +233,17 @@ class Decision(Base):
 
 class ActionItem(Base):
     __tablename__ = "action_items"
+    __table_args__ = (
+        Index("ix_action_items_project_status_created", "project_id", "status", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     owner_role: Mapped[AgentRole] = mapped_column(_ValuesEnum(AgentRole), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[ActionItemStatus] = mapped_column(_ValuesEnum(ActionItemStatus), default=ActionItemStatus.OPEN)
+    # IDs of action items that must finish before this one may start
+    depends_on: Mapped[list] = mapped_column(JSONB, default=list)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     project: Mapped[Project] = relationship(back_populates="action_items")
@@ -182,11 +251,17 @@ class ActionItem(Base):
 
 class Memo(Base):
     __tablename__ = "memos"
+    __table_args__ = (
+        Index("ix_memos_project_created", "project_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title: Mapped[str] = mapped_column(Text, nullable=False)
     content_markdown: Mapped[str] = mapped_column(Text, nullable=False)
+    # Cached at write time so memo lists never load the markdown body
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    executive_summary: Mapped[str] = mapped_column(Text, nullable=False, default="")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     project: Mapped[Project] = relationship(back_populates="memos")
@@ -195,14 +270,19 @@ class Memo(Base):
 class Event(Base):
     __tablename__ = "events"
     __table_args__ = (
-        Index("ix_events_project_created", "project_id", "created_at"),
+        Index("ix_events_project_created_id", "project_id", "created_at", "id"),
+        # Outbox: rows still to be published by the relay
+        Index("ix_events_unpublished", "created_at", postgresql_where=text("published_at IS NULL")),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     type: Mapped[str] = mapped_column(Text, nullable=False)
     payload_json: Mapped[dict] = mapped_column(JSONB, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Set on insert rather than by the database so that events written in one
+    # transaction keep distinct, ordered timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     project: Mapped[Project] = relationship(back_populates="events")
 
@@ -210,7 +290,8 @@ class Event(Base):
 class Task(Base):
     __tablename__ = "tasks"
     __table_args__ = (
-        Index("ix_tasks_project_status", "project_id", "status"),
+        Index("ix_tasks_project_created", "project_id", "created_at", "id"),
+        Index("ix_tasks_project_status_created", "project_id", "status", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
@@ -235,6 +316,10 @@ class Task(Base):
 
 class Artifact(Base):
     __tablename__ = "artifacts"
+    __table_args__ = (
+        Index("ix_artifacts_project_created", "project_id", "created_at", "id"),
+        Index("ix_artifacts_task", "task_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_new_id)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
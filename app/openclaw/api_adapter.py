@@ -1,48 +1,358 @@
-"""Future OpenClaw Python API adapter (stub).
+"""OpenClaw Gateway adapter.
 
-When OpenClaw ships a first-party Python SDK or HTTP/WebSocket API,
-replace this stub with real calls.  The interface matches ``CLIAdapter``
-exactly so the rest of the codebase requires zero changes — just swap
-the adapter in ``client.py``.
+Talks to the OpenClaw Gateway (``OPENCLAW_GATEWAY_URL``) over a small pool
+of long-lived WebSocket connections instead of spawning a CLI process per
+agent turn.  Every connection multiplexes many concurrent agent sessions:
+requests carry an id, and responses and streamed events are routed back to
+the waiting caller by that id.
 
-SWAP POINT: change ``_create_adapter()`` in ``client.py`` to return
-``APIAdapter(...)`` instead of ``CLIAdapter(...)`` once the SDK exists.
+Frames are JSON objects::
+
+    -> {"type": "req", "id": "<id>", "method": "connect", "params": {"auth": {"token": ...}}}
+    -> {"type": "req", "id": "<id>", "method": "agent", "params": {"message": ..., "sessionId": ...}}
+    <- {"type": "event", "event": "agent.delta", "payload": {"requestId": "<id>", "text": ...}}
+    <- {"type": "res", "id": "<id>", "ok": true, "payload": {"payloads": [...], "meta": {...}}}
+    -> {"type": "req", "id": "<id>-cancel", "method": "agent.cancel", "params": {"requestId": "<id>"}}
+
+The pool lives on a private event loop thread, so the synchronous
+``invoke`` used by Celery workers and the async ``ainvoke`` share the same
+connections.  Dropped connections are re-established lazily with
+exponential backoff; a ``connect`` the gateway answers with an error (bad
+token) is not retried.  When an agent request times out locally an
+``agent.cancel`` frame is sent for it, fire-and-forget: a gateway that does
+not support cancelling keeps running the turn until its own
+``timeoutSeconds`` runs out.  ``scripts/fake_gateway.py`` serves this
+protocol locally for offline testing.
 """
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
+import os
+import random
+import threading
+from typing import Any
+
 import structlog
 
-from app.openclaw.base import AgentInvocation, AgentResult, OpenClawAdapter
+from app.config import settings
+from app.openclaw.base import (
+    AgentInvocation,
+    AgentResult,
+    OpenClawAdapter,
+    OutputCallback,
+)
+from app.openclaw.prompt import build_message
+from app.openclaw.stream_parser import extract_text
 
 logger = structlog.get_logger(__name__)
 
 
-class APIAdapter(OpenClawAdapter):
-    """Placeholder for a future OpenClaw Python SDK / HTTP API adapter."""
+class GatewayError(RuntimeError):
+    """The gateway rejected a request or could not be reached."""
+
+
+class GatewayRejectedError(GatewayError):
+    """The gateway answered a request with an error frame."""
 
-    def __init__(self, gateway_url: str = "", token: str = ""):
-        self.gateway_url = gateway_url
+
+class _GatewayConnection:
+    """One WebSocket to the gateway carrying many in-flight requests."""
+
+    def __init__(self, url: str, token: str, index: int):
+        self.url = url
         self.token = token
+        self.index = index
+        self._ws: Any = None
+        self._reader: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._ids = itertools.count()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._listeners: dict[str, OutputCallback] = {}
+        # Requests assigned to this connection, including ones still waiting
+        # for it to (re)connect
+        self.active = 0
 
-    def invoke(self, invocation: AgentInvocation) -> AgentResult:
-        # ---------------------------------------------------------------
-        # FUTURE: replace with real SDK calls, e.g.:
-        #
-        #   from openclaw import Client
-        #   client = Client(url=self.gateway_url, token=self.token)
-        #   resp = client.agent.run(
-        #       message=invocation.instruction,
-        #       session_id=invocation.session_id,
-        #       model=invocation.model,
-        #       tools={"profile": invocation.tool_profile},
-        #   )
-        #   return AgentResult(output=resp.text, tool_logs=resp.tool_calls, ...)
-        # ---------------------------------------------------------------
-        raise NotImplementedError(
-            "APIAdapter is a stub.  Use CLIAdapter or implement the "
-            "OpenClaw Python SDK integration here."
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and self._reader is not None and not self._reader.done()
+
+    async def ensure_connected(self) -> None:
+        if self.connected:
+            return
+        async with self._lock:
+            if self.connected:
+                return
+            await self._connect_with_backoff()
+
+    async def _connect_with_backoff(self) -> None:
+        from websockets.asyncio.client import connect
+
+        await self._close()
+        attempts = max(1, settings.openclaw_gateway_reconnect_attempts)
+        for attempt in range(attempts):
+            try:
+                self._ws = await asyncio.wait_for(
+                    connect(self.url, max_size=None, open_timeout=None),
+                    timeout=settings.openclaw_gateway_connect_timeout,
+                )
+                self._reader = asyncio.create_task(self._read_loop(self._ws))
+                await self.request(
+                    "connect",
+                    {"auth": {"token": self.token}, "client": {"name": "openclaw-dashboard"}},
+                    timeout=settings.openclaw_gateway_connect_timeout,
+                )
+                logger.info("openclaw_gateway_connected", url=self.url, conn=self.index)
+                return
+            except GatewayRejectedError as exc:
+                # Bad credentials will not get better with backoff
+                await self._close()
+                logger.error("openclaw_gateway_auth_failed", url=self.url, conn=self.index, error=str(exc))
+                raise GatewayError(f"OpenClaw gateway at {self.url} rejected the connection: {exc}") from exc
+            except Exception as exc:
+                await self._close()
+                if attempt == attempts - 1:
+                    raise GatewayError(f"Cannot connect to OpenClaw gateway at {self.url}: {exc}") from exc
+                delay = min(
+                    settings.openclaw_gateway_backoff_max_seconds,
+                    settings.openclaw_gateway_backoff_base_seconds * 2 ** attempt,
+                ) * random.uniform(0.5, 1.0)
+                logger.warning(
+                    "openclaw_gateway_reconnect",
+                    conn=self.index,
+                    attempt=attempt + 1,
+                    delay=round(delay, 2),
+                    error=str(exc),
+                )
+                await asyncio.sleep(delay)
+
+    async def request(
+        self,
+        method: str,
+        params: dict[str, Any],
+        timeout: float,
+        on_event: OutputCallback | None = None,
+    ) -> dict[str, Any]:
+        req_id = f"{os.getpid()}-{self.index}-{next(self._ids)}"
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+        if on_event is not None:
+            self._listeners[req_id] = on_event
+
+        try:
+            try:
+                await self._ws.send(json.dumps({"type": "req", "id": req_id, "method": method, "params": params}))
+            except Exception as exc:
+                raise GatewayError(f"Failed to send to OpenClaw gateway: {exc}") from exc
+            frame = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            if method == "agent":
+                await self._cancel(req_id)
+            raise
+        finally:
+            self._pending.pop(req_id, None)
+            self._listeners.pop(req_id, None)
+
+        if not frame.get("ok", False):
+            error = frame.get("error") or {}
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            raise GatewayRejectedError(message or f"Gateway request '{method}' failed")
+        return frame.get("payload") or {}
+
+    async def _cancel(self, req_id: str) -> None:
+        """Ask the gateway to stop a request we gave up on; its reply is ignored."""
+        frame = {"type": "req", "id": f"{req_id}-cancel", "method": "agent.cancel", "params": {"requestId": req_id}}
+        try:
+            await self._ws.send(json.dumps(frame))
+            logger.info("openclaw_gateway_cancel_sent", conn=self.index, request_id=req_id)
+        except Exception as exc:
+            logger.warning("openclaw_gateway_cancel_failed", conn=self.index, request_id=req_id, error=str(exc))
+
+    async def _read_loop(self, ws: Any) -> None:
+        try:
+            async for raw in ws:
+                try:
+                    frame = json.loads(raw)
+                except json.JSONDecodeError:
+                    logger.warning("openclaw_gateway_bad_frame", conn=self.index)
+                    continue
+
+                if frame.get("type") == "res":
+                    future = self._pending.get(frame.get("id"))
+                    if future is not None and not future.done():
+                        future.set_result(frame)
+                elif frame.get("type") == "event":
+                    payload = frame.get("payload") or {}
+                    listener = self._listeners.get(payload.get("requestId"))
+                    if listener is not None and payload.get("text"):
+                        try:
+                            listener(payload["text"])
+                        except Exception as exc:
+                            logger.warning("openclaw_stream_callback_failed", error=str(exc))
+        except Exception as exc:
+            logger.warning("openclaw_gateway_disconnected", conn=self.index, error=str(exc))
+        finally:
+            self._fail_pending(GatewayError("Connection to OpenClaw gateway lost"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _close(self) -> None:
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+
+
+class _GatewayPool:
+    """Fixed-size set of connections; each request goes to the least busy one."""
+
+    def __init__(self, url: str, token: str, size: int):
+        self.connections = [_GatewayConnection(url, token, i) for i in range(max(1, size))]
+
+    async def request(
+        self,
+        method: str,
+        params: dict[str, Any],
+        timeout: float,
+        on_event: OutputCallback | None = None,
+    ) -> dict[str, Any]:
+        conn = min(self.connections, key=lambda c: c.active)
+        conn.active += 1
+        try:
+            await conn.ensure_connected()
+            return await conn.request(method, params, timeout=timeout, on_event=on_event)
+        finally:
+            conn.active -= 1
+
+
+class APIAdapter(OpenClawAdapter):
+    """Invoke OpenClaw agents through the Gateway's WebSocket API."""
+
+    def __init__(self, gateway_url: str = "", token: str = "", pool_size: int = 0):
+        self.gateway_url = gateway_url or settings.openclaw_gateway_url
+        self.token = token or settings.openclaw_gateway_token
+        self.pool_size = pool_size or settings.openclaw_gateway_pool_size
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pool: _GatewayPool | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the private event loop thread (again, after a fork)."""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="openclaw-gateway",
+                    daemon=True,
+                ).start()
+                self._loop = loop
+                self._pid = os.getpid()
+                self._pool = _GatewayPool(self.gateway_url, self.token, self.pool_size)
+            return self._loop
+
+    def _submit(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    async def _run(self, invocation: AgentInvocation, on_output: OutputCallback | None) -> AgentResult:
+        params: dict[str, Any] = {
+            "message": build_message(invocation),
+            "sessionId": invocation.session_id,
+            "timeoutSeconds": invocation.timeout_seconds,
+            "tools": {
+                "profile": invocation.tool_profile,
+                "allow": invocation.tool_allow,
+                "deny": invocation.tool_deny,
+            },
+            "stream": on_output is not None,
+        }
+        if invocation.model:
+            params["model"] = invocation.model
+        if invocation.workspace_dir:
+            params["workspaceDir"] = invocation.workspace_dir
+
+        logger.info(
+            "openclaw_gateway_invoke",
+            role=invocation.role,
+            session_id=invocation.session_id,
+            timeout=invocation.timeout_seconds,
         )
 
+        try:
+            payload = await self._pool.request(
+                "agent",
+                params,
+                timeout=invocation.timeout_seconds + 30,
+                on_event=on_output,
+            )
+        except asyncio.TimeoutError:
+            logger.error("openclaw_gateway_timeout", session_id=invocation.session_id)
+            return AgentResult(
+                output="",
+                exit_code=-1,
+                success=False,
+                error="OpenClaw gateway request timed out",
+                session_id=invocation.session_id,
+            )
+        except GatewayError as exc:
+            logger.error("openclaw_gateway_error", session_id=invocation.session_id, error=str(exc))
+            return AgentResult(
+                output="",
+                exit_code=-1,
+                success=False,
+                error=str(exc),
+                session_id=invocation.session_id,
+            )
+
+        tool_logs: list[dict[str, Any]] = []
+        if payload.get("meta"):
+            tool_logs.append({"type": "openclaw_meta", **payload["meta"]})
+
+        output = extract_text(payload)
+        logger.info(
+            "openclaw_gateway_success",
+            session_id=invocation.session_id,
+            output_len=len(output),
+            tool_log_count=len(tool_logs),
+        )
+        return AgentResult(
+            output=output,
+            exit_code=0,
+            tool_logs=tool_logs,
+            session_id=invocation.session_id,
+            success=True,
+        )
+
+    def invoke(self, invocation: AgentInvocation) -> AgentResult:
+        return self._submit(self._run(invocation, None)).result()
+
+    def invoke_stream(self, invocation: AgentInvocation, on_output: OutputCallback) -> AgentResult:
+        return self._submit(self._run(invocation, on_output)).result()
+
+    async def ainvoke(
+        self,
+        invocation: AgentInvocation,
+        on_output: OutputCallback | None = None,
+    ) -> AgentResult:
+        return await asyncio.wrap_future(self._submit(self._run(invocation, on_output)))
+
     def health_check(self) -> bool:
-        raise NotImplementedError("APIAdapter.health_check is not implemented.")
+        async def _health() -> bool:
+            try:
+                await self._pool.request("health", {}, timeout=15)
+                return True
+            except Exception:
+                return False
+
+        return self._submit(_health()).result()
@@ -0,0 +1,173 @@
+"""Asyncio OpenClaw CLI adapter.
+
+Same command line, output parsing and bounded capture as ``CLIAdapter``,
+but the subprocess is driven with ``asyncio.create_subprocess_exec`` so one
+event loop can run many agent turns at once.  ``OPENCLAW_MAX_CONCURRENCY``
+caps how many OpenClaw processes run at the same time: a per-loop semaphore
+bounds ``ainvoke`` callers on one loop, and a process-wide thread semaphore
+bounds synchronous ``invoke``/``invoke_stream`` callers, each of which runs
+its own loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import threading
+import weakref
+from collections.abc import Callable
+
+import structlog
+
+from app.config import settings
+from app.openclaw.base import AgentInvocation, AgentResult, OutputCallback
+from app.openclaw.capture import READ_CHUNK_BYTES, OutputCollector
+from app.openclaw.cli_adapter import CLIAdapter, MessageInput
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncCLIAdapter(CLIAdapter):
+    """Invoke OpenClaw via its CLI binary without blocking the event loop."""
+
+    def __init__(
+        self,
+        bin_path: str = "",
+        gateway_url: str = "",
+        gateway_token: str = "",
+        profile: str = "",
+        max_concurrency: int = 0,
+    ):
+        super().__init__(
+            bin_path=bin_path,
+            gateway_url=gateway_url,
+            gateway_token=gateway_token,
+            profile=profile,
+        )
+        self.max_concurrency = max_concurrency or settings.openclaw_max_concurrency
+        # Shared by every thread calling ``invoke``; each call gets a fresh loop
+        self._sync_slots = threading.BoundedSemaphore(self.max_concurrency)
+        # asyncio primitives are bound to the loop they are first used on
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = sem
+        return sem
+
+    def invoke(self, invocation: AgentInvocation) -> AgentResult:
+        """Synchronous entry point; must not be called from a running loop."""
+        with self._sync_slots:
+            return asyncio.run(self.ainvoke(invocation))
+
+    def invoke_stream(self, invocation: AgentInvocation, on_output: OutputCallback) -> AgentResult:
+        """Streaming ``invoke``; must not be called from a running loop."""
+        with self._sync_slots:
+            return asyncio.run(self.ainvoke(invocation, on_output))
+
+    async def ainvoke(
+        self,
+        invocation: AgentInvocation,
+        on_output: OutputCallback | None = None,
+    ) -> AgentResult:
+        message = self._prepare_message(invocation)
+        try:
+            return await self._ainvoke(invocation, message, on_output)
+        finally:
+            message.cleanup()
+
+    async def _ainvoke(
+        self,
+        invocation: AgentInvocation,
+        message: MessageInput,
+        on_output: OutputCallback | None,
+    ) -> AgentResult:
+        cmd = self._build_cmd(invocation, message)
+        stdin = message.stdin.encode("utf-8") if message.stdin is not None else None
+
+        async with self._semaphore():
+            self._log_invoke(invocation, message)
+
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=invocation.workspace_dir or None,
+                )
+            except FileNotFoundError:
+                return self._not_found_result(invocation)
+            except OSError as exc:
+                return self._spawn_failed_result(invocation, exc)
+
+            collector = OutputCollector(invocation.session_id, on_output)
+            try:
+                await asyncio.wait_for(
+                    self._acollect(proc, stdin, collector),
+                    timeout=invocation.timeout_seconds + 30,
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return self._timeout_result(invocation)
+            except asyncio.CancelledError:
+                proc.kill()
+                await proc.wait()
+                raise
+            finally:
+                collector.finish()
+
+        return self._build_result(
+            invocation,
+            proc.returncode if proc.returncode is not None else -1,
+            collector,
+        )
+
+    async def _acollect(
+        self,
+        proc: asyncio.subprocess.Process,
+        stdin: bytes | None,
+        collector: OutputCollector,
+    ) -> None:
+        """Feed stdin and drain both pipes in bounded chunks until exit."""
+        tasks = [
+            self._apump(proc.stdout, collector.feed_stdout),
+            self._apump(proc.stderr, collector.feed_stderr),
+        ]
+        if stdin is not None:
+            tasks.append(self._awrite_stdin(proc.stdin, stdin))
+        await asyncio.gather(*tasks)
+        await proc.wait()
+
+    @staticmethod
+    async def _apump(stream: asyncio.StreamReader, feed: Callable[[str], None]) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while chunk := await stream.read(READ_CHUNK_BYTES):
+            feed(decoder.decode(chunk))
+        feed(decoder.decode(b"", final=True))
+
+    @staticmethod
+    async def _awrite_stdin(pipe: asyncio.StreamWriter, data: bytes) -> None:
+        try:
+            pipe.write(data)
+            await pipe.drain()
+            pipe.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    async def ahealth_check(self) -> bool:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._base_cmd(), "health", "--json",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            return await asyncio.wait_for(proc.wait(), timeout=15) == 0
+        except Exception:
+            return False
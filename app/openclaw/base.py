@@ -1,17 +1,22 @@
 """Abstract adapter interface for OpenClaw agent invocation.
 
-To swap between CLI and future Python API adapters, change the concrete
-class instantiated in ``client.py``.  Both adapters implement the same
-``invoke`` contract so the rest of the codebase is adapter-agnostic.
+The concrete class is chosen by ``_create_adapter()`` in ``client.py``
+(``OPENCLAW_ADAPTER``).  All adapters implement the same ``invoke``
+contract so the rest of the codebase is adapter-agnostic.
 """
 
 from __future__ import annotations
 
 import abc
+import asyncio
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+# Receives each new piece of agent output text while a turn is running
+OutputCallback = Callable[[str], None]
+
 
 @dataclass(frozen=True)
 class AgentInvocation:
@@ -28,6 +33,9 @@ class AgentInvocation:
     timeout_seconds: int = 120
     workspace_dir: str = ""
     extra_config: dict[str, Any] = field(default_factory=dict)
+    # ``session_id`` names an existing conversation and ``context`` only holds
+    # what is new since the agent's last turn
+    continued: bool = False
 
 
 @dataclass
@@ -35,13 +43,22 @@ class AgentResult:
     """Result from an OpenClaw agent turn."""
 
     output: str
-    raw_stdout: str = ""
     raw_stderr: str = ""
     exit_code: int = 0
     tool_logs: list[dict[str, Any]] = field(default_factory=list)
     session_id: str = ""
     success: bool = True
     error: str = ""
+    cached: bool = False
+    # Seconds spent waiting on the cluster-wide limiter vs. running the turn
+    queue_wait_seconds: float = 0.0
+    execution_seconds: float = 0.0
+    # Size of the assembled message sent to the agent (0 for cache hits)
+    prompt_bytes: int = 0
+    # Total stdout size, and the gzip file holding whatever exceeded
+    # OPENCLAW_STDOUT_MAX_BYTES (empty when it all fit in memory)
+    stdout_bytes: int = 0
+    stdout_spill_path: str = ""
 
 
 class OpenClawAdapter(abc.ABC):
@@ -52,6 +69,33 @@ class OpenClawAdapter(abc.ABC):
         """Run a single agent turn synchronously and return the result."""
         ...
 
+    async def ainvoke(
+        self,
+        invocation: AgentInvocation,
+        on_output: OutputCallback | None = None,
+    ) -> AgentResult:
+        """Run a single agent turn from an event loop.
+
+        With ``on_output`` the turn is streamed as by ``invoke_stream``.  The
+        default runs ``invoke``/``invoke_stream`` in a worker thread; adapters
+        with native async I/O override this.
+        """
+        if on_output is not None:
+            return await asyncio.to_thread(self.invoke_stream, invocation, on_output)
+        return await asyncio.to_thread(self.invoke, invocation)
+
+    def invoke_stream(self, invocation: AgentInvocation, on_output: OutputCallback) -> AgentResult:
+        """Run a turn, calling ``on_output`` with text as it is produced.
+
+        The default has nothing to stream and reports the whole output once
+        the turn has finished; adapters that can read output incrementally
+        override this.
+        """
+        result = self.invoke(invocation)
+        if result.output:
+            on_output(result.output)
+        return result
+
     @abc.abstractmethod
     def health_check(self) -> bool:
         """Return True if the OpenClaw runtime is reachable."""
@@ -0,0 +1,165 @@
+"""Content-addressed cache for agent turns.
+
+A cached result is keyed on a SHA-256 of the normalised ``AgentInvocation``:
+role, instruction, context, model, tool settings, workspace and extra
+config.  The per-call ``session_id`` and timeout are not part of the key.
+
+Only roles whose ``RoleConfig.cacheable`` is set are cached; roles with side
+effects (e.g. ``engineer``) and turns that continue an existing session
+always run.  Entries live in Redis with a TTL,
+and an index sorted by last use evicts the least recently used entries once
+``OPENCLAW_CACHE_MAX_ENTRIES`` is exceeded.  Hit and miss counters are kept
+in Redis so every worker contributes to the same totals.
+
+Cache failures are logged and treated as misses; they never fail a turn.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import Any
+
+import structlog
+
+from app.agents.roles import get_role_config
+from app.config import settings
+from app.openclaw.base import AgentInvocation, AgentResult
+from app.redis_client import get_redis
+
+logger = structlog.get_logger(__name__)
+
+_PREFIX = "openclaw:cache"
+_INDEX_KEY = f"{_PREFIX}:index"
+_STATS_KEY = f"{_PREFIX}:stats"
+
+
+def _normalize(text: str) -> str:
+    lines = text.replace("\r\n", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def cache_key(invocation: AgentInvocation) -> str:
+    """Stable hash of everything that determines an agent turn's output."""
+    material = {
+        "role": invocation.role,
+        "instruction": _normalize(invocation.instruction),
+        "context": _normalize(invocation.context),
+        "model": invocation.model,
+        "tool_profile": invocation.tool_profile,
+        "tool_allow": sorted(invocation.tool_allow),
+        "tool_deny": sorted(invocation.tool_deny),
+        "workspace_dir": invocation.workspace_dir,
+        "extra_config": invocation.extra_config,
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResponseCache:
+    """Redis-backed store of successful ``AgentResult`` values."""
+
+    def __init__(
+        self,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+        max_entry_bytes: int | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds or settings.openclaw_cache_ttl_seconds
+        self.max_entries = max_entries or settings.openclaw_cache_max_entries
+        self.max_entry_bytes = max_entry_bytes or settings.openclaw_cache_max_entry_bytes
+
+    def enabled_for(self, invocation: AgentInvocation) -> bool:
+        # A continued session's reply depends on history the key cannot see
+        return get_role_config(invocation.role).cacheable and not invocation.continued
+
+    def get(self, invocation: AgentInvocation) -> AgentResult | None:
+        key = cache_key(invocation)
+        data = None
+        try:
+            r = get_redis()
+            raw = r.get(f"{_PREFIX}:{key}")
+            pipe = r.pipeline(transaction=False)
+            if raw is not None:
+                try:
+                    data = json.loads(raw)
+                    output, tool_logs = data["output"], data.get("tool_logs", [])
+                except (ValueError, TypeError, KeyError, AttributeError) as exc:
+                    # A corrupt entry is dropped and counted as a miss
+                    logger.warning("openclaw_cache_entry_corrupt", key=key[:12], error=str(exc))
+                    pipe.delete(f"{_PREFIX}:{key}")
+                    data = None
+            if data is None:
+                pipe.zrem(_INDEX_KEY, key)
+                pipe.hincrby(_STATS_KEY, "misses", 1)
+                pipe.hincrby(_STATS_KEY, f"misses:{invocation.role}", 1)
+            else:
+                pipe.zadd(_INDEX_KEY, {key: time.time()})
+                pipe.hincrby(_STATS_KEY, "hits", 1)
+                pipe.hincrby(_STATS_KEY, f"hits:{invocation.role}", 1)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning("openclaw_cache_get_failed", error=str(exc))
+            return None
+
+        if data is None:
+            logger.info("openclaw_cache_miss", role=invocation.role, key=key[:12])
+            return None
+
+        logger.info("openclaw_cache_hit", role=invocation.role, key=key[:12])
+        return AgentResult(
+            output=output,
+            tool_logs=tool_logs,
+            session_id=invocation.session_id,
+            success=True,
+            cached=True,
+        )
+
+    def put(self, invocation: AgentInvocation, result: AgentResult) -> None:
+        if not result.success:
+            return
+        value = json.dumps({"output": result.output, "tool_logs": result.tool_logs})
+        if len(value) > self.max_entry_bytes:
+            return
+
+        key = cache_key(invocation)
+        try:
+            r = get_redis()
+            pipe = r.pipeline(transaction=False)
+            pipe.set(f"{_PREFIX}:{key}", value, ex=self.ttl_seconds)
+            pipe.zadd(_INDEX_KEY, {key: time.time()})
+            pipe.zremrangebyscore(_INDEX_KEY, "-inf", time.time() - self.ttl_seconds)
+            pipe.zcard(_INDEX_KEY)
+            size = pipe.execute()[-1]
+
+            if size > self.max_entries:
+                evicted = [k.decode() for k, _ in r.zpopmin(_INDEX_KEY, size - self.max_entries)]
+                if evicted:
+                    r.delete(*(f"{_PREFIX}:{k}" for k in evicted))
+                    r.hincrby(_STATS_KEY, "evictions", len(evicted))
+        except Exception as exc:
+            logger.warning("openclaw_cache_put_failed", error=str(exc))
+
+
+def cache_stats() -> dict[str, Any]:
+    """Cluster-wide hit/miss counters, overall and per role."""
+    r = get_redis()
+    raw = {k.decode(): int(v) for k, v in r.hgetall(_STATS_KEY).items()}
+    roles: dict[str, dict[str, int]] = {}
+    for field, count in raw.items():
+        kind, _, role = field.partition(":")
+        if role:
+            roles.setdefault(role, {"hits": 0, "misses": 0})[kind] = count
+
+    hits, misses = raw.get("hits", 0), raw.get("misses", 0)
+    return {
+        "enabled": settings.openclaw_cache_enabled,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        "evictions": raw.get("evictions", 0),
+        "entries": r.zcard(_INDEX_KEY),
+        "max_entries": settings.openclaw_cache_max_entries,
+        "roles": roles,
+    }
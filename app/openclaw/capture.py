@@ -0,0 +1,234 @@
+"""Bounded capture of agent process output.
+
+A runaway agent can print far more than a worker can hold.  ``BoundedCapture``
+keeps the first ``cap`` bytes of a stream in memory and writes everything
+after that to a gzip file under ``OPENCLAW_SPILL_DIR``, which the result
+references instead of carrying the text.  A spill file stops growing after
+``OPENCLAW_SPILL_MAX_BYTES`` of output, and every process deletes spill
+files older than ``OPENCLAW_SPILL_RETENTION_SECONDS`` (at most every
+``_PRUNE_INTERVAL`` seconds, when it opens a new one), so runaway agents
+cannot fill the disk either.
+
+``OutputCollector`` pairs a capture for stdout and one for stderr with a
+``StreamParser``, so the assistant text is extracted incrementally as chunks
+arrive (and optionally reported through ``on_output``) rather than by
+re-parsing the full stdout at the end.  Only one copy of stdout is held at a
+time: the raw head while it fits under the cap (it is parsed whole at the
+end), then, once stdout spills, the parsed text alone.  The raw head is only
+kept past that point as a fallback while no text has been parsed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+import structlog
+
+from app.config import settings
+from app.openclaw.base import OutputCallback
+from app.openclaw.stream_parser import StreamParser
+
+logger = structlog.get_logger(__name__)
+
+# Bytes per pipe read; output is never read a whole line at a time
+READ_CHUNK_BYTES = 64 * 1024
+
+_PRUNE_INTERVAL = 600.0
+_prune_lock = threading.Lock()
+_last_prune = 0.0
+
+
+def spill_dir() -> str:
+    path = settings.openclaw_spill_dir or os.path.join(tempfile.gettempdir(), "openclaw-spill")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def prune_spills(max_age_seconds: float | None = None) -> int:
+    """Delete spill files older than ``max_age_seconds``; returns how many.
+
+    Defaults to ``OPENCLAW_SPILL_RETENTION_SECONDS``; ``0`` keeps everything.
+    """
+    max_age = settings.openclaw_spill_retention_seconds if max_age_seconds is None else max_age_seconds
+    if max_age <= 0:
+        return 0
+    cutoff = time.time() - max_age
+    removed = 0
+    with os.scandir(spill_dir()) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".gz"):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+    if removed:
+        logger.info("openclaw_spills_pruned", removed=removed, max_age_seconds=max_age)
+    return removed
+
+
+def _maybe_prune() -> None:
+    global _last_prune
+    with _prune_lock:
+        if _last_prune and time.monotonic() - _last_prune < _PRUNE_INTERVAL:
+            return
+        _last_prune = time.monotonic()
+    try:
+        prune_spills()
+    except OSError as exc:
+        logger.warning("openclaw_spill_prune_failed", error=str(exc))
+
+
+class BoundedCapture:
+    """In-memory head of a stream plus a gzip spill file for the rest."""
+
+    def __init__(self, cap_bytes: int, name: str):
+        self.cap_bytes = cap_bytes
+        self.name = name
+        self.total_bytes = 0
+        self.spill_path = ""
+        self.spill_bytes = 0
+        self.dropped_bytes = 0
+        self._parts: list[str] = []
+        self._size = 0
+        self._spill: Any = None
+        self._released = False
+
+    @property
+    def truncated(self) -> bool:
+        return bool(self.spill_path)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def would_spill(self, text: str) -> bool:
+        """Whether writing ``text`` overflows the in-memory head."""
+        return self._spill is None and self._size + len(text.encode("utf-8")) > self.cap_bytes
+
+    def release_head(self) -> None:
+        """Drop the in-memory head; later writes keep going to the spill file."""
+        if self._released:
+            return
+        self._parts = []
+        self._size = self.cap_bytes
+        self._released = True
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        data = text.encode("utf-8")
+        self.total_bytes += len(data)
+
+        if self._spill is None:
+            room = self.cap_bytes - self._size
+            if len(data) <= room:
+                self._parts.append(text)
+                self._size += len(data)
+                return
+            if room > 0:
+                self._parts.append(data[:room].decode("utf-8", errors="ignore"))
+                self._size = self.cap_bytes
+            data = data[room:]
+            self._open_spill()
+        room = settings.openclaw_spill_max_bytes - self.spill_bytes
+        if len(data) > room:
+            if not self.dropped_bytes:
+                logger.warning("openclaw_spill_full", stream=self.name, path=self.spill_path)
+            self.dropped_bytes += len(data) - max(room, 0)
+            data = data[:max(room, 0)]
+        if data:
+            self._spill.write(data)
+            self.spill_bytes += len(data)
+
+    def _open_spill(self) -> None:
+        _maybe_prune()
+        fd, self.spill_path = tempfile.mkstemp(prefix=f"{self.name}-", suffix=".gz", dir=spill_dir())
+        self._spill = gzip.open(os.fdopen(fd, "wb"), "wb", compresslevel=6)
+        logger.warning("openclaw_output_spilled", stream=self.name, cap_bytes=self.cap_bytes, path=self.spill_path)
+
+    def close(self) -> None:
+        if self._spill is not None:
+            fileobj = self._spill.fileobj
+            self._spill.close()
+            fileobj.close()
+            self._spill = None
+
+    def log_entry(self) -> dict[str, Any]:
+        """Tool-log record pointing at the spilled remainder."""
+        return {
+            "type": "openclaw_spill",
+            "stream": self.name.rsplit("-", 1)[-1],
+            "path": self.spill_path,
+            "bytes_total": self.total_bytes,
+            "bytes_in_memory": 0 if self._released else self._size,
+            "bytes_dropped": self.dropped_bytes,
+        }
+
+
+class OutputCollector:
+    """Bounded stdout/stderr capture with incremental text extraction."""
+
+    def __init__(self, label: str, on_output: OutputCallback | None = None):
+        stdout_cap = settings.openclaw_stdout_max_bytes
+        self.stdout = BoundedCapture(stdout_cap, f"{label}-stdout")
+        self.stderr = BoundedCapture(settings.openclaw_stderr_max_bytes, f"{label}-stderr")
+        self.on_output = on_output
+        self._parser = StreamParser(max_line_chars=stdout_cap)
+        # Parsed text is only kept once stdout has outgrown its raw head
+        self._keep_text = False
+        self._text: list[str] = []
+        self._text_size = 0
+        self._text_cap = stdout_cap
+
+    @property
+    def parsed_text(self) -> str:
+        return "\n".join(self._text)
+
+    def feed_stdout(self, chunk: str) -> None:
+        if not self._keep_text and self.stdout.would_spill(chunk):
+            # Switch to keeping parsed text: recover what the head held so
+            # far (the lines completed before this chunk) by parsing it again
+            self._keep_text = True
+            head = StreamParser(max_line_chars=self._text_cap).feed(self.stdout.text)
+            if head:
+                self._text.append(head)
+                self._text_size = len(head)
+        self.stdout.write(chunk)
+        self._add_text(self._parser.feed(chunk))
+        if self._text:
+            # The raw head is only a fallback for output that never parses
+            self.stdout.release_head()
+
+    def feed_stderr(self, chunk: str) -> None:
+        self.stderr.write(chunk)
+
+    def finish(self) -> None:
+        self._add_text(self._parser.close())
+        if self._text:
+            self.stdout.release_head()
+        self.stdout.close()
+        self.stderr.close()
+
+    def spill_logs(self) -> list[dict[str, Any]]:
+        return [c.log_entry() for c in (self.stdout, self.stderr) if c.truncated]
+
+    def _add_text(self, delta: str) -> None:
+        if not delta:
+            return
+        if self._keep_text and self._text_size < self._text_cap:
+            self._text.append(delta)
+            self._text_size += len(delta)
+        if self.on_output is not None:
+            try:
+                self.on_output(delta)
+            except Exception as exc:
+                # A broken progress consumer must never fail the agent turn
+                logger.warning("openclaw_stream_callback_failed", error=str(exc))
@@ -4,21 +4,91 @@ Invokes ``openclaw agent --message <prompt> --json`` as a subprocess,
 parses the JSON output, and returns a structured ``AgentResult``.
 
 This is the production adapter when OpenClaw is installed on the host
-or accessible inside the Docker container.
+or accessible inside the Docker container.  ``invoke_stream`` additionally
+reports text deltas while the agent is working.
+
+stdout is read in chunks and parsed incrementally.  Only the first
+``OPENCLAW_STDOUT_MAX_BYTES`` are kept in memory; the rest is spilled to a
+gzip file (see ``capture.py``) referenced from ``AgentResult.stdout_spill_path``.
+
+Messages larger than ``OPENCLAW_MESSAGE_ARGV_MAX_BYTES`` are not put on the
+command line (where they show up in the process table and hit the kernel's
+per-argument limit).  Depending on ``OPENCLAW_LARGE_MESSAGE_MODE`` they are
+piped through stdin or written to a private temp file on a memory-backed
+filesystem, and passed with ``OPENCLAW_MESSAGE_FILE_FLAG`` (``-`` for stdin).
 """
 
 from __future__ import annotations
 
+import codecs
 import json
+import os
 import subprocess
+import tempfile
+import threading
 import structlog
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from app.config import settings
-from app.openclaw.base import AgentInvocation, AgentResult, OpenClawAdapter
+from app.openclaw.base import (
+    AgentInvocation,
+    AgentResult,
+    OpenClawAdapter,
+    OutputCallback,
+)
+from app.openclaw.capture import READ_CHUNK_BYTES, OutputCollector
+from app.openclaw.prompt import build_message
 
 logger = structlog.get_logger(__name__)
 
+# tmpfs on Linux; elsewhere the platform's temp dir
+_SHM_DIR = "/dev/shm"
+
+
+@dataclass
+class MessageInput:
+    """How a message reaches the CLI: argv, stdin or a temp file."""
+
+    args: list[str]
+    stdin: str | None = None
+    path: str | None = None
+
+    @property
+    def mode(self) -> str:
+        if self.stdin is not None:
+            return "stdin"
+        return "file" if self.path else "argv"
+
+    def cleanup(self) -> None:
+        if self.path:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def prepare_message(message: str, mode: str = "", max_argv_bytes: int | None = None) -> MessageInput:
+    """Pick the transport for ``message`` and return the CLI arguments for it."""
+    mode = mode or settings.openclaw_large_message_mode
+    limit = settings.openclaw_message_argv_max_bytes if max_argv_bytes is None else max_argv_bytes
+    if mode == "argv" or len(message.encode("utf-8")) <= limit:
+        return MessageInput(args=["--message", message])
+
+    flag = settings.openclaw_message_file_flag
+    if mode == "stdin":
+        return MessageInput(args=[flag, "-"], stdin=message)
+
+    fd, path = tempfile.mkstemp(
+        prefix="openclaw-msg-",
+        suffix=".txt",
+        dir=_SHM_DIR if os.path.isdir(_SHM_DIR) else None,
+    )
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write(message)
+    return MessageInput(args=[flag, path], path=path)
+
 
 class CLIAdapter(OpenClawAdapter):
     """Invoke OpenClaw via its CLI binary."""
@@ -42,26 +112,15 @@ class CLIAdapter(OpenClawAdapter):
         return cmd
 
     def _build_message(self, invocation: AgentInvocation) -> str:
-        """Build the full prompt sent to the agent, combining role instruction and context."""
-        parts: list[str] = []
-        parts.append(f"[Role: {invocation.role}]")
-        if invocation.tool_allow:
-            parts.append(f"[Allowed Tools: {', '.join(invocation.tool_allow)}]")
-        if invocation.tool_deny:
-            parts.append(f"[Denied Tools: {', '.join(invocation.tool_deny)}]")
-        if invocation.workspace_dir:
-            parts.append(f"[Working Directory: {invocation.workspace_dir}]")
-        if invocation.context:
-            parts.append(f"[Context]\n{invocation.context}")
-        parts.append(f"[Instruction]\n{invocation.instruction}")
-        return "\n\n".join(parts)
+        return build_message(invocation)
 
-    def invoke(self, invocation: AgentInvocation) -> AgentResult:
-        message = self._build_message(invocation)
+    def _prepare_message(self, invocation: AgentInvocation) -> MessageInput:
+        return prepare_message(self._build_message(invocation))
 
+    def _build_cmd(self, invocation: AgentInvocation, message: MessageInput) -> list[str]:
         cmd = self._base_cmd() + [
             "agent",
-            "--message", message,
+            *message.args,
             "--json",
             "--local",
             "--session-id", invocation.session_id,
@@ -70,86 +129,213 @@ class CLIAdapter(OpenClawAdapter):
         if invocation.timeout_seconds:
             cmd += ["--timeout", str(invocation.timeout_seconds)]
 
+        return cmd
+
+    def _log_invoke(self, invocation: AgentInvocation, message: MessageInput) -> None:
         logger.info(
             "openclaw_cli_invoke",
             role=invocation.role,
             session_id=invocation.session_id,
             timeout=invocation.timeout_seconds,
+            message_mode=message.mode,
         )
-
-        cwd = invocation.workspace_dir or None
-
         logger.info(
             "openclaw_cli_cwd",
-            cwd=cwd,
+            cwd=invocation.workspace_dir or None,
             tool_allow=invocation.tool_allow,
             tool_deny=invocation.tool_deny,
         )
 
-        try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=invocation.timeout_seconds + 30,
-                cwd=cwd,
-            )
-        except subprocess.TimeoutExpired:
-            logger.error("openclaw_cli_timeout", session_id=invocation.session_id)
-            return AgentResult(
-                output="",
-                exit_code=-1,
-                success=False,
-                error="OpenClaw CLI timed out",
-                session_id=invocation.session_id,
-            )
-        except FileNotFoundError:
-            logger.error("openclaw_cli_not_found", bin=self.bin)
-            return AgentResult(
-                output="",
-                exit_code=-1,
-                success=False,
-                error=f"OpenClaw binary not found at '{self.bin}'",
-                session_id=invocation.session_id,
-            )
+    def _timeout_result(self, invocation: AgentInvocation) -> AgentResult:
+        logger.error("openclaw_cli_timeout", session_id=invocation.session_id)
+        return AgentResult(
+            output="",
+            exit_code=-1,
+            success=False,
+            error="OpenClaw CLI timed out",
+            session_id=invocation.session_id,
+        )
 
-        stdout = proc.stdout.strip()
-        stderr = proc.stderr.strip()
+    def _not_found_result(self, invocation: AgentInvocation) -> AgentResult:
+        logger.error("openclaw_cli_not_found", bin=self.bin)
+        return AgentResult(
+            output="",
+            exit_code=-1,
+            success=False,
+            error=f"OpenClaw binary not found at '{self.bin}'",
+            session_id=invocation.session_id,
+        )
 
-        if proc.returncode != 0:
+    def _spawn_failed_result(self, invocation: AgentInvocation, exc: OSError) -> AgentResult:
+        # e.g. E2BIG when OPENCLAW_LARGE_MESSAGE_MODE=argv and the prompt is huge
+        logger.error("openclaw_cli_spawn_failed", error=str(exc))
+        return AgentResult(
+            output="",
+            exit_code=-1,
+            success=False,
+            error=f"Could not start OpenClaw: {exc}",
+            session_id=invocation.session_id,
+        )
+
+    def _build_result(
+        self,
+        invocation: AgentInvocation,
+        returncode: int,
+        collector: OutputCollector,
+    ) -> AgentResult:
+        """Turn a finished CLI process into an ``AgentResult``."""
+        stdout = collector.stdout.text.strip()
+        stderr = collector.stderr.text.strip()
+        spill_logs = collector.spill_logs()
+
+        if returncode != 0:
             logger.error(
                 "openclaw_cli_error",
-                exit_code=proc.returncode,
+                exit_code=returncode,
                 stderr=stderr[:500],
             )
             return AgentResult(
-                output=stdout,
-                raw_stdout=stdout,
+                output=stdout or collector.parsed_text,
                 raw_stderr=stderr,
-                exit_code=proc.returncode,
+                exit_code=returncode,
                 success=False,
-                error=stderr or f"Process exited with code {proc.returncode}",
+                error=stderr or f"Process exited with code {returncode}",
+                tool_logs=spill_logs,
                 session_id=invocation.session_id,
+                stdout_bytes=collector.stdout.total_bytes,
+                stdout_spill_path=collector.stdout.spill_path,
             )
 
-        output_text, tool_logs = self._parse_output(stdout)
+        if collector.stdout.truncated:
+            # The in-memory head is not valid JSON on its own; use the text the
+            # stream parser pulled out of every line as it went by
+            output_text = collector.parsed_text or stdout
+            output_text += (
+                f"\n\n[output truncated: {collector.stdout.total_bytes} bytes of stdout, "
+                f"remainder in {collector.stdout.spill_path}]"
+            )
+            tool_logs: list[dict[str, Any]] = []
+        else:
+            output_text, tool_logs = self._parse_output(stdout)
+        tool_logs += spill_logs
 
         logger.info(
             "openclaw_cli_success",
             session_id=invocation.session_id,
             output_len=len(output_text),
             tool_log_count=len(tool_logs),
+            stdout_bytes=collector.stdout.total_bytes,
+            spilled=collector.stdout.truncated,
         )
 
         return AgentResult(
             output=output_text,
-            raw_stdout=stdout,
             raw_stderr=stderr,
             exit_code=0,
             tool_logs=tool_logs,
             session_id=invocation.session_id,
             success=True,
+            stdout_bytes=collector.stdout.total_bytes,
+            stdout_spill_path=collector.stdout.spill_path,
+        )
+
+    def invoke(self, invocation: AgentInvocation) -> AgentResult:
+        message = self._prepare_message(invocation)
+        try:
+            return self._run(invocation, message, None)
+        finally:
+            message.cleanup()
+
+    def invoke_stream(self, invocation: AgentInvocation, on_output: OutputCallback) -> AgentResult:
+        message = self._prepare_message(invocation)
+        try:
+            return self._run(invocation, message, on_output)
+        finally:
+            message.cleanup()
+
+    def _run(
+        self,
+        invocation: AgentInvocation,
+        message: MessageInput,
+        on_output: OutputCallback | None,
+    ) -> AgentResult:
+        cmd = self._build_cmd(invocation, message)
+        self._log_invoke(invocation, message)
+
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE if message.stdin is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=invocation.workspace_dir or None,
+            )
+        except FileNotFoundError:
+            return self._not_found_result(invocation)
+        except OSError as exc:
+            return self._spawn_failed_result(invocation, exc)
+
+        if message.stdin is not None:
+            # Feed stdin from a thread: the process may start writing output
+            # before it has read the whole message
+            threading.Thread(
+                target=self._write_stdin,
+                args=(proc.stdin, message.stdin.encode("utf-8")),
+                daemon=True,
+            ).start()
+
+        collector = OutputCollector(invocation.session_id, on_output)
+
+        # Drain stderr on its own thread so a chatty process cannot block on it
+        stderr_reader = threading.Thread(
+            target=self._pump,
+            args=(proc.stderr, collector.feed_stderr),
+            daemon=True,
         )
+        stderr_reader.start()
+
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(invocation.timeout_seconds + 30, _kill)
+        timer.start()
+
+        try:
+            self._pump(proc.stdout, collector.feed_stdout)
+            proc.wait()
+        finally:
+            timer.cancel()
+            stderr_reader.join(timeout=5)
+            collector.finish()
+
+        if timed_out.is_set():
+            return self._timeout_result(invocation)
+
+        return self._build_result(invocation, proc.returncode, collector)
+
+    @staticmethod
+    def _pump(pipe: Any, feed: Callable[[str], None]) -> None:
+        """Read ``pipe`` in fixed-size chunks until EOF, decoding as UTF-8.
+
+        Chunked rather than line-by-line reads keep memory flat even when the
+        process writes one enormous line.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while chunk := pipe.read1(READ_CHUNK_BYTES):
+            feed(decoder.decode(chunk))
+        feed(decoder.decode(b"", final=True))
+        pipe.close()
+
+    @staticmethod
+    def _write_stdin(pipe: Any, data: bytes) -> None:
+        try:
+            pipe.write(data)
+            pipe.close()
+        except (BrokenPipeError, OSError):
+            pass
 
     def _parse_output(self, stdout: str) -> tuple[str, list[dict[str, Any]]]:
         """Parse JSON output from ``openclaw agent --json``.
@@ -7,32 +7,56 @@ Usage from anywhere in the codebase::
     client = get_openclaw_client()
     result = client.run_agent(role="pm", instruction="...", context="...")
 
-To swap between CLI and API adapters, edit ``_create_adapter()`` below.
+    # or, from an event loop
+    result = await client.arun_agent(role="pm", instruction="...")
+
+The adapter is chosen by ``OPENCLAW_ADAPTER`` in ``_create_adapter()`` below.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
 from typing import Any
 
 import structlog
 
 from app.config import settings
-from app.openclaw.base import AgentInvocation, AgentResult, OpenClawAdapter
+from app.openclaw.base import AgentInvocation, AgentResult, OpenClawAdapter, OutputCallback
+from app.openclaw.cache import ResponseCache
 from app.openclaw.cli_adapter import CLIAdapter
+from app.openclaw.limiter import AgentLimiter
+from app.openclaw.prompt import prompt_bytes
 
 logger = structlog.get_logger(__name__)
 
 
 def _create_adapter() -> OpenClawAdapter:
-    """Instantiate the concrete adapter.
-
-    SWAP POINT: To use the future Python API adapter, change this to::
+    """Instantiate the concrete adapter selected by ``settings.openclaw_adapter``.
 
-        from app.openclaw.api_adapter import APIAdapter
-        return APIAdapter(gateway_url=settings.openclaw_gateway_url,
-                          token=settings.openclaw_gateway_token)
+    ``cli`` (default) blocks on a subprocess per turn; ``async_cli`` drives
+    the same CLI from asyncio with bounded concurrency; ``api`` talks to the
+    OpenClaw Gateway over pooled WebSocket connections.
     """
+    if settings.openclaw_adapter == "api":
+        from app.openclaw.api_adapter import APIAdapter
+
+        return APIAdapter(
+            gateway_url=settings.openclaw_gateway_url,
+            token=settings.openclaw_gateway_token,
+            pool_size=settings.openclaw_gateway_pool_size,
+        )
+    if settings.openclaw_adapter == "async_cli":
+        from app.openclaw.async_cli_adapter import AsyncCLIAdapter
+
+        return AsyncCLIAdapter(
+            bin_path=settings.openclaw_bin,
+            gateway_url=settings.openclaw_gateway_url,
+            gateway_token=settings.openclaw_gateway_token,
+            profile=settings.openclaw_profile,
+            max_concurrency=settings.openclaw_max_concurrency,
+        )
     return CLIAdapter(
         bin_path=settings.openclaw_bin,
         gateway_url=settings.openclaw_gateway_url,
@@ -44,10 +68,21 @@ def _create_adapter() -> OpenClawAdapter:
 class OpenClawClient:
     """High-level wrapper around the OpenClaw adapter."""
 
-    def __init__(self, adapter: OpenClawAdapter | None = None):
+    def __init__(
+        self,
+        adapter: OpenClawAdapter | None = None,
+        cache: ResponseCache | None = None,
+        limiter: AgentLimiter | None = None,
+    ):
         self.adapter = adapter or _create_adapter()
-
-    def run_agent(
+        if cache is None and settings.openclaw_cache_enabled:
+            cache = ResponseCache()
+        self.cache = cache
+        if limiter is None:
+            limiter = AgentLimiter()
+        self.limiter = limiter if limiter.active else None
+
+    def _build_invocation(
         self,
         *,
         role: str,
@@ -61,8 +96,9 @@ class OpenClawClient:
         timeout_seconds: int | None = None,
         workspace_dir: str = "",
         extra_config: dict[str, Any] | None = None,
-    ) -> AgentResult:
-        invocation = AgentInvocation(
+        continued: bool = False,
+    ) -> AgentInvocation:
+        return AgentInvocation(
             role=role,
             instruction=instruction,
             context=context,
@@ -74,12 +110,80 @@ class OpenClawClient:
             timeout_seconds=timeout_seconds or settings.openclaw_timeout_seconds,
             workspace_dir=workspace_dir,
             extra_config=extra_config or {},
+            continued=continued,
         )
-        logger.info("openclaw_run_agent", role=role, session_id=invocation.session_id)
-        result = self.adapter.invoke(invocation)
+
+    def run_agent(self, *, on_output: OutputCallback | None = None, **kwargs: Any) -> AgentResult:
+        """Run one agent turn; see ``_build_invocation`` for the arguments.
+
+        When ``on_output`` is given (and ``OPENCLAW_STREAM_OUTPUT`` is on) the
+        adapter streams the turn and calls it with each new piece of text.
+        Turns of cacheable roles are served from the response cache when an
+        identical invocation has succeeded before.  Other turns wait for a
+        slot from the cluster-wide limiter first; the wait is reported in
+        ``AgentResult.queue_wait_seconds``.
+        """
+        invocation = self._build_invocation(**kwargs)
+        logger.info("openclaw_run_agent", role=invocation.role, session_id=invocation.session_id)
+
+        use_cache = self.cache is not None and self.cache.enabled_for(invocation)
+        if use_cache:
+            cached = self.cache.get(invocation)
+            if cached is not None:
+                if on_output is not None:
+                    on_output(cached.output)
+                return cached
+
+        lease = self.limiter.acquire(invocation) if self.limiter else None
+        started = time.monotonic()
+        try:
+            if on_output is not None and settings.openclaw_stream_output:
+                result = self.adapter.invoke_stream(invocation, on_output)
+            else:
+                result = self.adapter.invoke(invocation)
+        finally:
+            if lease is not None:
+                self.limiter.release(lease)
+        result.execution_seconds = round(time.monotonic() - started, 3)
+        result.queue_wait_seconds = round(lease.waited, 3) if lease else 0.0
+        result.prompt_bytes = prompt_bytes(invocation)
+
+        if not result.success:
+            logger.error("openclaw_agent_failed", role=invocation.role, error=result.error)
+        elif use_cache:
+            self.cache.put(invocation, result)
+
+        return result
+
+    async def arun_agent(self, *, on_output: OutputCallback | None = None, **kwargs: Any) -> AgentResult:
+        """Async variant of ``run_agent`` for callers running an event loop."""
+        invocation = self._build_invocation(**kwargs)
+        logger.info("openclaw_run_agent", role=invocation.role, session_id=invocation.session_id)
+
+        use_cache = self.cache is not None and self.cache.enabled_for(invocation)
+        if use_cache:
+            cached = await asyncio.to_thread(self.cache.get, invocation)
+            if cached is not None:
+                if on_output is not None:
+                    on_output(cached.output)
+                return cached
+
+        lease = await self.limiter.aacquire(invocation) if self.limiter else None
+        started = time.monotonic()
+        try:
+            stream = on_output if settings.openclaw_stream_output else None
+            result = await self.adapter.ainvoke(invocation, stream)
+        finally:
+            if lease is not None:
+                await asyncio.to_thread(self.limiter.release, lease)
+        result.execution_seconds = round(time.monotonic() - started, 3)
+        result.queue_wait_seconds = round(lease.waited, 3) if lease else 0.0
+        result.prompt_bytes = prompt_bytes(invocation)
 
         if not result.success:
-            logger.error("openclaw_agent_failed", role=role, error=result.error)
+            logger.error("openclaw_agent_failed", role=invocation.role, error=result.error)
+        elif use_cache:
+            await asyncio.to_thread(self.cache.put, invocation, result)
 
         return result
 
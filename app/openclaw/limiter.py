@@ -0,0 +1,229 @@
+"""Cluster-wide admission control for agent turns.
+
+Every worker that calls ``OpenClawClient.run_agent`` goes through the same
+Redis-backed limits before the adapter is invoked:
+
+* a fair (FIFO) counting semaphore per role — ``OPENCLAW_ROLE_CONCURRENCY``
+* a fair counting semaphore per model — ``OPENCLAW_MODEL_CONCURRENCY``
+* a token bucket per model — ``OPENCLAW_MODEL_RATE_PER_MINUTE``
+
+Each setting is a JSON object, e.g. ``{"engineer": 2}``; the model ``""``
+is configured under ``"default"``.  Unlisted roles and models are not
+limited.
+
+Waiters keep their queue ticket while they poll, so slots are handed out in
+arrival order rather than to whoever polls first.  The token bucket may go
+negative: each caller reserves the next free slot and sleeps until it, which
+keeps rate-limited callers in arrival order too.  Leases expire on their own
+after the turn's timeout, so a crashed worker cannot leak a slot.
+
+Redis errors make the limiter fail open: the turn runs unthrottled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from app.config import settings
+from app.openclaw.base import AgentInvocation
+from app.redis_client import get_redis
+
+logger = structlog.get_logger(__name__)
+
+_PREFIX = "openclaw:limit"
+
+# KEYS: holders zset (member -> lease expiry), queue zset (member -> ticket), ticket counter
+# ARGV: member, limit, holder lease seconds, waiter heartbeat seconds
+# Returns 1 once the member holds a slot, 0 while it is still queued.
+_SEMAPHORE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+redis.call('ZINTERSTORE', KEYS[2], 2, KEYS[2], KEYS[1], 'WEIGHTS', 1, 0)
+if not redis.call('ZSCORE', KEYS[2], ARGV[1]) then
+  redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[3]), ARGV[1])
+end
+local rank = redis.call('ZRANK', KEYS[2], ARGV[1])
+if rank < tonumber(ARGV[2]) then
+  redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[1])
+  return 1
+end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[4]), ARGV[1])
+return 0
+"""
+
+# KEYS: bucket hash.  ARGV: capacity, refill rate per second
+# Takes one token (possibly going negative) and returns the seconds to wait.
+_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+local ts = tonumber(redis.call('HGET', KEYS[1], 'ts'))
+if tokens == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + (now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+if tokens >= 0 then
+  return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+
+@dataclass
+class Lease:
+    """Slots held for one agent turn."""
+
+    member: str
+    semaphores: list[str] = field(default_factory=list)
+    waited: float = 0.0
+
+
+class AgentLimiter:
+    """Redis-backed per-role and per-model concurrency and rate limits."""
+
+    def __init__(
+        self,
+        role_concurrency: dict[str, int] | None = None,
+        model_concurrency: dict[str, int] | None = None,
+        model_rate_per_minute: dict[str, float] | None = None,
+    ):
+        self.role_concurrency = (
+            settings.openclaw_role_concurrency if role_concurrency is None else role_concurrency
+        )
+        self.model_concurrency = (
+            settings.openclaw_model_concurrency if model_concurrency is None else model_concurrency
+        )
+        self.model_rate_per_minute = (
+            settings.openclaw_model_rate_per_minute if model_rate_per_minute is None
+            else model_rate_per_minute
+        )
+        self.poll_seconds = settings.openclaw_limiter_poll_seconds
+
+    @property
+    def active(self) -> bool:
+        return bool(self.role_concurrency or self.model_concurrency or self.model_rate_per_minute)
+
+    def _plan(self, invocation: AgentInvocation) -> tuple[list[tuple[str, int]], tuple[str, float] | None]:
+        """Semaphores to take (always role before model) and the rate bucket."""
+        model = invocation.model or "default"
+        semaphores: list[tuple[str, int]] = []
+        if invocation.role in self.role_concurrency:
+            semaphores.append((f"role:{invocation.role}", int(self.role_concurrency[invocation.role])))
+        if model in self.model_concurrency:
+            semaphores.append((f"model:{model}", int(self.model_concurrency[model])))
+        bucket = None
+        if model in self.model_rate_per_minute:
+            bucket = (f"bucket:model:{model}", float(self.model_rate_per_minute[model]))
+        return semaphores, bucket
+
+    def _try_semaphore(self, name: str, limit: int, member: str, lease_seconds: float) -> bool:
+        keys = [f"{_PREFIX}:{name}:holders", f"{_PREFIX}:{name}:queue", f"{_PREFIX}:{name}:ticket"]
+        waiter_ttl = max(self.poll_seconds * 20, 5)
+        acquired = get_redis().eval(_SEMAPHORE_LUA, 3, *keys, member, limit, lease_seconds, waiter_ttl)
+        return bool(acquired)
+
+    def _take_token(self, name: str, per_minute: float) -> float:
+        rate = per_minute / 60.0
+        capacity = max(1.0, per_minute / 60.0)
+        return float(get_redis().eval(_BUCKET_LUA, 1, f"{_PREFIX}:{name}", capacity, rate))
+
+    def _release_semaphore(self, name: str, member: str) -> None:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.zrem(f"{_PREFIX}:{name}:holders", member)
+        pipe.zrem(f"{_PREFIX}:{name}:queue", member)
+        pipe.execute()
+
+    def acquire(self, invocation: AgentInvocation) -> Lease:
+        """Block until the turn may run; returns the lease to release afterwards."""
+        return self._run_sync(self._acquire_steps(invocation))
+
+    async def aacquire(self, invocation: AgentInvocation) -> Lease:
+        return await self._run_async(self._acquire_steps(invocation))
+
+    def release(self, lease: Lease) -> None:
+        for name in reversed(lease.semaphores):
+            try:
+                self._release_semaphore(name, lease.member)
+            except Exception as exc:
+                logger.warning("openclaw_limiter_release_failed", name=name, error=str(exc))
+
+    def _acquire_steps(self, invocation: AgentInvocation) -> Any:
+        """Generator yielding Redis calls and sleeps; shared by sync and async acquire."""
+        lease = Lease(member=f"{invocation.session_id}:{uuid.uuid4().hex[:8]}")
+        semaphores, bucket = self._plan(invocation)
+        lease_seconds = invocation.timeout_seconds + 60
+        started = time.monotonic()
+
+        try:
+            for name, limit in semaphores:
+                while not (yield ("call", self._try_semaphore, (name, limit, lease.member, lease_seconds))):
+                    yield ("sleep", self.poll_seconds)
+                lease.semaphores.append(name)
+            if bucket is not None:
+                delay = yield ("call", self._take_token, bucket)
+                if delay > 0:
+                    yield ("sleep", delay)
+        except Exception as exc:
+            logger.warning("openclaw_limiter_unavailable", role=invocation.role, error=str(exc))
+
+        lease.waited = time.monotonic() - started
+        if lease.waited >= self.poll_seconds:
+            logger.info(
+                "openclaw_limiter_waited",
+                role=invocation.role,
+                model=invocation.model or "default",
+                seconds=round(lease.waited, 3),
+            )
+        return lease
+
+    @staticmethod
+    def _run_sync(steps: Any) -> Lease:
+        try:
+            op = next(steps)
+            while True:
+                kind, *args = op
+                if kind == "sleep":
+                    time.sleep(args[0])
+                    op = steps.send(None)
+                else:
+                    fn, fn_args = args
+                    try:
+                        value = fn(*fn_args)
+                    except Exception as exc:
+                        op = steps.throw(exc)
+                        continue
+                    op = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+
+    @staticmethod
+    async def _run_async(steps: Any) -> Lease:
+        try:
+            op = next(steps)
+            while True:
+                kind, *args = op
+                if kind == "sleep":
+                    await asyncio.sleep(args[0])
+                    op = steps.send(None)
+                else:
+                    fn, fn_args = args
+                    try:
+                        value = await asyncio.to_thread(fn, *fn_args)
+                    except Exception as exc:
+                        op = steps.throw(exc)
+                        continue
+                    op = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
@@ -0,0 +1,68 @@
+"""Prompt assembly for agent turns.
+
+``build_message`` renders an ``AgentInvocation`` into the single message
+every adapter sends::
+
+    [Role: <role>]
+    [Allowed Tools: ...] / [Denied Tools: ...] / [Working Directory: ...]
+    [Context]
+    <context blocks not already in the instruction>
+    [Instruction]
+    <instruction>
+
+Callers often embed the context in the instruction as well (meeting round
+templates use ``{context}``, task prompts include the description), so the
+context is split into blocks on blank lines and ``---`` separators and any
+block that already appears in the instruction is dropped.  When nothing is
+left the ``[Context]`` section is omitted entirely.
+"""
+
+from __future__ import annotations
+
+import re
+
+from app.openclaw.base import AgentInvocation
+
+_BLOCK_SEPARATOR = re.compile(r"\n\s*(?:---+\s*\n)?\s*\n")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def dedupe_context(context: str, instruction: str) -> str:
+    """Context minus the blocks that the instruction already contains."""
+    if not context.strip():
+        return ""
+    haystack = _normalize(instruction)
+    if _normalize(context) in haystack:
+        return ""
+
+    kept = [
+        block.strip()
+        for block in _BLOCK_SEPARATOR.split(context)
+        if block.strip() and _normalize(block) not in haystack
+    ]
+    return "\n\n".join(kept)
+
+
+def build_message(invocation: AgentInvocation) -> str:
+    """Build the full prompt sent to the agent, combining role instruction and context."""
+    parts: list[str] = []
+    parts.append(f"[Role: {invocation.role}]")
+    if invocation.tool_allow:
+        parts.append(f"[Allowed Tools: {', '.join(invocation.tool_allow)}]")
+    if invocation.tool_deny:
+        parts.append(f"[Denied Tools: {', '.join(invocation.tool_deny)}]")
+    if invocation.workspace_dir:
+        parts.append(f"[Working Directory: {invocation.workspace_dir}]")
+    context = dedupe_context(invocation.context, invocation.instruction)
+    if context:
+        parts.append(f"[Context]\n{context}")
+    parts.append(f"[Instruction]\n{invocation.instruction}")
+    return "\n\n".join(parts)
+
+
+def prompt_bytes(invocation: AgentInvocation) -> int:
+    """Size in bytes of the message an adapter sends for ``invocation``."""
+    return len(build_message(invocation).encode("utf-8"))
@@ -0,0 +1,104 @@
+"""Incremental parser for ``openclaw agent --json`` stdout.
+
+``CLIAdapter._parse_output`` needs the whole of stdout.  ``StreamParser``
+is fed chunks as they arrive and returns the assistant text found in every
+completed line, so callers can surface progress while the turn is still
+running.  It understands both output shapes OpenClaw produces:
+
+* JSONL — one JSON object per line (assistant/text/output/message/payloads)
+* a single pretty-printed ``{"payloads": [{"text": ...}], "meta": ...}``
+  object, from which each ``"text": "..."`` line is decoded on its own
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_TEXT_FIELD = re.compile(r'^\s*"text"\s*:\s*("(?:[^"\\]|\\.)*")\s*,?\s*$')
+_JSON_PUNCTUATION = ("{", "}", "[", "]", '"')
+
+
+def extract_text(obj: Any) -> str:
+    """Return the assistant text carried by one parsed JSON object, if any."""
+    if not isinstance(obj, dict):
+        return ""
+    if "payloads" in obj:
+        return "\n".join(
+            p["text"] for p in obj["payloads"] if isinstance(p, dict) and p.get("text")
+        )
+    if obj.get("role") in ("assistant", "text"):
+        return obj.get("content") or obj.get("text", "")
+    if obj.get("role") in ("tool_use", "tool_result", "tool_call", "tool"):
+        return ""
+    if "output" in obj:
+        return str(obj["output"])
+    if "message" in obj and isinstance(obj["message"], str):
+        return obj["message"]
+    return ""
+
+
+class StreamParser:
+    """Turn raw stdout chunks into text deltas, one completed line at a time.
+
+    A line longer than ``max_line_chars`` is dropped rather than buffered, so
+    output without newlines cannot grow the parser without bound.
+    """
+
+    def __init__(self, max_line_chars: int | None = None) -> None:
+        self._pending = ""
+        self._max_line = max_line_chars
+        self._skipping = False
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk of stdout and return any newly completed text."""
+        if self._skipping:
+            if "\n" not in chunk:
+                return ""
+            chunk = chunk.split("\n", 1)[1]
+            self._skipping = False
+        self._pending += chunk
+        if "\n" not in self._pending:
+            if self._max_line is not None and len(self._pending) > self._max_line:
+                self._pending = ""
+                self._skipping = True
+            return ""
+        complete, self._pending = self._pending.rsplit("\n", 1)
+        return self._join(
+            self._parse_line(line)
+            for line in complete.split("\n")
+            if self._max_line is None or len(line) <= self._max_line
+        )
+
+    def close(self) -> str:
+        """Flush a trailing line that was not newline-terminated."""
+        line, self._pending = self._pending, ""
+        return self._parse_line(line)
+
+    @staticmethod
+    def _join(parts: Any) -> str:
+        return "\n".join(p for p in parts if p)
+
+    @staticmethod
+    def _parse_line(line: str) -> str:
+        stripped = line.strip()
+        if not stripped:
+            return ""
+
+        try:
+            return extract_text(json.loads(stripped))
+        except json.JSONDecodeError:
+            pass
+
+        match = _TEXT_FIELD.match(stripped)
+        if match:
+            try:
+                return json.loads(match.group(1))
+            except json.JSONDecodeError:
+                return ""
+
+        # Structural lines of a pretty-printed object carry no text
+        if stripped.startswith(_JSON_PUNCTUATION):
+            return ""
+        return stripped
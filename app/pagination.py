@@ -0,0 +1,132 @@
+"""Keyset pagination for list endpoints.
+
+A list is ordered by a tuple of key columns ending in a unique one, e.g.
+``(created_at, id)``.  A cursor is an opaque token holding the key of a row
+and a direction; the next page starts right after that row, so every page
+is one index range scan however deep the client has paged, and rows
+inserted meanwhile never shift a page.
+
+* ``cursor`` continues in the direction it was issued for;
+* ``after`` / ``before`` take any cursor and force ascending (newer) or
+  descending (older) order.
+
+``Page.next_cursor`` continues the listing and is ``None`` once a
+descending listing is exhausted.  An ascending listing always returns one,
+even when empty, so a client can keep polling it for rows added later.
+``Page.prev_cursor`` walks back from the first row in the other direction.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    has_more: bool = False
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _load(value: Any, column: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any], ascending: bool) -> str:
+    raw = json.dumps({"k": [_dump(v) for v in values], "a": ascending}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> tuple[tuple[Any, ...], bool]:
+    """Key values and direction of ``cursor``; 400 if it is not one of ours."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        values = data["k"]
+        if len(values) != len(keys):
+            raise ValueError("wrong key length")
+        return tuple(_load(v, k) for v, k in zip(values, keys)), bool(data["a"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise HTTPException(400, f"Invalid cursor: {exc}") from exc
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select[Any],
+    keys: Sequence[Any],
+    schema: type[BaseModel],
+    *,
+    limit: int = DEFAULT_LIMIT,
+    cursor: str | None = None,
+    after: str | None = None,
+    before: str | None = None,
+    descending: bool = False,
+) -> Page[Any]:
+    """Run one page of ``stmt`` ordered by ``keys`` and wrap it in ``Page[schema]``.
+
+    ``descending`` is the order of the first page, when no cursor is given.
+    """
+    if after and before:
+        raise HTTPException(400, "Pass either 'after' or 'before', not both")
+
+    position: tuple[Any, ...] | None = None
+    ascending = not descending
+    if after or before:
+        position, _ = decode_cursor(after or before, keys)  # type: ignore[arg-type]
+        ascending = bool(after)
+    elif cursor:
+        position, ascending = decode_cursor(cursor, keys)
+
+    if position is not None:
+        key = tuple_(*keys)
+        stmt = stmt.where(key > tuple_(*position) if ascending else key < tuple_(*position))
+    stmt = stmt.order_by(*(k.asc() if ascending else k.desc() for k in keys)).limit(limit + 1)
+
+    rows = list((await db.execute(stmt)).scalars().all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    def key_of(row: Any) -> list[Any]:
+        return [getattr(row, k.key) for k in keys]
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if has_more or ascending:
+            next_cursor = encode_cursor(key_of(rows[-1]), ascending)
+        prev_cursor = encode_cursor(key_of(rows[0]), not ascending)
+    elif ascending and position is not None:
+        next_cursor = encode_cursor(position, True)
+
+    return Page[schema].model_validate(  # type: ignore[valid-type]
+        {"items": rows, "next_cursor": next_cursor, "prev_cursor": prev_cursor, "has_more": has_more},
+        from_attributes=True,
+    )
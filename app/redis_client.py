@@ -0,0 +1,21 @@
+"""Process-wide Redis client for worker-side helpers.
+
+``redis.Redis`` keeps its own connection pool and re-creates it after a
+fork, so one client per process is enough for caching, rate limiting and
+event publishing.
+"""
+
+from __future__ import annotations
+
+import redis
+
+from app.config import settings
+
+_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.redis_url)
+    return _client
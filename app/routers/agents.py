@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import Agent, Project
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, paginate
 from app.schemas import AgentCreate, AgentRead
 
 router = APIRouter(tags=["agents"])
@@ -35,9 +36,14 @@ async def create_agent(
     return agent
 
 
-@router.get("/projects/{project_id}/agents", response_model=list[AgentRead])
-async def list_agents(project_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Agent).where(Agent.project_id == project_id).order_by(Agent.created_at)
+@router.get("/projects/{project_id}/agents", response_model=Page[AgentRead])
+async def list_agents(
+    project_id: uuid.UUID,
+    limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    return await paginate(
+        db, select(Agent).where(Agent.project_id == project_id), (Agent.created_at, Agent.id), AgentRead,
+        limit=limit, cursor=cursor,
     )
-    return result.scalars().all()
@@ -2,36 +2,54 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.http_cache import conditional, make_etag, page_etag
 from app.models import Artifact
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, paginate
 from app.schemas import ArtifactRead
 
 router = APIRouter(tags=["artifacts"])
 
 
-@router.get("/projects/{project_id}/artifacts", response_model=list[ArtifactRead])
+@router.get("/projects/{project_id}/artifacts", response_model=Page[ArtifactRead])
 async def list_artifacts(
     project_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Artifact)
-        .where(Artifact.project_id == project_id)
-        .order_by(Artifact.created_at.desc())
+    stmt = select(Artifact).where(Artifact.project_id == project_id)
+    page = await paginate(
+        db,
+        stmt,
+        (Artifact.created_at, Artifact.id),
+        ArtifactRead,
+        limit=limit, cursor=cursor, descending=True,
     )
-    return result.scalars().all()
+    cached = conditional(request, response, page_etag(page))
+    if cached is not None:
+        return cached
+    return page
 
 
 @router.get("/artifacts/{artifact_id}", response_model=ArtifactRead)
 async def get_artifact(
     artifact_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     artifact = await db.get(Artifact, artifact_id)
     if not artifact:
         raise HTTPException(404, "Artifact not found")
+    # Artifacts are written once by the executor and never modified
+    cached = conditional(request, response, make_etag(artifact.id, artifact.created_at), artifact.created_at)
+    if cached is not None:
+        return cached
     return artifact
@@ -2,27 +2,47 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.http_cache import conditional, page_etag
 from app.models import Event
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, paginate
 from app.schemas import EventRead
 
 router = APIRouter(tags=["events"])
 
 
-@router.get("/projects/{project_id}/events", response_model=list[EventRead])
+@router.get("/projects/{project_id}/events", response_model=Page[EventRead])
 async def list_events(
     project_id: uuid.UUID,
-    limit: int = Query(default=50, le=200),
+    request: Request,
+    response: Response,
+    limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    after: str | None = Query(default=None, description="Only events newer than this cursor, oldest first"),
+    before: str | None = Query(default=None, description="Only events older than this cursor, newest first"),
+    type: list[str] | None = Query(default=None, description="Only these event types"),
+    task_id: uuid.UUID | None = None,
+    thread_id: uuid.UUID | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Event)
-        .where(Event.project_id == project_id)
-        .order_by(Event.created_at.desc())
-        .limit(limit)
+    """Newest events first; poll with ``after=<prev_cursor>`` to fetch only new ones."""
+    stmt = select(Event).where(Event.project_id == project_id)
+    if type:
+        stmt = stmt.where(Event.type.in_(type))
+    if task_id:
+        stmt = stmt.where(Event.payload_json["task_id"].astext == str(task_id))
+    if thread_id:
+        stmt = stmt.where(Event.payload_json["thread_id"].astext == str(thread_id))
+
+    page = await paginate(
+        db, stmt, (Event.created_at, Event.id), EventRead,
+        limit=limit, cursor=cursor, after=after, before=before, descending=True,
     )
-    return result.scalars().all()
+    cached = conditional(request, response, page_etag(page))
+    if cached is not None:
+        return cached
+    return page
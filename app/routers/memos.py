@@ -2,28 +2,54 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.database import get_db
+from app.http_cache import conditional, make_etag, page_etag
 from app.models import Memo
-from app.schemas import MemoRead
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, paginate
+from app.schemas import MemoRead, MemoSummary
 
 router = APIRouter(tags=["memos"])
 
 
-@router.get("/projects/{project_id}/memos", response_model=list[MemoRead])
-async def list_memos(project_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Memo).where(Memo.project_id == project_id).order_by(Memo.created_at.desc())
+@router.get("/projects/{project_id}/memos", response_model=Page[MemoSummary])
+async def list_memos(
+    project_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Memo summaries, newest first; the markdown body is only served by ``/memos/{id}``."""
+    stmt = select(Memo).options(defer(Memo.content_markdown)).where(Memo.project_id == project_id)
+    page = await paginate(
+        db, stmt, (Memo.created_at, Memo.id), MemoSummary,
+        limit=limit, cursor=cursor, descending=True,
     )
-    return result.scalars().all()
+    cached = conditional(request, response, page_etag(page))
+    if cached is not None:
+        return cached
+    return page
 
 
 @router.get("/memos/{memo_id}", response_model=MemoRead)
-async def get_memo(memo_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    memo = await db.get(Memo, memo_id)
-    if not memo:
+async def get_memo(
+    memo_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+):
+    # Memos are never modified, so the validators come from a lookup that
+    # does not read the body
+    created_at = (await db.execute(select(Memo.created_at).where(Memo.id == memo_id))).scalar()
+    if created_at is None:
         raise HTTPException(404, "Memo not found")
-    return memo
+    cached = conditional(request, response, make_etag(memo_id, created_at), created_at)
+    if cached is not None:
+        return cached
+    return await db.get(Memo, memo_id)
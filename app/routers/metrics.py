@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from app.events import publish_stats
+from app.openclaw.cache import cache_stats
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/agent-cache")
+def agent_cache_metrics():
+    """Hit/miss counters of the OpenClaw response cache across all workers."""
+    return cache_stats()
+
+
+@router.get("/events")
+def event_publish_metrics():
+    """Event publish counters, batch sizes and enqueue-to-publish latency."""
+    return publish_stats()
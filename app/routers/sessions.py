@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models import Project, Thread
-from app.schemas import SessionCreate, SessionRead
-from app.workers.meeting import run_meeting_pipeline
+from app.models import AuthorType, Message, Project, Thread
+from app.schemas import SessionCreate, SessionRead, SessionResume
+from app.workers.meeting import claim_meeting, release_meeting, run_meeting_pipeline
 
 router = APIRouter(tags=["sessions"])
 
@@ -28,12 +30,17 @@ async def start_session(
     await db.commit()
     await db.refresh(thread)
 
-    task = run_meeting_pipeline.delay(
-        str(project_id),
-        str(thread.id),
-        body.prompt,
-        auto_execute=body.auto_execute,
-    )
+    await asyncio.to_thread(claim_meeting, str(thread.id))
+    try:
+        task = run_meeting_pipeline.delay(
+            str(project_id),
+            str(thread.id),
+            body.prompt,
+            auto_execute=body.auto_execute,
+        )
+    except Exception:
+        await asyncio.to_thread(release_meeting, str(thread.id))
+        raise
 
     return SessionRead(
         task_id=task.id,
@@ -41,3 +48,54 @@ async def start_session(
         thread_id=thread.id,
         status="accepted",
     )
+
+
+@router.post(
+    "/projects/{project_id}/sessions/{thread_id}/resume",
+    response_model=SessionRead,
+    status_code=202,
+)
+async def resume_session(
+    project_id: uuid.UUID,
+    thread_id: uuid.UUID,
+    body: SessionResume,
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-run a meeting, skipping every round that already has a checkpoint.
+
+    409 while a pipeline for the thread is queued, running or waiting to retry.
+    """
+    thread = await db.get(Thread, thread_id)
+    if not thread or thread.project_id != project_id:
+        raise HTTPException(404, "Thread not found")
+
+    result = await db.execute(
+        select(Message)
+        .where(Message.thread_id == thread_id, Message.author_type == AuthorType.USER)
+        .order_by(Message.created_at)
+        .limit(1)
+    )
+    prompt_message = result.scalars().first()
+    if not prompt_message:
+        raise HTTPException(409, "Thread has no session prompt to resume")
+
+    if not await asyncio.to_thread(claim_meeting, str(thread_id)):
+        raise HTTPException(409, "A meeting pipeline is already running for this thread")
+    try:
+        task = run_meeting_pipeline.delay(
+            str(project_id),
+            str(thread_id),
+            prompt_message.content,
+            auto_execute=body.auto_execute,
+            resume=True,
+        )
+    except Exception:
+        await asyncio.to_thread(release_meeting, str(thread_id))
+        raise
+
+    return SessionRead(
+        task_id=task.id,
+        project_id=project_id,
+        thread_id=thread_id,
+        status="accepted",
+    )
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
+from app.http_cache import conditional, make_etag, page_etag
 from app.models import Project, Task, TaskSource, TaskStatus
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, paginate
 from app.schemas import TaskCreate, TaskDetailRead, TaskRead
 from app.workers.executor import execute_task
 
@@ -41,23 +43,36 @@ async def create_task(
     return task
 
 
-@router.get("/projects/{project_id}/tasks", response_model=list[TaskRead])
+@router.get("/projects/{project_id}/tasks", response_model=Page[TaskRead])
 async def list_tasks(
     project_id: uuid.UUID,
+    request: Request,
+    response: Response,
     status: TaskStatus | None = None,
+    limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
     query = select(Task).where(Task.project_id == project_id)
     if status:
         query = query.where(Task.status == status)
-    query = query.order_by(Task.created_at.desc())
-    result = await db.execute(query)
-    return result.scalars().all()
+    page = await paginate(
+        db, query, (Task.created_at, Task.id), TaskRead,
+        limit=limit, cursor=cursor, descending=True,
+    )
+    # Running or finishing a task changes its status and completed_at (and
+    # with it the result summary)
+    cached = conditional(request, response, page_etag(page, ("id", "status", "completed_at")))
+    if cached is not None:
+        return cached
+    return page
 
 
 @router.get("/tasks/{task_id}", response_model=TaskDetailRead)
 async def get_task(
     task_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -68,6 +83,13 @@ async def get_task(
     task = result.scalars().first()
     if not task:
         raise HTTPException(404, "Task not found")
+    # A task changes while it runs (status, artifacts) and is fixed once it
+    # has finished, until it is executed again
+    etag = make_etag(task.id, task.status.value, task.completed_at, len(task.artifacts))
+    finished = task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
+    cached = conditional(request, response, etag, task.completed_at if finished else None)
+    if cached is not None:
+        return cached
     return task
 
 
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.http_cache import conditional, page_etag
 from app.models import Message, AuthorType, Project, Thread
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, paginate
 from app.schemas import MessageCreate, MessageRead, ThreadCreate, ThreadRead
 
 router = APIRouter(tags=["threads"])
@@ -30,16 +32,31 @@ async def create_thread(
     return thread
 
 
-@router.get("/threads/{thread_id}/messages", response_model=list[MessageRead])
-async def list_messages(thread_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+@router.get("/threads/{thread_id}/messages", response_model=Page[MessageRead])
+async def list_messages(
+    thread_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
     thread = await db.get(Thread, thread_id)
     if not thread:
         raise HTTPException(404, "Thread not found")
 
-    result = await db.execute(
-        select(Message).where(Message.thread_id == thread_id).order_by(Message.created_at)
+    stmt = select(Message).where(Message.thread_id == thread_id)
+    page = await paginate(
+        db,
+        stmt,
+        (Message.created_at, Message.id),
+        MessageRead,
+        limit=limit, cursor=cursor,
     )
-    return result.scalars().all()
+    cached = conditional(request, response, page_etag(page))
+    if cached is not None:
+        return cached
+    return page
 
 
 @router.post("/threads/{thread_id}/messages", response_model=MessageRead, status_code=201)
@@ -112,6 +112,13 @@ class SessionCreate(BaseModel):
     )
 
 
+class SessionResume(BaseModel):
+    auto_execute: bool = Field(
+        default=False,
+        description="If true, automatically execute action items after the meeting concludes",
+    )
+
+
 class SessionRead(BaseModel):
     task_id: str
     project_id: uuid.UUID
@@ -145,6 +152,7 @@ class ActionItemRead(BaseModel):
     owner_role: AgentRole
     description: str
     status: ActionItemStatus
+    depends_on: list[uuid.UUID] = []
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -154,16 +162,21 @@ class ActionItemRead(BaseModel):
 # Memo
 # ---------------------------------------------------------------------------
 
-class MemoRead(BaseModel):
+class MemoSummary(BaseModel):
     id: uuid.UUID
     project_id: uuid.UUID
     title: str
-    content_markdown: str
+    size_bytes: int
+    executive_summary: str
     created_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class MemoRead(MemoSummary):
+    content_markdown: str
+
+
 # ---------------------------------------------------------------------------
 # Event
 # ---------------------------------------------------------------------------
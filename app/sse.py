@@ -0,0 +1,94 @@
+"""Server-Sent Events endpoint for project events.
+
+The same stream as ``/ws/projects/{id}`` over plain HTTP, for clients whose
+proxies drop idle WebSockets.  It is backed by ``app.event_hub.hub``: each
+stored event is sent with its ``stream_id`` as the SSE ``id``, so a browser's
+``EventSource`` resumes after a reconnect by sending ``Last-Event-ID`` (or
+``?last_id=``) and gets everything it missed replayed first.  A comment line
+is sent every ``SSE_HEARTBEAT_SECONDS`` to keep proxies from timing the
+connection out.  A client too slow to keep up has its response ended and
+reconnects by itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterator
+
+import structlog
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.event_hub import SubscriberOverflow, hub, stream_id_of
+
+logger = structlog.get_logger(__name__)
+router = APIRouter()
+
+# Milliseconds EventSource waits before reconnecting
+_RETRY_MS = 2000
+_END = object()
+
+
+def _frame(data: str) -> str:
+    entry_id = stream_id_of(data)
+    if entry_id is None:
+        message = json.loads(data)
+        if message.get("type") == "STREAM_READY":
+            entry_id = message["payload_json"].get("stream_id")
+    head = f"id: {entry_id}\n" if entry_id else ""
+    return f"{head}data: {data}\n\n"
+
+
+async def _pump(project_id: str, last_id: str | None, out: asyncio.Queue[object]) -> None:
+    stream = hub.stream(project_id, last_id)
+    try:
+        async for data in stream:
+            await out.put(data)
+    except SubscriberOverflow:
+        logger.warning("sse_client_too_slow", project_id=project_id)
+    finally:
+        await stream.aclose()
+        await out.put(_END)
+
+
+async def _event_stream(project_id: str, last_id: str | None) -> AsyncIterator[str]:
+    # The hub stream is read on its own task so waiting for a heartbeat
+    # never cancels it mid-message
+    out: asyncio.Queue[object] = asyncio.Queue(maxsize=1)
+    pump = asyncio.create_task(_pump(project_id, last_id, out))
+    try:
+        yield f"retry: {_RETRY_MS}\n\n"
+        while True:
+            try:
+                item = await asyncio.wait_for(out.get(), timeout=settings.sse_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if item is _END:
+                return
+            yield _frame(item)  # type: ignore[arg-type]
+    finally:
+        pump.cancel()
+        logger.info("sse_disconnected", project_id=project_id)
+
+
+@router.get("/sse/projects/{project_id}")
+async def project_events_sse(
+    project_id: uuid.UUID,
+    last_id: str | None = Query(default=None),
+    last_event_id: str | None = Header(default=None),
+):
+    resume_from = last_event_id or last_id
+    logger.info("sse_connected", project_id=str(project_id), last_id=resume_from)
+    return StreamingResponse(
+        _event_stream(str(project_id), resume_from),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop nginx-style proxies from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
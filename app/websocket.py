@@ -1,50 +1,74 @@
 """WebSocket endpoint for realtime event streaming.
 
-Subscribes to Redis pub/sub channel ``project:<id>:events`` and forwards
-every new Event record to connected WebSocket clients.  Also supports a
-simple polling fallback via the REST ``/projects/{id}/events`` endpoint.
+Forwards project events to connected WebSocket clients.  All clients of an
+API process share the one Redis subscription held by
+``app.event_hub.hub``.
+
+A reconnecting client passes the last ``stream_id`` it received as
+``?last_id=``; the events it missed are replayed from the project's Redis
+Stream before live delivery resumes.  Every connection receives a
+``STREAM_READY`` message once it is live (see ``app.event_hub``).  A client
+that falls too far behind is closed with code 1013 (try again later) and
+should reconnect with its ``last_id``.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 import uuid
 
-import redis.asyncio as aioredis
 import structlog
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
-from app.config import settings
+from app.event_hub import SubscriberOverflow, hub
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
 
+async def _forward(websocket: WebSocket, project_id: str, last_id: str | None) -> None:
+    stream = hub.stream(project_id, last_id)
+    try:
+        async for data in stream:
+            await websocket.send_text(data)
+    finally:
+        await stream.aclose()
+
+
+async def _until_disconnect(websocket: WebSocket) -> None:
+    # Clients do not send anything; reading notices a closed socket even
+    # while the project is quiet
+    while True:
+        await websocket.receive_text()
+
+
 @router.websocket("/ws/projects/{project_id}")
-async def project_events_ws(websocket: WebSocket, project_id: uuid.UUID):
+async def project_events_ws(
+    websocket: WebSocket,
+    project_id: uuid.UUID,
+    last_id: str | None = Query(default=None),
+):
     await websocket.accept()
-    logger.info("ws_connected", project_id=str(project_id))
-
-    r = aioredis.from_url(settings.redis_url, decode_responses=True)
-    pubsub = r.pubsub()
-    channel = f"project:{project_id}:events"
+    logger.info("ws_connected", project_id=str(project_id), last_id=last_id)
 
+    tasks = [
+        asyncio.create_task(_forward(websocket, str(project_id), last_id)),
+        asyncio.create_task(_until_disconnect(websocket)),
+    ]
     try:
-        await pubsub.subscribe(channel)
-
-        while True:
-            msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            if msg and msg["type"] == "message":
-                await websocket.send_text(msg["data"])
-            else:
-                await asyncio.sleep(0.1)
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            task.result()
 
     except WebSocketDisconnect:
         logger.info("ws_disconnected", project_id=str(project_id))
+    except SubscriberOverflow:
+        logger.warning("ws_client_too_slow", project_id=str(project_id))
+        await websocket.close(code=1013)
     except Exception as exc:
         logger.error("ws_error", error=str(exc))
-    finally:
-        await pubsub.unsubscribe(channel)
-        await pubsub.close()
-        await r.close()
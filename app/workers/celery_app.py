@@ -1,9 +1,28 @@
+"""Celery application.
+
+Work is split across three queues so long executions cannot starve
+interactive meetings:
+
+* ``meetings`` — ``run_meeting_pipeline``
+* ``tasks`` — ``execute_task`` started directly from the API
+* ``batch`` — action-item batches and their per-task steps
+
+A worker consumes all three by default; ``CELERY_QUEUES`` and
+``CELERY_CONCURRENCY`` (see ``scripts/entrypoint.sh``) start workers
+dedicated to a subset.  Within a queue, lower priority numbers run first.
+"""
+
 from __future__ import annotations
 
 from celery import Celery
+from kombu import Queue
 
 from app.config import settings
 
+MEETINGS_QUEUE = "meetings"
+TASKS_QUEUE = "tasks"
+BATCH_QUEUE = "batch"
+
 celery = Celery(
     "openclaw_dashboard",
     broker=settings.celery_broker_url,
@@ -19,6 +38,31 @@ celery.conf.update(
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    task_queues=(
+        Queue(MEETINGS_QUEUE),
+        Queue(TASKS_QUEUE),
+        Queue(BATCH_QUEUE),
+    ),
+    task_default_queue=TASKS_QUEUE,
+    task_default_priority=5,
+    task_routes={
+        "app.workers.meeting.run_meeting_pipeline": {"queue": MEETINGS_QUEUE, "priority": 0},
+        "app.workers.executor.execute_task": {"queue": TASKS_QUEUE, "priority": 3},
+        "app.workers.executor.execute_action_items": {"queue": BATCH_QUEUE, "priority": 3},
+        "app.workers.executor.finalize_execution_batch": {"queue": BATCH_QUEUE, "priority": 3},
+        "app.workers.executor.execute_batch_task": {"queue": BATCH_QUEUE, "priority": 6},
+        "app.workers.workspace.gc_worktrees": {"queue": BATCH_QUEUE, "priority": 9},
+    },
+    broker_transport_options={
+        "queue_order_strategy": "priority",
+        "priority_steps": list(range(10)),
+    },
+    beat_schedule={
+        "gc-worktrees": {
+            "task": "app.workers.workspace.gc_worktrees",
+            "schedule": settings.worktree_gc_interval_seconds,
+        },
+    },
 )
 
-celery.conf.update(include=["app.workers.meeting", "app.workers.executor"])
+celery.conf.update(include=["app.workers.meeting", "app.workers.executor", "app.workers.workspace"])
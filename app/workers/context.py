@@ -0,0 +1,145 @@
+"""Token-budgeted context for meeting rounds.
+
+``MeetingContext`` holds the user prompt and the output of every finished
+round.  ``build`` assembles the transcript a round reads within the role's
+``RoleConfig.context_token_budget``:
+
+* the user prompt and the most recent dependency round are always verbatim;
+* older rounds are replaced by extractive summaries sized to what is left of
+  the budget, newest first.  Lines carrying decisions, action items and
+  approvals are always kept, then headings, then bullets, then prose.
+
+With session continuity an agent already holds earlier rounds in its
+OpenClaw session; passing those rounds as ``seen`` leaves them (and the
+prompt) out so only the delta since the agent's last turn is sent.
+
+Summaries are cached per round and budget, so every round is summarised at
+most once per size however many later rounds read it.  Token counts are
+estimated at four characters per token.
+"""
+
+from __future__ import annotations
+
+import re
+
+from app.agents.roles import get_role_config
+
+_KEY_LINE = re.compile(r"^\s*[-*\d.)\s]*\**\s*(DECISION|ACTION|APPROVED|REJECTED)\b", re.IGNORECASE)
+_HEADING = re.compile(r"^\s*#{1,6}\s")
+_BULLET = re.compile(r"^\s*([-*•]|\d+[.)])\s")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+# Summaries are sized in steps of this many tokens so nearby budgets share a cache entry
+_BUDGET_STEP = 100
+_MAX_LINE_CHARS = 240
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+def _line_tier(line: str) -> int:
+    if _KEY_LINE.match(line):
+        return 0
+    if _HEADING.match(line):
+        return 1
+    if _BULLET.match(line):
+        return 2
+    return 3
+
+
+def _shorten(line: str) -> str:
+    if len(line) <= _MAX_LINE_CHARS:
+        return line
+    first = _SENTENCE_END.split(line, maxsplit=1)[0]
+    return first if len(first) <= _MAX_LINE_CHARS else first[:_MAX_LINE_CHARS].rstrip() + "…"
+
+
+def summarize(text: str, max_tokens: int) -> str:
+    """Extractive summary of ``text`` in about ``max_tokens`` tokens.
+
+    Decision, action and approval lines are kept even past the budget.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    budget = max_tokens * 4
+    chosen: dict[int, str] = {}
+    used = 0
+    for tier in range(4):
+        for idx, line in enumerate(lines):
+            if _line_tier(line) != tier:
+                continue
+            kept = line if tier == 0 else _shorten(line)
+            cost = len(kept) + 1
+            if tier > 0 and used + cost > budget:
+                continue
+            chosen[idx] = kept
+            used += cost
+
+    omitted = len(lines) - len(chosen)
+    summary = "\n".join(chosen[idx] for idx in sorted(chosen))
+    if omitted:
+        summary += f"\n[… {omitted} more line(s) omitted]"
+    return summary
+
+
+class MeetingContext:
+    """Prompt plus round outputs for one meeting, with cached summaries."""
+
+    def __init__(self, prompt: str):
+        self.prompt = prompt
+        self._rounds: dict[int, tuple[str, str]] = {}
+        self._summaries: dict[tuple[int, int], str] = {}
+
+    def add(self, round_num: int, label: str, output: str) -> None:
+        self._rounds[round_num] = (label, output)
+        self._summaries = {k: v for k, v in self._summaries.items() if k[0] != round_num}
+
+    @property
+    def rounds(self) -> list[int]:
+        return sorted(self._rounds)
+
+    def _summary(self, round_num: int, max_tokens: int) -> str:
+        step = max(_BUDGET_STEP, max_tokens - max_tokens % _BUDGET_STEP)
+        key = (round_num, step)
+        if key not in self._summaries:
+            self._summaries[key] = summarize(self._rounds[round_num][1], step)
+        return self._summaries[key]
+
+    def build(self, depends_on: list[int], role: str, seen: set[int] | None = None) -> str:
+        """Context for a turn of ``role`` reading the rounds in ``depends_on``.
+
+        Rounds in ``seen`` are already in the agent's session and are skipped,
+        as is the prompt once anything has been seen; the budget shrinks in
+        proportion to the rounds left out.
+        """
+        seen = seen or set()
+        budget = get_role_config(role).context_token_budget
+        available = [r for r in depends_on if r in self._rounds]
+        rounds = sorted(r for r in available if r not in seen)
+        sections: dict[int, str] = {}
+        if seen:
+            header = "[New since your last turn]"
+            budget = budget * len(rounds) // max(1, len(available))
+        else:
+            header = f"[User Prompt]\n{self.prompt}"
+        remaining = budget - estimate_tokens(header)
+
+        if rounds:
+            latest = rounds[-1]
+            label, output = self._rounds[latest]
+            sections[latest] = f"[{label}]\n{output}"
+            remaining -= estimate_tokens(sections[latest])
+
+            older = rounds[:-1]
+            for i, round_num in enumerate(reversed(older)):
+                share = max(0, remaining) // (len(older) - i)
+                label, output = self._rounds[round_num]
+                text = self._summary(round_num, share)
+                marker = "" if text is output else " (summary)"
+                sections[round_num] = f"[{label}{marker}]\n{text}"
+                remaining -= estimate_tokens(sections[round_num])
+
+        return "\n\n---\n\n".join([header] + [sections[r] for r in sorted(sections)])
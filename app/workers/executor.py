@@ -4,8 +4,10 @@ Executes Tasks by invoking OpenClaw agents with role-appropriate tool
 permissions and workspace directories. Captures artifacts produced.
 
 Celery tasks:
-  - execute_task        : run a single Task row
-  - execute_action_items: batch-convert ActionItems → Tasks and execute them
+  - execute_task            : run a single Task row
+  - execute_action_items    : batch-convert ActionItems → Tasks and fan them out
+  - execute_batch_task      : run one Task as part of a batch (never fails the batch)
+  - finalize_execution_batch: join step that records the batch outcome
 """
 
 from __future__ import annotations
@@ -18,6 +20,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 import structlog
+from celery import chain, group
 from sqlalchemy import select
 
 from app.agents.roles import get_role_config
@@ -43,6 +46,8 @@ from app.models import (
 from app.openclaw import get_openclaw_client
 from app.openclaw.base import AgentResult
 from app.workers.celery_app import celery
+from app.workers.streaming import DeltaPublisher
+from app.workers.workspace import Worktree, WorkspaceError, get_worktree_manager
 
 logger = structlog.get_logger(__name__)
 
@@ -57,40 +62,75 @@ _ROLE_TASK_TYPE: dict[str, TaskType] = {
 
 
 def _emit_event(db: Any, project_id: str, event_type: str, payload: dict) -> Event:
+    """Stage an event in the caller's transaction; the outbox relay publishes it."""
     event = Event(
         project_id=uuid.UUID(project_id),
         type=event_type,
         payload_json=payload,
     )
     db.add(event)
-    db.commit()
-    db.refresh(event)
-    _publish_event(project_id, event)
     return event
 
 
-def _publish_event(project_id: str, event: Event) -> None:
-    try:
-        import redis as redis_lib
-        r = redis_lib.Redis.from_url(settings.redis_url)
-        r.publish(
-            f"project:{project_id}:events",
-            json.dumps({
-                "id": str(event.id),
-                "type": event.type,
-                "payload_json": event.payload_json,
-                "created_at": event.created_at.isoformat() if event.created_at else None,
-            }),
-        )
-    except Exception as exc:
-        logger.warning("redis_publish_failed", error=str(exc))
+def _resolve_workspace(task: Task) -> tuple[str, Worktree | None]:
+    """Return the absolute workspace path for a task.
 
+    Roles that modify files get a private git worktree on a task branch when
+    the workspace is a git repository; everyone else shares the directory.
+    """
+    workspace = os.path.expanduser(task.workspace_dir or settings.agent_workspace_dir)
+    if not get_role_config(task.agent_role.value).can_modify_files:
+        return workspace, None
 
-def _resolve_workspace(task: Task) -> str:
-    """Return the absolute workspace path for a task."""
-    if task.workspace_dir:
-        return os.path.expanduser(task.workspace_dir)
-    return os.path.expanduser(settings.agent_workspace_dir)
+    try:
+        manager = get_worktree_manager(workspace)
+        if manager is None:
+            return workspace, None
+        worktree = manager.acquire(str(task.id), workspace)
+    except (WorkspaceError, OSError) as exc:
+        # e.g. WORKTREE_ROOT on a read-only mount: run in the shared workspace
+        logger.warning("worktree_unavailable", task_id=str(task.id), error=str(exc))
+        return workspace, None
+    return worktree.workdir, worktree
+
+
+def _finish_worktree(
+    db: Any,
+    project_id: str,
+    task: Task,
+    worktree: Worktree,
+    success: bool,
+) -> dict[str, Any] | None:
+    """Commit the task branch, merge it only if the task succeeded, and record it as an artifact."""
+    report = _release_worktree(worktree, str(task.id), f"{task.title}\n\nOpenClaw task {task.id}", success)
+    if report and report["commits"]:
+        if report["merged"]:
+            state = f"merged into {report['into']}"
+        else:
+            state = "ready to merge" if success else "kept after the task failed"
+        db.add(Artifact(
+            project_id=uuid.UUID(project_id),
+            task_id=task.id,
+            artifact_type=ArtifactType.COMMIT,
+            path_or_url=report["head"],
+            description=f"Branch {report['branch']}: {report['commits']} commit(s), {state}",
+            metadata_json=report,
+        ))
+    return report
+
+
+def _release_worktree(worktree: Worktree, task_id: str, message: str, merge: bool) -> dict[str, Any] | None:
+    """Commit leftovers to the task branch and return the worktree to the pool."""
+    try:
+        manager = get_worktree_manager(worktree.repo)
+        if manager is None:
+            return None
+        report = manager.finish(worktree, message, merge=merge)
+        manager.fill_pool()
+    except (WorkspaceError, OSError) as exc:
+        logger.warning("worktree_finish_failed", task_id=task_id, error=str(exc))
+        return None
+    return report
 
 
 def _get_agent_for_role(db: Any, project_id: str, role: AgentRole) -> Agent | None:
@@ -188,9 +228,6 @@ def _parse_artifacts(
                 db.add(art)
                 artifacts.append(art)
 
-    if artifacts:
-        db.commit()
-
     return artifacts
 
 
@@ -208,8 +245,21 @@ def _guess_artifact_type(path: str) -> ArtifactType:
 @celery.task(name="app.workers.executor.execute_task", bind=True, max_retries=1)
 def execute_task(self, task_id: str) -> dict[str, Any]:
     """Execute a single Task by invoking the appropriate OpenClaw agent."""
+    try:
+        return _run_task(task_id)
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=30)
+
+
+def _run_task(task_id: str) -> dict[str, Any]:
+    """Run a Task once; on an exception it is marked failed and the error re-raised.
+
+    Retrying is left to the calling Celery task.
+    """
     db = get_sync_db()
     client = get_openclaw_client()
+    # Set while the task holds a worktree that has not been finished yet
+    worktree: Worktree | None = None
 
     try:
         task = db.get(Task, uuid.UUID(task_id))
@@ -219,24 +269,22 @@ def execute_task(self, task_id: str) -> dict[str, Any]:
         project_id = str(task.project_id)
         role_name = task.agent_role.value
         rc = get_role_config(role_name)
-        workspace = _resolve_workspace(task)
+        workspace, worktree = _resolve_workspace(task)
 
-        # Mark task running
+        # Mark task and the project agent (for status tracking) running
         task.status = TaskStatus.RUNNING
-        db.commit()
+        agent = _get_agent_for_role(db, project_id, task.agent_role)
+        if agent:
+            agent.status = AgentStatus.RUNNING
 
         _emit_event(db, project_id, "TASK_STARTED", {
             "task_id": task_id,
             "title": task.title,
             "role": role_name,
             "workspace": workspace,
+            "branch": worktree.branch if worktree else None,
         })
-
-        # Find the project agent for status tracking
-        agent = _get_agent_for_role(db, project_id, task.agent_role)
-        if agent:
-            agent.status = AgentStatus.RUNNING
-            db.commit()
+        db.commit()
 
         # Build prompt and invoke
         instruction = _build_execution_prompt(role_name, task, workspace)
@@ -246,6 +294,11 @@ def execute_task(self, task_id: str) -> dict[str, Any]:
             extra_config.pop("tool_profile", None)
             extra_config.pop("model", None)
 
+        publisher = DeltaPublisher(project_id, {
+            "task_id": task_id,
+            "role": role_name,
+            "agent_id": str(agent.id) if agent else None,
+        })
         result: AgentResult = client.run_agent(
             role=role_name,
             instruction=instruction,
@@ -256,32 +309,41 @@ def execute_task(self, task_id: str) -> dict[str, Any]:
             workspace_dir=workspace,
             model=extra_config.pop("model", "") if extra_config else "",
             extra_config=extra_config,
+            on_output=publisher,
         )
+        publisher.flush()
 
         # Update agent status
         if agent:
             agent.status = AgentStatus.IDLE if result.success else AgentStatus.ERROR
-            db.commit()
 
         # Parse artifacts
         artifacts = _parse_artifacts(
             db, project_id, task_id, result.output, result.tool_logs,
         )
+        branch_report = None
+        if worktree:
+            branch_report = _finish_worktree(db, project_id, task, worktree, result.success)
+            worktree = None
 
         # Update task
         task.status = TaskStatus.COMPLETED if result.success else TaskStatus.FAILED
         task.result_summary = result.output[:4000] if result.output else result.error
         task.completed_at = datetime.now(timezone.utc)
-        db.commit()
 
         _emit_event(db, project_id, "TASK_COMPLETED", {
             "task_id": task_id,
             "status": task.status.value,
             "success": result.success,
             "artifact_count": len(artifacts),
+            "branch": branch_report,
+            "queue_wait_seconds": result.queue_wait_seconds,
+            "execution_seconds": result.execution_seconds,
+            "prompt_bytes": result.prompt_bytes,
             "output_preview": result.output[:500],
             "error": result.error or None,
         })
+        db.commit()
 
         return {
             "status": task.status.value,
@@ -291,44 +353,201 @@ def execute_task(self, task_id: str) -> dict[str, Any]:
 
     except Exception as exc:
         logger.exception("execute_task_failed", task_id=task_id)
+        branch_report = None
+        if worktree:
+            branch_report = _release_worktree(worktree, task_id, f"Interrupted OpenClaw task {task_id}", merge=False)
+            worktree = None
         try:
+            db.rollback()
             task = db.get(Task, uuid.UUID(task_id))
             if task:
                 task.status = TaskStatus.FAILED
                 task.result_summary = str(exc)[:2000]
                 task.completed_at = datetime.now(timezone.utc)
-                db.commit()
                 _emit_event(db, str(task.project_id), "TASK_FAILED", {
                     "task_id": task_id,
                     "error": str(exc),
+                    "branch": branch_report,
                 })
+                db.commit()
         except Exception:
             pass
-        raise self.retry(exc=exc, countdown=30)
+        raise
+    finally:
+        if worktree:
+            _release_worktree(worktree, task_id, f"Interrupted OpenClaw task {task_id}", merge=False)
+        db.close()
+
+
+def _plan_waves(items: list[ActionItem]) -> list[list[ActionItem]]:
+    """Group action items into waves that can run concurrently.
+
+    Items are independent unless ``depends_on`` names another item in the
+    same batch; every item lands in the first wave after all of its
+    prerequisites.  Dependencies on items outside the batch are ignored,
+    and any cycle is broken by scheduling the remaining items last.
+    """
+    by_id = {str(item.id): item for item in items}
+    pending = {
+        str(item.id): {dep for dep in (item.depends_on or []) if dep in by_id}
+        for item in items
+    }
+    waves: list[list[ActionItem]] = []
+    done: set[str] = set()
+
+    while pending:
+        ready = [iid for iid, deps in pending.items() if deps <= done]
+        if not ready:
+            logger.warning("action_item_dependency_cycle", item_ids=list(pending))
+            ready = list(pending)
+        waves.append([by_id[iid] for iid in ready])
+        done.update(ready)
+        for iid in ready:
+            del pending[iid]
+
+    return waves
+
+
+@celery.task(name="app.workers.executor.execute_batch_task")
+def execute_batch_task(
+    task_id: str,
+    prerequisite_task_ids: list[str] | None = None,
+) -> dict[str, Any]:
+    """Run one Task of an execution batch.
+
+    Unlike ``execute_task`` this never ends in a failure state, so a single
+    broken task cannot stop the batch's join step from running.  A task that
+    raises is marked failed once and not retried; its action item stays open
+    for the next batch.  Tasks whose prerequisites did not complete are marked
+    failed without invoking an agent.
+    """
+    if prerequisite_task_ids:
+        db = get_sync_db()
+        try:
+            unmet = [
+                t for t in db.execute(
+                    select(Task).where(Task.id.in_([uuid.UUID(p) for p in prerequisite_task_ids]))
+                ).scalars().all()
+                if t.status != TaskStatus.COMPLETED
+            ]
+            if unmet:
+                task = db.get(Task, uuid.UUID(task_id))
+                if not task:
+                    return {"status": "error", "task_id": task_id, "error": "Task not found"}
+                task.status = TaskStatus.FAILED
+                task.result_summary = "Skipped: prerequisite tasks did not complete: " + ", ".join(
+                    t.title for t in unmet
+                )
+                task.completed_at = datetime.now(timezone.utc)
+                _emit_event(db, str(task.project_id), "TASK_SKIPPED", {
+                    "task_id": task_id,
+                    "unmet_prerequisites": [str(t.id) for t in unmet],
+                })
+                db.commit()
+                return {"status": TaskStatus.FAILED.value, "task_id": task_id, "skipped": True}
+        finally:
+            db.close()
+
+    try:
+        return _run_task(task_id)
+    except Exception as exc:
+        return {"status": TaskStatus.FAILED.value, "task_id": task_id, "error": str(exc)}
+
+
+@celery.task(name="app.workers.executor.finalize_execution_batch")
+def finalize_execution_batch(
+    project_id: str,
+    task_ids: list[str],
+    thread_id: str | None = None,
+) -> dict[str, Any]:
+    """Join step: close out action items and summarise the finished batch.
+
+    Only items whose task completed are marked done; the others go back to
+    open so the next ``execute_action_items`` run picks them up again.
+    """
+    db = get_sync_db()
+
+    try:
+        tasks = [t for t in (db.get(Task, uuid.UUID(tid)) for tid in task_ids) if t]
+
+        task_status = {t.action_item_id: t.status for t in tasks if t.action_item_id}
+        if task_status:
+            for item in db.execute(
+                select(ActionItem).where(ActionItem.id.in_(list(task_status)))
+            ).scalars().all():
+                item.status = (
+                    ActionItemStatus.DONE
+                    if task_status[item.id] == TaskStatus.COMPLETED
+                    else ActionItemStatus.OPEN
+                )
+
+        completed = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
+
+        _emit_event(db, project_id, "EXECUTION_BATCH_COMPLETED", {
+            "thread_id": thread_id,
+            "tasks_executed": len(task_ids),
+            "tasks_completed": completed,
+            "tasks_failed": len(tasks) - completed,
+            "task_ids": task_ids,
+        })
+
+        # Write execution summary as a message if we have a thread
+        if thread_id:
+            summary_parts = [f"**Execution complete.** {len(task_ids)} tasks executed:"]
+            for t in tasks:
+                status_icon = "done" if t.status == TaskStatus.COMPLETED else "failed"
+                summary_parts.append(f"- [{status_icon}] {t.title}")
+            summary = "\n".join(summary_parts)
+            msg = Message(
+                thread_id=uuid.UUID(thread_id),
+                author_type=AuthorType.SYSTEM,
+                content=summary,
+            )
+            db.add(msg)
+        db.commit()
+
+        return {"status": "completed", "tasks_executed": len(task_ids), "tasks_completed": completed}
     finally:
         db.close()
 
 
 @celery.task(name="app.workers.executor.execute_action_items", bind=True)
-def execute_action_items(self, project_id: str, thread_id: str | None = None) -> dict[str, Any]:
-    """Convert open ActionItems into Tasks and execute them sequentially."""
+def execute_action_items(
+    self,
+    project_id: str,
+    thread_id: str | None = None,
+    parallel: bool = True,
+) -> dict[str, Any]:
+    """Convert open ActionItems into Tasks and fan them out as separate jobs.
+
+    Items run wave by wave following their ``depends_on`` graph; items in the
+    same wave execute concurrently on whatever workers are free.  With
+    ``parallel=False`` every item waits for the previous one, reproducing the
+    old one-at-a-time behaviour.  ``finalize_execution_batch`` runs once all
+    tasks have finished.
+    """
     db = get_sync_db()
 
     try:
         query = select(ActionItem).where(
             ActionItem.project_id == uuid.UUID(project_id),
             ActionItem.status == ActionItemStatus.OPEN,
-        )
+        ).order_by(ActionItem.created_at)
         items = db.execute(query).scalars().all()
 
         if not items:
             return {"status": "no_items", "count": 0}
 
+        waves = _plan_waves(items) if parallel else [[item] for item in items]
+
         _emit_event(db, project_id, "EXECUTION_BATCH_STARTED", {
             "action_item_count": len(items),
             "thread_id": thread_id,
+            "waves": len(waves),
+            "parallel": parallel,
         })
 
+        task_for_item: dict[str, str] = {}
         task_ids: list[str] = []
 
         for item in items:
@@ -336,6 +555,7 @@ def execute_action_items(self, project_id: str, thread_id: str | None = None) ->
             task_type = _ROLE_TASK_TYPE.get(role_str, TaskType.DOCUMENT)
 
             task = Task(
+                id=uuid.uuid4(),
                 project_id=uuid.UUID(project_id),
                 agent_role=item.owner_role,
                 title=f"Execute: {item.description[:80]}",
@@ -347,50 +567,44 @@ def execute_action_items(self, project_id: str, thread_id: str | None = None) ->
                 workspace_dir=settings.agent_workspace_dir,
             )
             db.add(task)
-            db.commit()
-            db.refresh(task)
-
             item.status = ActionItemStatus.IN_PROGRESS
-            db.commit()
 
-            tid = str(task.id)
-            task_ids.append(tid)
+            task_for_item[str(item.id)] = str(task.id)
+            task_ids.append(str(task.id))
 
-            # Execute synchronously within this worker to maintain ordering
-            execute_task(tid)
+        db.commit()
 
-            # Mark the action item done
-            db.refresh(item)
-            item.status = ActionItemStatus.DONE
-            db.commit()
+        stages = []
+        for wave in waves:
+            sigs = []
+            for item in wave:
+                prereqs = (
+                    [task_for_item[d] for d in (item.depends_on or []) if d in task_for_item]
+                    if parallel else []
+                )
+                sigs.append(execute_batch_task.si(task_for_item[str(item.id)], prereqs))
+            stages.append(group(sigs))
 
-        _emit_event(db, project_id, "EXECUTION_BATCH_COMPLETED", {
-            "tasks_executed": len(task_ids),
-            "task_ids": task_ids,
-        })
+        workflow = chain(
+            *stages,
+            finalize_execution_batch.si(project_id, task_ids, thread_id),
+        ).apply_async()
 
-        # Write execution summary as a message if we have a thread
-        if thread_id:
-            summary_parts = [f"**Execution complete.** {len(task_ids)} tasks executed:"]
-            for tid in task_ids:
-                t = db.get(Task, uuid.UUID(tid))
-                if t:
-                    status_icon = "done" if t.status == TaskStatus.COMPLETED else "failed"
-                    summary_parts.append(f"- [{status_icon}] {t.title}")
-            summary = "\n".join(summary_parts)
-            msg = Message(
-                thread_id=uuid.UUID(thread_id),
-                author_type=AuthorType.SYSTEM,
-                content=summary,
-            )
-            db.add(msg)
-            db.commit()
-
-        return {"status": "completed", "tasks_executed": len(task_ids)}
+        return {
+            "status": "dispatched",
+            "tasks": len(task_ids),
+            "waves": len(waves),
+            "workflow_id": workflow.id,
+        }
 
     except Exception as exc:
         logger.exception("execute_action_items_failed", project_id=project_id)
-        _emit_event(db, project_id, "EXECUTION_BATCH_FAILED", {"error": str(exc)})
+        db.rollback()
+        _emit_event(db, project_id, "EXECUTION_BATCH_FAILED", {
+            "thread_id": thread_id,
+            "error": str(exc),
+        })
+        db.commit()
         raise
     finally:
         db.close()
@@ -3,38 +3,61 @@
 Rounds:
   0 — Context ingestion (system summarises user prompt + project state)
   1 — PM proposes feature ideas + PRD outline
-  2 — Engineer critiques feasibility, risks, estimates
-  3 — Designer critiques UX, suggests flows
-  4 — Analyst defines metrics / experiments
+  2 — Engineer critiques feasibility, risks, estimates   ┐
+  3 — Designer critiques UX, suggests flows              ├ run concurrently
+  4 — Analyst defines metrics / experiments              ┘
   5 — PM reconciles into decisions + action items
   6 — CEO reviews decisions and approves/rejects
   Final — Memo writer generates the investor-style memo
   (optional) — Auto-execute approved action items
+
+Every successful round (and the memo) is stored as a ``MeetingCheckpoint``
+on the thread.  The pipeline stops after the first stage with a failed
+round, so no later round is ever checkpointed on top of a missing input.  A
+retried or resumed pipeline skips checkpointed rounds and continues with the
+first round that has none.
+
+Only one pipeline runs per thread: the API claims a Redis lock
+(``claim_meeting``) before it enqueues one and answers 409 while the lock is
+held.  The pipeline keeps the lock alive while it runs and through a pending
+retry, and releases it once it has completed or given up.
+
+With ``OPENCLAW_SESSION_CONTINUITY`` each role keeps one OpenClaw session per
+thread (``AgentSession``); its later turns are sent only the rounds it has
+not seen yet instead of the whole transcript.
+
+Events are staged with ``_emit_event`` in the same transaction as the state
+they describe, and the pipeline commits once per step (start, each stage's
+launch, each finished round, the memo).  The outbox relay publishes them.
 """
 
 from __future__ import annotations
 
-import json
 import re
 import subprocess
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
+import redis
 import structlog
 from sqlalchemy import select
 
+from app.config import settings
 from app.database import get_sync_db
 from app.models import (
     ActionItem,
     ActionItemStatus,
     Agent,
     AgentRole,
+    AgentSession,
     AgentStatus,
     AuthorType,
     Decision,
     DecisionStatus,
     Event,
+    MeetingCheckpoint,
     Memo,
     Message,
     Project,
@@ -42,7 +65,10 @@ from app.models import (
 )
 from app.openclaw import get_openclaw_client
 from app.openclaw.base import AgentResult
+from app.redis_client import get_redis
 from app.workers.celery_app import celery
+from app.workers.context import MeetingContext, estimate_tokens
+from app.workers.streaming import DeltaPublisher
 
 logger = structlog.get_logger(__name__)
 
@@ -82,22 +108,26 @@ def _send_imessage(phone_number: str, body: str) -> None:
         logger.error("imessage_send_failed", error=str(exc))
 
 
+# ``depends_on`` lists the earlier rounds whose outputs a round reads.  Rounds
+# whose dependencies are all satisfied run concurrently; their outputs are
+# merged back in round order.
 ROUND_CONFIG: list[dict[str, Any]] = [
     {
         "round": 0,
         "label": "Context Ingestion",
         "role": None,
+        "depends_on": [],
         "instruction_template": (
             "Summarise the following user prompt and any existing project context "
             "into a concise brief that the product team can work from.\n\n"
-            "User prompt: {prompt}\n\n"
-            "Project context: {context}"
+            "{context}"
         ),
     },
     {
         "round": 1,
         "label": "PM — Feature Proposal & PRD",
         "role": AgentRole.PM,
+        "depends_on": [0],
         "instruction_template": (
             "You are the Product Manager. Based on the brief below, propose "
             "concrete feature ideas and write a PRD outline covering: problem, "
@@ -109,6 +139,7 @@ ROUND_CONFIG: list[dict[str, Any]] = [
         "round": 2,
         "label": "Engineer — Feasibility & Risks",
         "role": AgentRole.ENGINEER,
+        "depends_on": [1],
         "instruction_template": (
             "You are the Staff Engineer. Review the PM's proposal below and "
             "provide a feasibility analysis: technical risks, architecture "
@@ -120,6 +151,7 @@ ROUND_CONFIG: list[dict[str, Any]] = [
         "round": 3,
         "label": "Designer — UX Critique & Flows",
         "role": AgentRole.DESIGNER,
+        "depends_on": [1],
         "instruction_template": (
             "You are the Lead Designer. Review the discussion so far and "
             "critique the UX: user flows, accessibility, information architecture, "
@@ -131,6 +163,7 @@ ROUND_CONFIG: list[dict[str, Any]] = [
         "round": 4,
         "label": "Analyst — Metrics & Experiments",
         "role": AgentRole.ANALYST,
+        "depends_on": [1],
         "instruction_template": (
             "You are the Data Analyst. Based on the discussion, define success "
             "metrics, KPIs, experiment designs (A/B tests), and data requirements.\n\n"
@@ -141,11 +174,15 @@ ROUND_CONFIG: list[dict[str, Any]] = [
         "round": 5,
         "label": "PM — Reconciliation",
         "role": AgentRole.PM,
+        "depends_on": [0, 1, 2, 3, 4],
         "instruction_template": (
             "You are the Product Manager wrapping up. Synthesize all feedback "
             "into:\n"
             "1. DECISIONS (format each as 'DECISION: <title> | <rationale>')\n"
-            "2. ACTION_ITEMS (format each as 'ACTION: <owner_role> | <description>')\n\n"
+            "2. ACTION_ITEMS (format each as 'ACTION: <owner_role> | <description>'). "
+            "If an action item cannot start until earlier ones finish, append "
+            "'| after: <n>, <m>' using the 1-based numbers of those earlier "
+            "ACTION lines; otherwise leave it off so items can run in parallel.\n\n"
             "Discussion:\n{context}"
         ),
     },
@@ -153,6 +190,7 @@ ROUND_CONFIG: list[dict[str, Any]] = [
         "round": 6,
         "label": "CEO — Review & Approval",
         "role": AgentRole.CEO,
+        "depends_on": [0, 1, 2, 3, 4, 5],
         "instruction_template": (
             "You are the CEO. Review the decisions and action items proposed by "
             "the team. For each decision, state either:\n"
@@ -167,45 +205,63 @@ ROUND_CONFIG: list[dict[str, Any]] = [
 ]
 
 
+# Checkpoint slot for the memo-writer step that follows the last round.
+MEMO_ROUND = len(ROUND_CONFIG)
+
+
+class RoundFailedError(RuntimeError):
+    """An agent turn of a meeting round failed; later rounds must not run on its output."""
+
+
+def _meeting_lock_key(thread_id: str) -> str:
+    return f"meeting:{thread_id}:pipeline"
+
+
+def _meeting_lock_ttl() -> int:
+    # Long enough for one stage of agent turns, or the wait before a retry
+    return settings.openclaw_timeout_seconds * 4 + 300
+
+
+def claim_meeting(thread_id: str) -> bool:
+    """Claim the thread for a new pipeline run; False if one is already in flight."""
+    return bool(get_redis().set(_meeting_lock_key(thread_id), "queued", nx=True, ex=_meeting_lock_ttl()))
+
+
+def release_meeting(thread_id: str) -> None:
+    try:
+        get_redis().delete(_meeting_lock_key(thread_id))
+    except redis.RedisError as exc:
+        logger.warning("meeting_lock_release_failed", thread_id=thread_id, error=str(exc))
+
+
+def _hold_meeting(thread_id: str) -> None:
+    """Take over or extend the thread's lock while the pipeline works."""
+    try:
+        get_redis().set(_meeting_lock_key(thread_id), "running", ex=_meeting_lock_ttl())
+    except redis.RedisError as exc:
+        logger.warning("meeting_lock_refresh_failed", thread_id=thread_id, error=str(exc))
+
+
 def _emit_event(
     db: Any,
     project_id: str,
     event_type: str,
     payload: dict[str, Any],
 ) -> Event:
+    """Stage an event in the current transaction.
+
+    It is committed with the state change it describes and published by the
+    outbox relay (``app.workers.outbox``) once committed.
+    """
     event = Event(
         project_id=uuid.UUID(project_id),
         type=event_type,
         payload_json=payload,
     )
     db.add(event)
-    db.commit()
-    db.refresh(event)
-
-    _publish_event_to_redis(project_id, event)
     return event
 
 
-def _publish_event_to_redis(project_id: str, event: Event) -> None:
-    """Push event to Redis pub/sub so WebSocket subscribers get it."""
-    try:
-        import redis as redis_lib
-        from app.config import settings
-
-        r = redis_lib.Redis.from_url(settings.redis_url)
-        r.publish(
-            f"project:{project_id}:events",
-            json.dumps({
-                "id": str(event.id),
-                "type": event.type,
-                "payload_json": event.payload_json,
-                "created_at": event.created_at.isoformat() if event.created_at else None,
-            }),
-        )
-    except Exception as exc:
-        logger.warning("redis_publish_failed", error=str(exc))
-
-
 def _add_message(
     db: Any,
     thread_id: str,
@@ -220,8 +276,6 @@ def _add_message(
         content=content,
     )
     db.add(msg)
-    db.commit()
-    db.refresh(msg)
     return msg
 
 
@@ -238,14 +292,68 @@ def _get_agent_for_role(db: Any, project_id: str, role: AgentRole) -> Agent | No
 def _set_agent_status(db: Any, agent: Agent, status: AgentStatus) -> None:
     agent.status = status
     db.add(agent)
-    db.commit()
 
 
-def _build_context(messages: list[str], max_chars: int = 12000) -> str:
-    combined = "\n\n---\n\n".join(messages)
-    if len(combined) > max_chars:
-        combined = combined[-max_chars:]
-    return combined
+def _get_agent_session(
+    db: Any,
+    thread_id: str,
+    role: str,
+    agent: Agent | None,
+) -> AgentSession:
+    """The thread's OpenClaw session for ``role``, created on first use."""
+    session = db.execute(
+        select(AgentSession).where(
+            AgentSession.thread_id == uuid.UUID(thread_id),
+            AgentSession.role == role,
+        )
+    ).scalars().first()
+    if session is None:
+        session = AgentSession(
+            thread_id=uuid.UUID(thread_id),
+            agent_id=agent.id if agent else None,
+            role=role,
+            session_id=str(uuid.uuid4()),
+            rounds_seen=[],
+            turns=0,
+        )
+        db.add(session)
+    return session
+
+
+def _load_checkpoints(db: Any, thread_id: str) -> dict[int, MeetingCheckpoint]:
+    rows = db.execute(
+        select(MeetingCheckpoint).where(MeetingCheckpoint.thread_id == uuid.UUID(thread_id))
+    ).scalars().all()
+    return {cp.round: cp for cp in rows}
+
+
+def _plan_stages(rounds: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Group rounds into stages whose members only depend on earlier stages."""
+    stages: list[list[dict[str, Any]]] = []
+    done: set[int] = set()
+    remaining = sorted(rounds, key=lambda rc: rc["round"])
+
+    while remaining:
+        ready = [rc for rc in remaining if set(rc.get("depends_on", [])) <= done]
+        if not ready:
+            raise ValueError(
+                f"Unsatisfiable round dependencies: {[rc['round'] for rc in remaining]}"
+            )
+        stages.append(ready)
+        done.update(rc["round"] for rc in ready)
+        remaining = [rc for rc in remaining if rc["round"] not in done]
+
+    return stages
+
+
+def _run_agents_concurrently(client: Any, calls: list[dict[str, Any]]) -> list[AgentResult]:
+    """Invoke ``client.run_agent`` for each kwargs dict, preserving order."""
+    if len(calls) == 1:
+        return [client.run_agent(**calls[0])]
+
+    workers = max(1, min(len(calls), settings.meeting_max_parallel_rounds))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="meeting-round") as pool:
+        return list(pool.map(lambda kwargs: client.run_agent(**kwargs), calls))
 
 
 def _parse_decisions(
@@ -266,8 +374,6 @@ def _parse_decisions(
         )
         db.add(d)
         decisions.append(d)
-    if decisions:
-        db.commit()
     return decisions
 
 
@@ -285,19 +391,32 @@ def _parse_action_items(
         "analyst": AgentRole.ANALYST,
     }
     items = []
+    prerequisites: list[list[int]] = []
     for match in re.finditer(r"ACTION:\s*(\w+)\s*\|\s*(.+)", text):
         role_str = match.group(1).strip().lower()
         role = role_map.get(role_str, AgentRole.PM)
+        description = match.group(2).strip()
+        after: list[int] = []
+        dep_match = re.search(r"\|\s*after:\s*([\d,\s]+)$", description, re.IGNORECASE)
+        if dep_match:
+            description = description[:dep_match.start()].strip()
+            after = [int(n) for n in re.findall(r"\d+", dep_match.group(1))]
         ai = ActionItem(
+            id=uuid.uuid4(),
             project_id=uuid.UUID(project_id),
             owner_role=role,
-            description=match.group(2).strip(),
+            description=description,
             status=ActionItemStatus.OPEN,
         )
         db.add(ai)
         items.append(ai)
-    if items:
-        db.commit()
+        prerequisites.append(after)
+
+    # Resolve "after: <n>" references to earlier items only, so the
+    # dependency graph built by the executor is always acyclic.
+    for idx, (ai, after) in enumerate(zip(items, prerequisites)):
+        ai.depends_on = [str(items[n - 1].id) for n in after if 1 <= n <= idx]
+
     return items
 
 
@@ -324,7 +443,6 @@ def _parse_ceo_approvals(db: Any, project_id: str, text: str) -> dict[str, str]:
                 )
                 break
 
-    db.commit()
     return updates
 
 
@@ -335,101 +453,200 @@ def run_meeting_pipeline(
     thread_id: str,
     prompt: str,
     auto_execute: bool = False,
+    resume: bool = False,
 ) -> dict[str, Any]:
     db = get_sync_db()
     client = get_openclaw_client()
-    round_outputs: list[str] = []
-
-    _emit_event(db, project_id, "SESSION_STARTED", {
-        "thread_id": thread_id,
-        "prompt": prompt,
-        "auto_execute": auto_execute,
-    })
+    _hold_meeting(thread_id)
 
-    _add_message(db, thread_id, AuthorType.USER, prompt)
+    checkpoints = _load_checkpoints(db, thread_id)
+    meeting_context = MeetingContext(prompt)
+    for r, cp in sorted(checkpoints.items()):
+        if r != MEMO_ROUND:
+            meeting_context.add(r, cp.label, cp.output)
 
-    try:
-        for rc in ROUND_CONFIG:
-            round_num = rc["round"]
-            label = rc["label"]
-            role: AgentRole | None = rc["role"]
-
-            _emit_event(db, project_id, "ROUND_STARTED", {
-                "round": round_num,
-                "label": label,
-                "role": role.value if role else "system",
-            })
-
-            context = _build_context([prompt] + round_outputs)
-            instruction = rc["instruction_template"].format(
-                prompt=prompt,
-                context=context,
-            )
+    if resume or checkpoints or self.request.retries:
+        _emit_event(db, project_id, "SESSION_RESUMED", {
+            "thread_id": thread_id,
+            "completed_rounds": sorted(checkpoints),
+            "attempt": self.request.retries,
+        })
+    else:
+        _emit_event(db, project_id, "SESSION_STARTED", {
+            "thread_id": thread_id,
+            "prompt": prompt,
+            "auto_execute": auto_execute,
+        })
 
-            agent: Agent | None = None
-            agent_id_str: str | None = None
+        _add_message(db, thread_id, AuthorType.USER, prompt)
+    db.commit()
 
-            if role:
-                agent = _get_agent_for_role(db, project_id, role)
-                if agent:
-                    agent_id_str = str(agent.id)
-                    _set_agent_status(db, agent, AgentStatus.RUNNING)
-
-            extra_config = {}
-            if agent and agent.config_json:
-                extra_config = dict(agent.config_json)
-
-            tool_profile = extra_config.pop("tool_profile", "full")
-            model = extra_config.pop("model", "")
-
-            result: AgentResult = client.run_agent(
-                role=role.value if role else "system",
-                instruction=instruction,
-                context=context,
-                tool_profile=tool_profile,
-                model=model,
-                extra_config=extra_config,
-            )
+    try:
+        for stage in _plan_stages(ROUND_CONFIG):
+            stage = [rc for rc in stage if rc["round"] not in checkpoints]
+            if not stage:
+                continue
+            _hold_meeting(thread_id)
+
+            # Database work stays on this thread; only the agent turns of
+            # independent rounds run in parallel.
+            prepared: list[tuple[dict[str, Any], Agent | None, str | None, AgentSession | None]] = []
+            calls: list[dict[str, Any]] = []
+
+            for rc in stage:
+                round_num = rc["round"]
+                label = rc["label"]
+                role: AgentRole | None = rc["role"]
+
+                _emit_event(db, project_id, "ROUND_STARTED", {
+                    "thread_id": thread_id,
+                    "round": round_num,
+                    "label": label,
+                    "role": role.value if role else "system",
+                })
 
-            if agent:
-                _set_agent_status(
-                    db, agent,
-                    AgentStatus.IDLE if result.success else AgentStatus.ERROR,
+                agent: Agent | None = None
+                agent_id_str: str | None = None
+
+                if role:
+                    agent = _get_agent_for_role(db, project_id, role)
+                    if agent:
+                        agent_id_str = str(agent.id)
+                        _set_agent_status(db, agent, AgentStatus.RUNNING)
+
+                session: AgentSession | None = None
+                seen: set[int] = set()
+                if settings.openclaw_session_continuity:
+                    session = _get_agent_session(db, thread_id, role.value if role else "system", agent)
+                    seen = set(session.rounds_seen or [])
+
+                context = meeting_context.build(rc["depends_on"], role.value if role else "system", seen)
+                instruction = rc["instruction_template"].format(
+                    prompt=prompt,
+                    context=context,
                 )
 
-            _emit_event(db, project_id, "AGENT_RESPONSE", {
-                "round": round_num,
-                "role": role.value if role else "system",
-                "agent_id": agent_id_str,
-                "success": result.success,
-                "output_preview": result.output[:500],
-                "tool_logs": result.tool_logs[:20],
-                "error": result.error or None,
-            })
+                extra_config = {}
+                if agent and agent.config_json:
+                    extra_config = dict(agent.config_json)
+
+                tool_profile = extra_config.pop("tool_profile", "full")
+                model = extra_config.pop("model", "")
+
+                prepared.append((rc, agent, agent_id_str, session))
+                calls.append({
+                    "role": role.value if role else "system",
+                    "instruction": instruction,
+                    "context": context,
+                    "session_id": session.session_id if session else None,
+                    "continued": bool(seen),
+                    "tool_profile": tool_profile,
+                    "model": model,
+                    "extra_config": extra_config,
+                    "on_output": DeltaPublisher(project_id, {
+                        "thread_id": thread_id,
+                        "round": round_num,
+                        "role": role.value if role else "system",
+                        "agent_id": agent_id_str,
+                    }),
+                })
 
-            author_type = AuthorType.AGENT if role else AuthorType.SYSTEM
-            _add_message(db, thread_id, author_type, result.output, agent_id_str)
-            round_outputs.append(f"[{label}]\n{result.output}")
+            # ROUND_STARTED events, agent statuses and new sessions
+            db.commit()
 
-            # PM reconciliation: extract decisions and action items
-            if round_num == 5 and result.success:
-                _parse_decisions(db, project_id, thread_id, result.output)
-                _parse_action_items(db, project_id, result.output)
+            results = _run_agents_concurrently(client, calls)
+            for call in calls:
+                call["on_output"].flush()
+            failed: list[tuple[int, str]] = []
 
-            # CEO review: approve/reject decisions
-            if round_num == 6 and result.success:
-                approvals = _parse_ceo_approvals(db, project_id, result.output)
-                _emit_event(db, project_id, "CEO_REVIEW_COMPLETED", {
-                    "approvals": approvals,
+            for (rc, agent, agent_id_str, session), call, result in zip(prepared, calls, results):
+                round_num = rc["round"]
+                label = rc["label"]
+                role = rc["role"]
+
+                if agent:
+                    _set_agent_status(
+                        db, agent,
+                        AgentStatus.IDLE if result.success else AgentStatus.ERROR,
+                    )
+
+                _emit_event(db, project_id, "AGENT_RESPONSE", {
+                    "thread_id": thread_id,
+                    "round": round_num,
+                    "role": role.value if role else "system",
+                    "agent_id": agent_id_str,
+                    "success": result.success,
+                    "cached": result.cached,
+                    "queue_wait_seconds": result.queue_wait_seconds,
+                    "execution_seconds": result.execution_seconds,
+                    "context_tokens": estimate_tokens(call["context"]),
+                    "prompt_bytes": result.prompt_bytes,
+                    "session_id": result.session_id,
+                    "continued": call["continued"],
+                    "output_preview": result.output[:500],
+                    "tool_logs": result.tool_logs[:20],
+                    "error": result.error or None,
                 })
 
-            _emit_event(db, project_id, "ROUND_ENDED", {
-                "round": round_num,
-                "label": label,
-            })
+                meeting_context.add(round_num, label, result.output)
+
+                # Failed turns are not checkpointed so a resume retries them.
+                # The checkpoint is committed together with the round's
+                # message and events.
+                if result.success:
+                    if session is not None:
+                        session.rounds_seen = sorted(
+                            set(session.rounds_seen or []) | set(rc["depends_on"]) | {round_num}
+                        )
+                        session.turns += 1
+                    db.add(MeetingCheckpoint(
+                        thread_id=uuid.UUID(thread_id),
+                        round=round_num,
+                        label=label,
+                        role=role.value if role else "system",
+                        output=result.output,
+                    ))
+
+                # PM reconciliation: extract decisions and action items
+                if round_num == 5 and result.success:
+                    _parse_decisions(db, project_id, thread_id, result.output)
+                    _parse_action_items(db, project_id, result.output)
+
+                author_type = AuthorType.AGENT if role else AuthorType.SYSTEM
+                _add_message(db, thread_id, author_type, result.output, agent_id_str)
+
+                # CEO review: approve/reject decisions
+                if round_num == 6 and result.success:
+                    approvals = _parse_ceo_approvals(db, project_id, result.output)
+                    _emit_event(db, project_id, "CEO_REVIEW_COMPLETED", {
+                        "thread_id": thread_id,
+                        "approvals": approvals,
+                    })
+
+                _emit_event(db, project_id, "ROUND_ENDED", {
+                    "thread_id": thread_id,
+                    "round": round_num,
+                    "label": label,
+                })
+                db.commit()
+                if not result.success:
+                    failed.append((round_num, result.error))
+
+            # The other rounds of this stage are checkpointed; the failed
+            # ones, and everything after them, run again on retry or resume.
+            if failed:
+                raise RoundFailedError(
+                    "; ".join(f"round {r} failed: {error or 'no output'}" for r, error in failed)
+                )
 
         # Final: generate memo
-        memo_content = _generate_memo(db, client, project_id, thread_id, prompt, round_outputs)
+        if MEMO_ROUND in checkpoints:
+            memo_content = checkpoints[MEMO_ROUND].output
+        else:
+            _hold_meeting(thread_id)
+            memo_content = _generate_memo(
+                db, client, project_id, thread_id, meeting_context,
+            )
 
         _emit_event(db, project_id, "SESSION_COMPLETED", {
             "thread_id": thread_id,
@@ -443,33 +660,36 @@ def run_meeting_pipeline(
             _emit_event(db, project_id, "AUTO_EXECUTION_TRIGGERED", {
                 "thread_id": thread_id,
             })
+        db.commit()
+        release_meeting(thread_id)
+        if auto_execute:
             execute_action_items.delay(project_id, thread_id)
 
         return {"status": "completed", "thread_id": thread_id, "auto_execute": auto_execute}
 
     except Exception as exc:
         logger.exception("meeting_pipeline_failed", project_id=project_id)
+        will_retry = self.request.retries < self.max_retries
+        db.rollback()
         _emit_event(db, project_id, "SESSION_FAILED", {
             "thread_id": thread_id,
             "error": str(exc),
+            "will_retry": will_retry,
         })
+        db.commit()
+        # A pending retry keeps the thread claimed; a final failure frees it
+        if will_retry:
+            _hold_meeting(thread_id)
+        else:
+            release_meeting(thread_id)
         raise self.retry(exc=exc, countdown=30)
     finally:
         db.close()
 
 
-def _generate_memo(
-    db: Any,
-    client: Any,
-    project_id: str,
-    thread_id: str,
-    prompt: str,
-    round_outputs: list[str],
-) -> str:
-    """Run the memo-writer agent to produce an investor-style memo."""
-    context = _build_context(round_outputs, max_chars=16000)
-
-    instruction = (
+def _memo_instruction(context: str) -> str:
+    """Memo-writer instruction around the meeting transcript (which opens with the prompt)."""
+    return (
         "You are the Memo Writer. Produce an investor-style memo in Markdown "
         "summarizing what the product team discussed and decided. Use this exact structure:\n\n"
         "# <Title> — <date>\n\n"
@@ -486,45 +706,74 @@ def _generate_memo(
         "## Metrics to Watch\n"
         "(KPIs and success metrics)\n\n"
         "---\n\n"
-        f"Original prompt: {prompt}\n\n"
         f"Discussion transcript:\n{context}"
     )
 
+
+def _generate_memo(
+    db: Any,
+    client: Any,
+    project_id: str,
+    thread_id: str,
+    meeting_context: MeetingContext,
+) -> str:
+    """Run the memo-writer agent to produce an investor-style memo."""
+    context = meeting_context.build(meeting_context.rounds, "memo_writer")
+
+    instruction = _memo_instruction(context)
+
     _emit_event(db, project_id, "MEMO_GENERATION_STARTED", {"thread_id": thread_id})
+    db.commit()
 
+    publisher = DeltaPublisher(project_id, {"thread_id": thread_id, "role": "memo_writer"})
     result = client.run_agent(
         role="memo_writer",
         instruction=instruction,
         context=context,
+        on_output=publisher,
     )
+    publisher.flush()
 
     if not result.success:
         logger.error("memo_generation_failed", error=result.error)
-        _emit_event(db, project_id, "MEMO_GENERATION_FAILED", {"error": result.error})
+        _emit_event(db, project_id, "MEMO_GENERATION_FAILED", {
+            "thread_id": thread_id,
+            "error": result.error,
+        })
+        db.commit()
         return ""
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     title = f"Product Team Memo — {today}"
 
     memo = Memo(
+        id=uuid.uuid4(),
         project_id=uuid.UUID(project_id),
         title=title,
         content_markdown=result.output,
+        size_bytes=len(result.output.encode()),
+        executive_summary=_extract_executive_summary(result.output),
     )
     db.add(memo)
-    db.commit()
-    db.refresh(memo)
+    db.add(MeetingCheckpoint(
+        thread_id=uuid.UUID(thread_id),
+        round=MEMO_ROUND,
+        label="Memo",
+        role="memo_writer",
+        output=result.output,
+    ))
 
     _add_message(db, thread_id, AuthorType.SYSTEM, f"Memo generated: {title}")
 
     _emit_event(db, project_id, "MEMO_GENERATION_COMPLETED", {
+        "thread_id": thread_id,
         "memo_id": str(memo.id),
         "title": title,
     })
+    db.commit()
 
     project = db.get(Project, uuid.UUID(project_id))
     if project and project.notify_phone:
-        summary = _extract_executive_summary(result.output)
-        _send_imessage(project.notify_phone, f"{title}\n\n{summary}")
+        _send_imessage(project.notify_phone, f"{title}\n\n{memo.executive_summary}")
 
     return result.output
@@ -0,0 +1,96 @@
+"""Outbox relay: publish committed events to Redis.
+
+Workers stage ``Event`` rows in the same transaction as the state change
+they describe and never publish them directly.  The relay claims the oldest
+unpublished rows (``published_at IS NULL``) in batches of
+``OUTBOX_BATCH_SIZE`` with ``FOR UPDATE SKIP LOCKED``, publishes the batch in
+one pipelined round trip and marks it published in the same transaction.
+
+Delivery is at least once: if Redis accepts a batch but the commit fails,
+the batch is published again on the next pass, so subscribers should treat
+event ids as idempotency keys.  If Redis is down, events simply wait in the
+table.  Several relays can run side by side without claiming the same rows,
+but only a single relay guarantees that a project's events arrive in order.
+
+    python -m app.workers.outbox
+"""
+
+from __future__ import annotations
+
+import signal
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+import structlog
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import get_sync_db
+from app.events import event_message, publish_batch
+from app.models import Event
+
+logger = structlog.get_logger(__name__)
+
+
+def relay_once(db: Any, batch_size: int | None = None) -> int:
+    """Publish one batch of pending events; return how many were sent."""
+    events = db.execute(
+        select(Event)
+        .where(Event.published_at.is_(None))
+        .order_by(Event.created_at, Event.id)
+        .limit(batch_size or settings.outbox_batch_size)
+        .with_for_update(skip_locked=True)
+    ).scalars().all()
+    if not events:
+        db.rollback()
+        return 0
+
+    now = datetime.now(timezone.utc)
+    publish_batch(
+        [(str(e.project_id), event_message(e)) for e in events],
+        [max(0.0, (now - e.created_at).total_seconds() * 1000) for e in events],
+    )
+    for event in events:
+        event.published_at = now
+    db.commit()
+    return len(events)
+
+
+def run(poll_interval: float | None = None, batch_size: int | None = None) -> None:
+    """Relay until SIGTERM/SIGINT, backing off while Redis or Postgres is down."""
+    poll_interval = settings.outbox_poll_interval_seconds if poll_interval is None else poll_interval
+    batch_size = batch_size or settings.outbox_batch_size
+    stopping = False
+
+    def _stop(*_: Any) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    logger.info("outbox_relay_started", poll_interval=poll_interval, batch_size=batch_size)
+    db = get_sync_db()
+    backoff = poll_interval
+    try:
+        while not stopping:
+            try:
+                sent = relay_once(db, batch_size)
+                backoff = poll_interval
+            except Exception as exc:
+                db.rollback()
+                logger.warning("outbox_relay_failed", error=str(exc), retry_in=backoff)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+                continue
+            # A full batch means more are probably waiting
+            if sent < batch_size:
+                time.sleep(poll_interval)
+    finally:
+        db.close()
+        logger.info("outbox_relay_stopped")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,75 @@
+"""Live agent output for the dashboard.
+
+``DeltaPublisher`` is passed as the ``on_output`` callback of
+``OpenClawClient.run_agent``.  It buffers the text deltas of a running turn
+and publishes them as ``AGENT_OUTPUT_DELTA`` messages on the project's
+Redis channel (through ``app.events``) at most once per
+``OPENCLAW_STREAM_INTERVAL_SECONDS``.
+
+Deltas are ephemeral: they go to live subscribers only and are not stored
+as ``Event`` rows; the final output still arrives with ``AGENT_RESPONSE``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from app.config import settings
+from app.events import publish
+
+
+class DeltaPublisher:
+    """Throttled ``AGENT_OUTPUT_DELTA`` publisher for one agent turn."""
+
+    def __init__(
+        self,
+        project_id: str,
+        payload: dict[str, Any],
+        interval: float | None = None,
+    ):
+        self.project_id = project_id
+        self.payload = payload
+        self.interval = settings.openclaw_stream_interval_seconds if interval is None else interval
+        self._lock = threading.Lock()
+        self._buffer: list[str] = []
+        self._last_flush = 0.0
+        self._seq = 0
+        self._offset = 0
+
+    def __call__(self, delta: str) -> None:
+        with self._lock:
+            self._buffer.append(delta)
+            if time.monotonic() - self._last_flush >= self.interval:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Publish whatever is still buffered (call once the turn ends)."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        text = "\n".join(self._buffer)
+        self._buffer.clear()
+
+        message = {
+            "id": str(uuid.uuid4()),
+            "type": "AGENT_OUTPUT_DELTA",
+            "payload_json": {
+                **self.payload,
+                "seq": self._seq,
+                "offset": self._offset,
+                "delta": text,
+            },
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._seq += 1
+        self._offset += len(text) + 1
+
+        publish(self.project_id, message)
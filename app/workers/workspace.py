@@ -0,0 +1,324 @@
+"""Per-task git worktrees for file-modifying agents.
+
+Tasks for roles that edit files (``RoleConfig.can_modify_files``) get their
+own git worktree on a task branch, so concurrent engineer tasks never share
+a checkout.  Worktrees live under ``WORKTREE_ROOT``::
+
+    <root>/<repo-key>/REPO          path of the source repository
+    <root>/<repo-key>/pool/wt-*     warm, detached worktrees ready to claim
+    <root>/<repo-key>/active/<id>   worktree checked out for a running task
+
+Claiming a pooled worktree is a ``git worktree move`` plus a checkout of the
+task branch, which only touches files that changed since the pool was
+filled.  On completion leftover changes are committed to the task branch, and
+the branch is either merged into the repository's checked-out branch
+(``WORKTREE_MERGE=merge``, only for successful tasks and only when that
+checkout is clean) or left in place and reported; a retry of the task picks
+the kept branch up again.  Either way the worktree goes back to the pool.
+``gc_worktrees`` removes worktrees whose task is no longer running and tops
+the pools back up.
+
+All git operations on a repository are serialised with an ``fcntl`` lock, as
+git's own worktree bookkeeping is not safe under concurrent writers.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import shutil
+import subprocess
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from app.config import settings
+from app.database import get_sync_db
+from app.models import Task, TaskStatus
+from app.workers.celery_app import celery
+
+logger = structlog.get_logger(__name__)
+
+_GIT_IDENTITY = ["-c", "user.name=OpenClaw Agent", "-c", "user.email=openclaw@localhost"]
+
+
+class WorkspaceError(RuntimeError):
+    """A git operation needed to provision or finish a worktree failed."""
+
+
+def _git(args: list[str], cwd: str, check: bool = True) -> str:
+    proc = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if check and proc.returncode != 0:
+        raise WorkspaceError(f"git {' '.join(args)} failed: {proc.stderr.strip()}")
+    return proc.stdout.strip()
+
+
+def _repo_toplevel(path: str) -> str | None:
+    try:
+        return _git(["rev-parse", "--show-toplevel"], path) or None
+    except (WorkspaceError, OSError):
+        return None
+
+
+@dataclass
+class Worktree:
+    """A worktree checked out for one task."""
+
+    repo: str
+    path: str
+    branch: str
+    base: str
+    # Directory the agent works in: the worktree, or the matching subdirectory
+    workdir: str
+
+
+class WorktreeManager:
+    """Provision, finish and collect worktrees for one repository."""
+
+    def __init__(self, repo: str, root: str | None = None):
+        self.repo = repo
+        root = os.path.expanduser(root or settings.worktree_root)
+        key = f"{os.path.basename(repo)}-{hashlib.sha1(repo.encode()).hexdigest()[:8]}"
+        self.base_dir = os.path.join(root, key)
+        self.pool_dir = os.path.join(self.base_dir, "pool")
+        self.active_dir = os.path.join(self.base_dir, "active")
+        os.makedirs(self.pool_dir, exist_ok=True)
+        os.makedirs(self.active_dir, exist_ok=True)
+        with open(os.path.join(self.base_dir, "REPO"), "w") as fh:
+            fh.write(repo)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(os.path.join(self.base_dir, ".lock"), "w") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _pool_entries(self) -> list[str]:
+        return sorted(
+            os.path.join(self.pool_dir, name)
+            for name in os.listdir(self.pool_dir)
+            if name.startswith("wt-")
+        )
+
+    def acquire(self, task_id: str, workspace: str) -> Worktree:
+        """Check out a worktree on ``openclaw/task-<id>`` for the task.
+
+        A retried task gets back the worktree, or the branch kept from its
+        failed attempt, that it already had.
+        """
+        branch = f"openclaw/task-{task_id}"
+        path = os.path.join(self.active_dir, task_id)
+        relpath = os.path.relpath(os.path.realpath(workspace), os.path.realpath(self.repo))
+        started = time.monotonic()
+
+        with self._locked():
+            base = _git(["rev-parse", "HEAD"], self.repo)
+            kept = _git(["rev-parse", "--verify", "-q", f"refs/heads/{branch}"], self.repo, check=False)
+            if os.path.isdir(path):
+                base = _git(["merge-base", base, "HEAD"], path)
+                source = "existing"
+            else:
+                checkout = ["-f", branch] if kept else ["-f", "-B", branch, base]
+                if kept:
+                    base = _git(["merge-base", base, kept], self.repo)
+                pooled = self._pool_entries()
+                if pooled:
+                    _git(["worktree", "move", pooled[0], path], self.repo)
+                    _git(["checkout", *checkout], path)
+                    _git(["clean", "-fd"], path)
+                    source = "pool"
+                else:
+                    _git(["worktree", "add", *checkout[:-1], path, checkout[-1]], self.repo)
+                    source = "new"
+
+        worktree = Worktree(
+            repo=self.repo,
+            path=path,
+            branch=branch,
+            base=base,
+            workdir=os.path.normpath(os.path.join(path, relpath)),
+        )
+        logger.info(
+            "worktree_acquired",
+            task_id=task_id,
+            branch=branch,
+            source=source,
+            seconds=round(time.monotonic() - started, 3),
+        )
+        return worktree
+
+    def finish(self, worktree: Worktree, message: str, merge: bool = True) -> dict[str, Any]:
+        """Commit leftovers, merge or keep the branch, and release the worktree.
+
+        ``merge=False`` (a failed task) always keeps the branch.  Returns a
+        report with the branch, its commits and whether it was merged.
+        """
+        if _git(["status", "--porcelain"], worktree.path):
+            _git(["add", "-A"], worktree.path)
+            _git([*_GIT_IDENTITY, "commit", "-q", "-m", message], worktree.path)
+
+        head = _git(["rev-parse", "HEAD"], worktree.path)
+        commits = int(_git(["rev-list", "--count", f"{worktree.base}..{head}"], worktree.path))
+        report: dict[str, Any] = {
+            "branch": worktree.branch,
+            "base": worktree.base,
+            "head": head,
+            "commits": commits,
+            "merged": False,
+        }
+
+        with self._locked():
+            self._release(worktree)
+            if commits == 0:
+                _git(["branch", "-D", worktree.branch], self.repo, check=False)
+            elif merge and settings.worktree_merge == "merge":
+                report["merged"] = self._merge(worktree.branch)
+                if report["merged"]:
+                    _git(["branch", "-d", worktree.branch], self.repo, check=False)
+            report["into"] = _git(["symbolic-ref", "--short", "-q", "HEAD"], self.repo, check=False)
+        report["kept"] = commits > 0 and not report["merged"]
+
+        logger.info("worktree_finished", **report)
+        return report
+
+    def _release(self, worktree: Worktree) -> None:
+        """Detach the worktree and put it back in the pool, or remove it if the pool is full."""
+        if len(self._pool_entries()) >= settings.worktree_pool_size:
+            _git(["worktree", "remove", "--force", worktree.path], self.repo)
+            return
+        _git(["checkout", "-f", "--detach", _git(["rev-parse", "HEAD"], self.repo)], worktree.path)
+        _git(["clean", "-fd"], worktree.path)
+        _git(["worktree", "move", worktree.path, os.path.join(self.pool_dir, f"wt-{uuid.uuid4().hex[:12]}")], self.repo)
+
+    def _merge(self, branch: str) -> bool:
+        """Merge ``branch`` into the repository's checkout if that is safe."""
+        if not _git(["symbolic-ref", "-q", "HEAD"], self.repo, check=False):
+            logger.warning("worktree_merge_skipped", branch=branch, reason="detached HEAD")
+            return False
+        if _git(["status", "--porcelain", "--untracked-files=no"], self.repo):
+            logger.warning("worktree_merge_skipped", branch=branch, reason="dirty checkout")
+            return False
+        try:
+            _git([*_GIT_IDENTITY, "merge", "--no-ff", "--no-edit", branch], self.repo)
+            return True
+        except WorkspaceError as exc:
+            _git(["merge", "--abort"], self.repo, check=False)
+            logger.warning("worktree_merge_conflict", branch=branch, error=str(exc))
+            return False
+
+    def fill_pool(self, size: int | None = None) -> int:
+        """Create detached worktrees at HEAD until the pool holds ``size``."""
+        size = settings.worktree_pool_size if size is None else size
+        created = 0
+        with self._locked():
+            missing = size - len(self._pool_entries())
+            if missing <= 0:
+                return 0
+            head = _git(["rev-parse", "HEAD"], self.repo)
+            for _ in range(missing):
+                path = os.path.join(self.pool_dir, f"wt-{uuid.uuid4().hex[:12]}")
+                _git(["worktree", "add", "--detach", path, head], self.repo)
+                created += 1
+        return created
+
+    def collect(self, is_running: Any, stale_seconds: float) -> list[str]:
+        """Remove active worktrees whose task is no longer running.
+
+        A worktree younger than a minute is left alone so a task that has
+        just claimed it is not raced; one older than ``stale_seconds`` is
+        removed even if its task still claims to be running.  Task branches
+        with commits are kept.
+        """
+        removed: list[str] = []
+        now = time.time()
+        with self._locked():
+            _git(["worktree", "prune"], self.repo, check=False)
+            for name in os.listdir(self.active_dir):
+                path = os.path.join(self.active_dir, name)
+                age = now - os.path.getmtime(path)
+                if age < 60 or (age < stale_seconds and is_running(name)):
+                    continue
+                _git(["worktree", "remove", "--force", path], self.repo, check=False)
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(name)
+            _git(["worktree", "prune"], self.repo, check=False)
+        if removed:
+            logger.info("worktrees_collected", repo=self.repo, task_ids=removed)
+        return removed
+
+
+_managers: dict[str, WorktreeManager] = {}
+
+
+def get_worktree_manager(workspace: str) -> WorktreeManager | None:
+    """Manager for the repository containing ``workspace``; None if not a git repo."""
+    if not settings.worktree_enabled or not os.path.isdir(workspace):
+        return None
+    repo = _repo_toplevel(workspace)
+    if repo is None:
+        return None
+    if repo not in _managers:
+        _managers[repo] = WorktreeManager(repo)
+    return _managers[repo]
+
+
+def _known_managers() -> list[WorktreeManager]:
+    root = os.path.expanduser(settings.worktree_root)
+    if not os.path.isdir(root):
+        return []
+    managers = []
+    for name in os.listdir(root):
+        marker = os.path.join(root, name, "REPO")
+        if not os.path.isfile(marker):
+            continue
+        with open(marker) as fh:
+            repo = fh.read().strip()
+        if not os.path.isdir(repo):
+            continue
+        try:
+            managers.append(_managers.get(repo) or WorktreeManager(repo))
+        except OSError as exc:
+            logger.warning("worktree_root_unwritable", repo=repo, error=str(exc))
+    return managers
+
+
+@celery.task(name="app.workers.workspace.gc_worktrees")
+def gc_worktrees() -> dict[str, Any]:
+    """Remove stale task worktrees and refill the warm pools."""
+    db = get_sync_db()
+
+    def is_running(task_id: str) -> bool:
+        try:
+            task = db.get(Task, uuid.UUID(task_id))
+        except ValueError:
+            return False
+        return task is not None and task.status in (TaskStatus.PENDING, TaskStatus.RUNNING)
+
+    removed = 0
+    refilled = 0
+    try:
+        for manager in _known_managers():
+            try:
+                removed += len(manager.collect(is_running, settings.worktree_stale_seconds))
+                refilled += manager.fill_pool()
+            except WorkspaceError as exc:
+                logger.warning("worktree_gc_failed", repo=manager.repo, error=str(exc))
+    finally:
+        db.close()
+
+    return {"removed": removed, "refilled": refilled}
@@ -36,7 +36,8 @@ function formatPayload(payload: Record<string, unknown>): string[] {
 }
 
 export default function EventsPage() {
-  const { data: events, isLoading } = useEvents(200);
+  const { data: eventPage, isLoading } = useEvents(200);
+  const events = eventPage?.items;
 
   return (
     <div className="max-w-4xl mx-auto">
@@ -53,7 +54,7 @@ export default function EventsPage() {
           </span>
         </div>
         <p className="text-sm mt-1" style={{ color: "var(--text-muted)" }}>
-          Real-time event stream from your project &middot; auto-refreshes every 5s
+          Real-time event stream from your project
         </p>
       </div>
 
@@ -11,7 +11,7 @@ import { MessagesSquare, Send, Loader2, Zap, CheckCircle2, AlertCircle } from "l
 type SessionState = "idle" | "submitting" | "success" | "error";
 
 export default function MeetingsPage() {
-  const { data: agents } = useAgents();
+  const { items: agents } = useAgents();
   const [prompt, setPrompt] = useState("");
   const [title, setTitle] = useState("");
   const [autoExecute, setAutoExecute] = useState(false);
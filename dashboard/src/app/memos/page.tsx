@@ -4,11 +4,12 @@ import { useMemos } from "@/lib/hooks";
 import Card from "@/components/Card";
 import TimeAgo from "@/components/TimeAgo";
 import EmptyState from "@/components/EmptyState";
+import LoadMore from "@/components/LoadMore";
 import { FileText, Loader2, ArrowRight } from "lucide-react";
 import Link from "next/link";
 
 export default function MemosPage() {
-  const { data: memos, isLoading } = useMemos();
+  const { items: memos, isLoading, hasMore, loadMore } = useMemos();
 
   return (
     <div className="max-w-4xl mx-auto">
@@ -45,7 +46,7 @@ export default function MemosPage() {
                     {memo.title}
                   </h2>
                   <p className="text-xs line-clamp-2" style={{ color: "var(--text-secondary)" }}>
-                    {memo.content_markdown.slice(0, 200).replace(/[#*_\-|]/g, "").trim()}...
+                    {memo.executive_summary.replace(/[#*_\-|]/g, "").trim()}
                   </p>
                   <div className="mt-2">
                     <TimeAgo date={memo.created_at} />
@@ -58,6 +59,7 @@ export default function MemosPage() {
           </Link>
         ))}
       </div>
+      <LoadMore hasMore={hasMore} onClick={loadMore} />
     </div>
   );
 }
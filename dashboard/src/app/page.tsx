@@ -57,10 +57,11 @@ function StatCard({
 
 export default function OverviewPage() {
   const { data: project } = useProject();
-  const { data: agents } = useAgents();
-  const { data: events } = useEvents(10);
-  const { data: memos } = useMemos();
-  const { data: tasks } = useTasks();
+  const { items: agents } = useAgents();
+  const { data: eventPage } = useEvents(10);
+  const events = eventPage?.items;
+  const { items: memos, hasMore: moreMemos } = useMemos();
+  const { items: tasks, hasMore: moreTasks } = useTasks();
 
   const loading = !project;
 
@@ -92,8 +93,8 @@ export default function OverviewPage() {
 
       <div className="grid grid-cols-4 gap-4 mb-8">
         <StatCard label="Agents" value={agents?.length ?? 0} icon={Users} href="/meetings" delay={0} />
-        <StatCard label="Memos" value={memos?.length ?? 0} icon={FileText} href="/memos" delay={50} />
-        <StatCard label="Tasks" value={tasks?.length ?? 0} icon={ListTodo} href="/tasks" delay={100} />
+        <StatCard label="Memos" value={`${memos?.length ?? 0}${moreMemos ? "+" : ""}`} icon={FileText} href="/memos" delay={50} />
+        <StatCard label="Tasks" value={`${tasks?.length ?? 0}${moreTasks ? "+" : ""}`} icon={ListTodo} href="/tasks" delay={100} />
         <StatCard label="Events" value={events?.length ?? 0} icon={Activity} href="/events" delay={150} />
       </div>
 
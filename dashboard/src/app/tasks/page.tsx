@@ -6,6 +6,7 @@ import StatusBadge from "@/components/StatusBadge";
 import RoleBadge from "@/components/RoleBadge";
 import TimeAgo from "@/components/TimeAgo";
 import EmptyState from "@/components/EmptyState";
+import LoadMore from "@/components/LoadMore";
 import { ListTodo, Loader2, Play, Code, Palette, Search, FileCheck, BarChart3, FileText } from "lucide-react";
 import { api } from "@/lib/api";
 import { useState } from "react";
@@ -92,7 +93,7 @@ function TaskRow({ task }: { task: Task }) {
 }
 
 export default function TasksPage() {
-  const { data: tasks, isLoading } = useTasks();
+  const { items: tasks, isLoading, hasMore, loadMore } = useTasks();
   const [filter, setFilter] = useState<string>("all");
 
   const filteredTasks = tasks?.filter((t) => {
@@ -133,7 +134,7 @@ export default function TasksPage() {
               fontFamily: "var(--font-mono)",
             }}
           >
-            {s === "all" ? `All (${tasks?.length ?? 0})` : `${s} (${statusCounts[s] || 0})`}
+            {s === "all" ? `All (${tasks?.length ?? 0}${hasMore ? "+" : ""})` : `${s} (${statusCounts[s] || 0})`}
           </button>
         ))}
       </div>
@@ -157,6 +158,7 @@ export default function TasksPage() {
           </div>
         ))}
       </div>
+      <LoadMore hasMore={hasMore} onClick={loadMore} />
     </div>
   );
 }
@@ -0,0 +1,21 @@
+"use client";
+
+export default function LoadMore({ hasMore, onClick }: { hasMore: boolean; onClick: () => void }) {
+  if (!hasMore) return null;
+  return (
+    <div className="flex justify-center mt-6">
+      <button
+        onClick={onClick}
+        className="rounded-full px-4 py-1.5 text-[11px] font-medium transition-colors cursor-pointer"
+        style={{
+          background: "var(--bg-surface)",
+          color: "var(--text-muted)",
+          border: "1px solid var(--border)",
+          fontFamily: "var(--font-mono)",
+        }}
+      >
+        Load more
+      </button>
+    </div>
+  );
+}
@@ -1,4 +1,4 @@
-const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
+export const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
 export const PROJECT_ID = process.env.NEXT_PUBLIC_PROJECT_ID || "9b7d36e6-b590-49f6-8439-2d702ac5a9f6";
 
@@ -19,13 +19,13 @@ async function request<T>(path: string, init?: RequestInit): Promise<T> {
 
 export const api = {
   getProject: (id: string) => request<import("./types").Project>(`/projects/${id}`),
-  getAgents: (projectId: string) => request<import("./types").Agent[]>(`/projects/${projectId}/agents`),
-  getMemos: (projectId: string) => request<import("./types").Memo[]>(`/projects/${projectId}/memos`),
+  getAgents: (projectId: string) => request<import("./types").Page<import("./types").Agent>>(`/projects/${projectId}/agents`),
+  getMemos: (projectId: string) => request<import("./types").Page<import("./types").MemoSummary>>(`/projects/${projectId}/memos`),
   getMemo: (id: string) => request<import("./types").Memo>(`/memos/${id}`),
-  getEvents: (projectId: string, limit = 50) => request<import("./types").Event[]>(`/projects/${projectId}/events?limit=${limit}`),
-  getTasks: (projectId: string) => request<import("./types").Task[]>(`/projects/${projectId}/tasks`),
-  getMessages: (threadId: string) => request<import("./types").Message[]>(`/threads/${threadId}/messages`),
-  getArtifacts: (projectId: string) => request<import("./types").Artifact[]>(`/projects/${projectId}/artifacts`),
+  getEvents: (projectId: string, limit = 50) => request<import("./types").Page<import("./types").Event>>(`/projects/${projectId}/events?limit=${limit}`),
+  getTasks: (projectId: string) => request<import("./types").Page<import("./types").Task>>(`/projects/${projectId}/tasks`),
+  getMessages: (threadId: string) => request<import("./types").Page<import("./types").Message>>(`/threads/${threadId}/messages`),
+  getArtifacts: (projectId: string) => request<import("./types").Page<import("./types").Artifact>>(`/projects/${projectId}/artifacts`),
   startSession: (projectId: string, body: import("./types").SessionCreate) =>
     request<import("./types").SessionRead>(`/projects/${projectId}/sessions`, {
       method: "POST",
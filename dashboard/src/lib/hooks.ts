@@ -1,6 +1,8 @@
+import { useEffect, useRef } from "react";
 import useSWR from "swr";
-import { fetcher, PROJECT_ID } from "./api";
-import type { Agent, Event, Memo, Task, Project } from "./types";
+import useSWRInfinite from "swr/infinite";
+import { API_BASE, fetcher, PROJECT_ID } from "./api";
+import type { Agent, Event, Memo, MemoSummary, Page, Task, Project } from "./types";
 
 const projectId = PROJECT_ID;
 
@@ -8,24 +10,114 @@ export function useProject() {
   return useSWR<Project>(`/projects/${projectId}`, fetcher);
 }
 
+/**
+ * Walk a cursor-paginated list endpoint.  `items` holds every page loaded
+ * so far; `loadMore` fetches the next one while `hasMore` is true.
+ */
+export function usePaged<T>(path: string, limit = 50) {
+  const swr = useSWRInfinite<Page<T>>(
+    (index, previous: Page<T> | null) => {
+      const sep = path.includes("?") ? "&" : "?";
+      if (index === 0) return `${path}${sep}limit=${limit}`;
+      if (!previous?.has_more || !previous.next_cursor) return null;
+      return `${path}${sep}limit=${limit}&cursor=${encodeURIComponent(previous.next_cursor)}`;
+    },
+    fetcher,
+  );
+  const { data, size, setSize } = swr;
+  const last = data?.[data.length - 1];
+
+  return {
+    ...swr,
+    items: data?.flatMap((page) => page.items),
+    hasMore: Boolean(last?.has_more),
+    loadMore: () => setSize(size + 1),
+  };
+}
+
 export function useAgents() {
-  return useSWR<Agent[]>(`/projects/${projectId}/agents`, fetcher);
+  return usePaged<Agent>(`/projects/${projectId}/agents`, 200);
 }
 
 export function useMemos() {
-  return useSWR<Memo[]>(`/projects/${projectId}/memos`, fetcher);
+  return usePaged<MemoSummary>(`/projects/${projectId}/memos`);
 }
 
 export function useMemo(id: string) {
   return useSWR<Memo>(id ? `/memos/${id}` : null, fetcher);
 }
 
+type StreamMessage = Event & { stream_id?: string };
+
+/**
+ * Push project events over Server-Sent Events.  EventSource reconnects by
+ * itself and sends the last stream id as Last-Event-ID, so the server
+ * replays whatever was published in between.  `onReset` fires when the
+ * server cannot replay (first connect, or history trimmed past our
+ * position) and the caller should reload over REST.
+ */
+export function useEventStream(onEvent: (event: Event) => void, onReset: () => void) {
+  const handlers = useRef({ onEvent, onReset });
+  handlers.current = { onEvent, onReset };
+
+  useEffect(() => {
+    let source: EventSource | null = null;
+    let lastId = "";
+    let timer: ReturnType<typeof setTimeout> | undefined;
+
+    const connect = () => {
+      const query = lastId ? `?last_id=${encodeURIComponent(lastId)}` : "";
+      source = new EventSource(`${API_BASE}/sse/projects/${projectId}${query}`);
+
+      source.onmessage = (msg) => {
+        const data: StreamMessage = JSON.parse(msg.data);
+        if (data.type === "STREAM_READY") {
+          const ready = data.payload_json as { reset: boolean };
+          if (!lastId || ready.reset) handlers.current.onReset();
+        } else if (data.stream_id) {
+          // Only stored events carry a stream id; live deltas are not listed
+          handlers.current.onEvent(data);
+        }
+        lastId = msg.lastEventId || lastId;
+      };
+
+      // EventSource retries on its own unless the server answered with an
+      // error status; then start over from the last id we saw
+      source.onerror = () => {
+        if (source?.readyState === EventSource.CLOSED) {
+          timer = setTimeout(connect, 5000);
+        }
+      };
+    };
+
+    connect();
+    return () => {
+      clearTimeout(timer);
+      source?.close();
+    };
+  }, []);
+}
+
 export function useEvents(limit = 100) {
-  return useSWR<Event[]>(`/projects/${projectId}/events?limit=${limit}`, fetcher, {
-    refreshInterval: 5000,
-  });
+  const swr = useSWR<Page<Event>>(`/projects/${projectId}/events?limit=${limit}`, fetcher);
+  const { mutate } = swr;
+
+  useEventStream(
+    (event) =>
+      mutate(
+        (page) => {
+          if (!page) return page;
+          if (page.items.some((e) => e.id === event.id)) return page;
+          return { ...page, items: [event, ...page.items].slice(0, limit) };
+        },
+        { revalidate: false },
+      ),
+    () => mutate(),
+  );
+
+  return swr;
 }
 
 export function useTasks() {
-  return useSWR<Task[]>(`/projects/${projectId}/tasks`, fetcher);
+  return usePaged<Task>(`/projects/${projectId}/tasks`);
 }
@@ -33,14 +33,19 @@ export interface Message {
   created_at: string;
 }
 
-export interface Memo {
+export interface MemoSummary {
   id: string;
   project_id: string;
   title: string;
-  content_markdown: string;
+  size_bytes: number;
+  executive_summary: string;
   created_at: string;
 }
 
+export interface Memo extends MemoSummary {
+  content_markdown: string;
+}
+
 export interface Event {
   id: string;
   project_id: string;
@@ -49,6 +54,13 @@ export interface Event {
   created_at: string;
 }
 
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+  prev_cursor: string | null;
+  has_more: boolean;
+}
+
 export interface Task {
   id: string;
   project_id: string;
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark CLIAdapter invocation overhead across prompt sizes.
+
+Runs ``CLIAdapter.invoke`` against a stub ``openclaw`` (a tiny shell script
+that reads the message and prints a canned JSON reply) for each message
+transport — argv, stdin and a memory-backed temp file — and prints the median
+wall time per call.  argv fails outright once a message passes the kernel's
+per-argument limit (128 KiB on Linux), which is why large messages use stdin
+or a file.
+
+    python scripts/bench_cli_overhead.py
+    python scripts/bench_cli_overhead.py --sizes 1k,64k,1m --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import stat
+import sys
+import tempfile
+import time
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.config import settings  # noqa: E402
+from app.openclaw.base import AgentInvocation  # noqa: E402
+from app.openclaw.cli_adapter import CLIAdapter, prepare_message  # noqa: E402
+
+STUB = """#!/bin/sh
+while [ $# -gt 0 ]; do
+  case "$1" in
+    --message) shift 2 ;;
+    {flag}) if [ "$2" = "-" ]; then cat > /dev/null; else cat "$2" > /dev/null; fi; shift 2 ;;
+    *) shift ;;
+  esac
+done
+echo '{{"payloads": [{{"text": "ok"}}]}}'
+"""
+
+
+def _parse_size(text: str) -> int:
+    units = {"k": 1024, "m": 1024 * 1024}
+    text = text.strip().lower()
+    if text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def _write_stub(directory: str) -> str:
+    path = os.path.join(directory, "openclaw")
+    with open(path, "w") as fh:
+        fh.write(STUB.format(flag=settings.openclaw_message_file_flag))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    return path
+
+
+class _BenchAdapter(CLIAdapter):
+    """CLIAdapter with a fixed transport instead of the size-based choice."""
+
+    def __init__(self, bin_path: str, mode: str):
+        super().__init__(bin_path=bin_path)
+        self.mode = mode
+
+    def _prepare_message(self, invocation):
+        return prepare_message(self._build_message(invocation), mode=self.mode, max_argv_bytes=0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="1k,8k,64k,256k,1m")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    sizes = [_parse_size(s) for s in args.sizes.split(",")]
+    modes = ["argv", "stdin", "file"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stub = _write_stub(tmp)
+        print(f"{'size':>10} " + " ".join(f"{m + ' ms':>12}" for m in modes))
+        for size in sizes:
+            invocation = AgentInvocation(role="engineer", instruction="x" * size)
+            row = []
+            for mode in modes:
+                adapter = _BenchAdapter(stub, mode)
+                timings = []
+                failed = ""
+                for _ in range(args.runs):
+                    started = time.perf_counter()
+                    result = adapter.invoke(invocation)
+                    timings.append((time.perf_counter() - started) * 1000)
+                    if not result.success:
+                        failed = "fail"
+                        break
+                row.append(failed or f"{statistics.median(timings):.2f}")
+            print(f"{size:>10} " + " ".join(f"{cell:>12}" for cell in row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Regression benchmark for prompt size per meeting.
+
+Replays a meeting with fixed, synthetic round outputs through the same
+context builder, round templates and prompt assembly the workers use, then
+checks:
+
+* no transcript block is sent twice within one message;
+* the total prompt bytes for the meeting stay under ``--max-bytes``.
+
+It needs no database, Redis or OpenClaw install.  Run it from the repo root::
+
+    python scripts/bench_prompt_bytes.py
+    python scripts/bench_prompt_bytes.py --max-bytes 70000 --verbose
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.agents.roles import get_role_config  # noqa: E402
+from app.openclaw.base import AgentInvocation  # noqa: E402
+from app.openclaw.prompt import build_message  # noqa: E402
+from app.workers.context import MeetingContext  # noqa: E402
+from app.workers.executor import _build_execution_prompt  # noqa: E402
+from app.workers.meeting import ROUND_CONFIG, _memo_instruction  # noqa: E402
+
+PROMPT = (
+    "We want to add real-time collaborative editing to our note-taking app. "
+    "Target small teams, keep infrastructure costs flat, ship a beta in six weeks."
+)
+
+# Budget for the whole meeting (7 rounds + memo + one execution turn).
+# Raise it only together with a deliberate change to prompts or budgets.
+DEFAULT_MAX_BYTES = 64_000
+
+
+def _round_output(round_num: int) -> str:
+    lines = [f"## Round {round_num} findings"]
+    for i in range(40):
+        lines.append(
+            f"- Point {i} of round {round_num}: the team weighed option {i % 5} "
+            f"against the constraints in the brief and noted follow-ups for sprint {i % 3}."
+        )
+    if round_num == 5:
+        lines += [
+            "DECISION: Ship CRDT-based sync | Works offline and avoids a central lock server",
+            "ACTION: engineer | Prototype the sync engine",
+            "ACTION: designer | Presence indicators | after: 1",
+        ]
+    if round_num == 6:
+        lines.append("APPROVED: Ship CRDT-based sync")
+    return "\n".join(lines)
+
+
+def _largest_repeat(message: str, blocks: list[str]) -> str | None:
+    for block in blocks:
+        if len(block) >= 200 and message.count(block) > 1:
+            return block[:80]
+    return None
+
+
+def run(verbose: bool) -> tuple[int, list[str]]:
+    ctx = MeetingContext(PROMPT)
+    total = 0
+    problems: list[str] = []
+
+    def measure(label: str, invocation: AgentInvocation) -> None:
+        nonlocal total
+        message = build_message(invocation)
+        size = len(message.encode("utf-8"))
+        total += size
+        blocks = [b for b in invocation.context.split("\n\n---\n\n") if b.strip()]
+        repeated = _largest_repeat(message, blocks)
+        if repeated:
+            problems.append(f"{label}: context block sent twice: {repeated!r}…")
+        if verbose:
+            print(f"{label:<40} {size:>8} bytes")
+
+    for rc in ROUND_CONFIG:
+        role = rc["role"].value if rc["role"] else "system"
+        context = ctx.build(rc["depends_on"], role)
+        instruction = rc["instruction_template"].format(prompt=PROMPT, context=context)
+        measure(f"round {rc['round']} ({role})", AgentInvocation(
+            role=role, instruction=instruction, context=context,
+        ))
+        ctx.add(rc["round"], rc["label"], _round_output(rc["round"]))
+
+    context = ctx.build(ctx.rounds, "memo_writer")
+    measure("memo (memo_writer)", AgentInvocation(
+        role="memo_writer", instruction=_memo_instruction(context), context=context,
+    ))
+
+    task = SimpleNamespace(title="Prototype the sync engine", description=_round_output(2))
+    rc = get_role_config("engineer")
+    measure("execute_task (engineer)", AgentInvocation(
+        role="engineer",
+        instruction=_build_execution_prompt("engineer", task, "/workspace"),
+        context=task.description,
+        tool_allow=list(rc.tools_allowed),
+        workspace_dir="/workspace",
+    ))
+
+    return total, problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    total, problems = run(args.verbose)
+    print(f"prompt bytes per meeting: {total} (limit {args.max_bytes})")
+    for problem in problems:
+        print(f"FAIL {problem}")
+    if total > args.max_bytes:
+        print(f"FAIL prompt bytes {total} exceed {args.max_bytes}")
+        return 1
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Regression check: a failed meeting round is re-run together with every round after it.
+
+Runs the real ``run_meeting_pipeline`` twice against an in-memory SQLite
+database with a scripted OpenClaw client.  The first run fails round
+``--fail-round``; the check asserts that nothing after that round's stage was
+checkpointed, then resumes the meeting and asserts that exactly the failed
+round and all later rounds (and the memo) ran again and were checkpointed.
+
+It needs no Postgres, Redis or OpenClaw install.  Run it from the repo root::
+
+    python scripts/check_meeting_resume.py
+    python scripts/check_meeting_resume.py --fail-round 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import uuid
+from typing import Any
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.dialects.postgresql import JSONB  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.models import Agent, AgentRole, Base, Event, MeetingCheckpoint, Project, Thread  # noqa: E402
+from app.openclaw.base import AgentResult  # noqa: E402
+from app.workers import meeting  # noqa: E402
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(_type: Any, _compiler: Any, **_: Any) -> str:
+    return "JSON"
+
+
+class _ScriptedClient:
+    """Answers every turn, except the first turn of ``fail_round`` when ``fail`` is set."""
+
+    def __init__(self, fail_round: int | None):
+        self.fail_round = fail_round
+        self._lock = threading.Lock()
+        self._prefixes = {
+            rc["round"]: rc["instruction_template"].split("{")[0] for rc in meeting.ROUND_CONFIG
+        }
+
+    def _round_of(self, role: str, instruction: str) -> int:
+        if role == "memo_writer":
+            return meeting.MEMO_ROUND
+        return next(r for r, prefix in self._prefixes.items() if instruction.startswith(prefix))
+
+    def run_agent(self, *, role: str, instruction: str, **_: Any) -> AgentResult:
+        round_num = self._round_of(role, instruction)
+        with self._lock:
+            if round_num == self.fail_round:
+                self.fail_round = None
+                return AgentResult(output="", success=False, exit_code=1, error="scripted failure")
+        return AgentResult(output=f"Output of round {round_num} ({role})")
+
+
+def _rounds(db: Any, thread_id: str, event_type: str, after: int = 0) -> list[int]:
+    events = db.execute(select(Event).where(Event.type == event_type)).scalars().all()
+    return sorted(
+        e.payload_json["round"] for e in events[after:] if e.payload_json.get("thread_id", thread_id) == thread_id
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fail-round", type=int, default=2, choices=[rc["round"] for rc in meeting.ROUND_CONFIG])
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(engine, expire_on_commit=False)
+
+    with session_factory() as db:
+        project = Project(name="Resume check")
+        db.add(project)
+        db.flush()
+        thread = Thread(project_id=project.id, title="Resume check")
+        db.add(thread)
+        db.add_all(Agent(project_id=project.id, role=role, name=role.value) for role in AgentRole)
+        db.commit()
+        project_id, thread_id = str(project.id), str(thread.id)
+
+    client = _ScriptedClient(args.fail_round)
+    meeting.get_sync_db = session_factory
+    meeting.get_openclaw_client = lambda: client
+
+    all_rounds = [rc["round"] for rc in meeting.ROUND_CONFIG]
+    failed_stage = next(
+        stage for stage in meeting._plan_stages(meeting.ROUND_CONFIG)
+        if args.fail_round in [rc["round"] for rc in stage]
+    )
+    stage_rounds = {rc["round"] for rc in failed_stage}
+    expected_first = sorted(r for r in all_rounds if r < min(stage_rounds) or r in stage_rounds - {args.fail_round})
+    expected_rerun = sorted(r for r in all_rounds if r not in expected_first)
+
+    failures = []
+
+    try:
+        meeting.run_meeting_pipeline.run(project_id, thread_id, "Plan the launch")
+        failures.append("first run did not fail")
+    except meeting.RoundFailedError as exc:
+        print(f"First run failed as scripted: {exc}")
+
+    with session_factory() as db:
+        checkpointed = sorted(meeting._load_checkpoints(db, thread_id))
+        started = len(db.execute(select(Event).where(Event.type == "ROUND_STARTED")).scalars().all())
+        session_failed = db.execute(select(Event).where(Event.type == "SESSION_FAILED")).scalars().all()
+    print(f"Checkpointed after the failure: {checkpointed}")
+    if checkpointed != expected_first:
+        failures.append(f"checkpoints after the failure are {checkpointed}, expected {expected_first}")
+    if len(session_failed) != 1:
+        failures.append(f"{len(session_failed)} SESSION_FAILED events, expected 1")
+
+    result = meeting.run_meeting_pipeline.run(project_id, thread_id, "Plan the launch", resume=True)
+
+    with session_factory() as db:
+        rerun = _rounds(db, thread_id, "ROUND_STARTED", after=started)
+        checkpointed = sorted(meeting._load_checkpoints(db, thread_id))
+    print(f"Re-run on resume: {rerun}; checkpointed: {checkpointed}")
+    if result.get("status") != "completed":
+        failures.append(f"resume returned {result}")
+    if rerun != expected_rerun:
+        failures.append(f"resume re-ran rounds {rerun}, expected {expected_rerun}")
+    if checkpointed != [*all_rounds, meeting.MEMO_ROUND]:
+        failures.append(f"checkpoints after resume are {checkpointed}")
+
+    for failure in failures:
+        print(f"FAIL  {failure}")
+    print("ok" if not failures else f"{len(failures)} check(s) failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
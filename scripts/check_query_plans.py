@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Query-plan regression check: no hot query may use a sequential scan.
+
+Seeds a large synthetic dataset (``--projects`` projects, each with agents,
+threads, messages, tasks, artifacts, memos, events, decisions and action
+items) inside one transaction, ANALYZEs it, then runs the real router
+endpoints and worker helpers against it while recording every SQL statement
+they issue.  Each statement is EXPLAINed and the check fails if any plan
+contains a ``Seq Scan``.  Everything is rolled back at the end, so it can be
+pointed at a development database::
+
+    alembic upgrade head
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --projects 500 --verbose
+
+It needs Postgres (``DATABASE_URL_SYNC``) but no Redis or OpenClaw.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import uuid
+from typing import Any
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+from app.database import sync_engine  # noqa: E402
+from app.models import (  # noqa: E402
+    ActionItem,
+    ActionItemStatus,
+    AgentRole,
+    AuthorType,
+    Message,
+    TaskStatus,
+)
+from app.routers import agents, artifacts, events, memos, projects, tasks, threads  # noqa: E402
+from app.workers import meeting, outbox  # noqa: E402
+
+_ROLES = "ARRAY['pm','engineer','designer','analyst','memo_writer','ceo']"
+
+# One statement per table; %(...)s are the per-project row counts
+_SEED = [
+    """INSERT INTO projects (id, name, created_at)
+       SELECT gen_random_uuid(), 'Project ' || p, now() - p * interval '1 hour'
+       FROM generate_series(1, %(projects)s) p""",
+    f"""INSERT INTO agents (id, project_id, role, name, status, config_json, created_at)
+       SELECT gen_random_uuid(), pr.id, ({_ROLES})[r]::agentrole, 'Agent ' || r, 'idle', '{{}}',
+              pr.created_at + r * interval '1 second'
+       FROM projects pr, generate_series(1, 6) r""",
+    """INSERT INTO threads (id, project_id, title, created_at)
+       SELECT gen_random_uuid(), pr.id, 'Thread ' || t, pr.created_at + t * interval '1 minute'
+       FROM projects pr, generate_series(1, %(threads)s) t""",
+    """INSERT INTO messages (id, thread_id, author_type, content, created_at)
+       SELECT gen_random_uuid(), th.id,
+              (ARRAY['user','agent','system'])[1 + m %% 3]::authortype,
+              repeat('message body ', 20), th.created_at + m * interval '1 second'
+       FROM threads th, generate_series(1, %(messages)s) m""",
+    """INSERT INTO meeting_checkpoints (id, thread_id, round, label, role, output, created_at)
+       SELECT gen_random_uuid(), th.id, r, 'Round ' || r, 'pm', 'output', th.created_at
+       FROM threads th, generate_series(1, 6) r""",
+    f"""INSERT INTO agent_sessions (id, thread_id, role, session_id, rounds_seen, turns)
+       SELECT gen_random_uuid(), th.id, ({_ROLES})[r], gen_random_uuid()::text, '[]', 0
+       FROM threads th, generate_series(1, 6) r""",
+    """INSERT INTO decisions (id, project_id, title, rationale, status, created_at)
+       SELECT gen_random_uuid(), pr.id, 'Decision ' || d, '', 'proposed', pr.created_at
+       FROM projects pr, generate_series(1, %(decisions)s) d""",
+    """INSERT INTO action_items (id, project_id, owner_role, description, status, depends_on, created_at)
+       SELECT gen_random_uuid(), pr.id, 'engineer', 'Item ' || a,
+              (ARRAY['open','in_progress','done'])[1 + a %% 3]::actionitemstatus, '[]',
+              pr.created_at + a * interval '1 second'
+       FROM projects pr, generate_series(1, %(decisions)s) a""",
+    """INSERT INTO tasks (id, project_id, agent_role, title, description, task_type, status, source, created_at)
+       SELECT gen_random_uuid(), pr.id, 'engineer', 'Task ' || t, 'desc', 'code',
+              (ARRAY['pending','running','completed','failed'])[1 + t %% 4]::taskstatus, 'direct',
+              pr.created_at + t * interval '1 second'
+       FROM projects pr, generate_series(1, %(tasks)s) t""",
+    """INSERT INTO artifacts (id, project_id, task_id, artifact_type, path_or_url, description, metadata_json,
+                              created_at)
+       SELECT gen_random_uuid(), t.project_id, t.id, 'file', 'src/file_' || a || '.py', '', '{}', t.created_at
+       FROM tasks t, generate_series(1, 2) a""",
+    """INSERT INTO memos (id, project_id, title, content_markdown, size_bytes, executive_summary, created_at)
+       SELECT gen_random_uuid(), pr.id, 'Memo ' || m, repeat('memo body ', 200), 2000, 'summary',
+              pr.created_at + m * interval '1 minute'
+       FROM projects pr, generate_series(1, %(memos)s) m""",
+    """INSERT INTO events (id, project_id, type, payload_json, created_at, published_at)
+       SELECT gen_random_uuid(), pr.id, 'AGENT_RESPONSE', jsonb_build_object('task_id', gen_random_uuid()::text),
+              pr.created_at + e * interval '1 second', pr.created_at + e * interval '1 second'
+       FROM projects pr, generate_series(1, %(events)s) e""",
+]
+
+_TABLES = (
+    "projects", "agents", "threads", "messages", "meeting_checkpoints", "agent_sessions",
+    "decisions", "action_items", "tasks", "artifacts", "memos", "events",
+)
+
+
+class _AsyncSessionShim:
+    """Enough of ``AsyncSession`` for the read-only endpoints, over a sync Session."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def execute(self, stmt: Any) -> Any:
+        return self._session.execute(stmt)
+
+    async def get(self, model: Any, ident: Any) -> Any:
+        return self._session.get(model, ident)
+
+
+def _request(query: str = "") -> Request:
+    return Request({
+        "type": "http", "method": "GET", "scheme": "http", "server": ("check", 80),
+        "path": "/", "root_path": "", "query_string": query.encode(), "headers": [],
+    })
+
+
+def _seq_scans(plan: dict[str, Any]) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", ()):
+        found.extend(_seq_scans(child))
+    return found
+
+
+async def _run_endpoints(db: _AsyncSessionShim, ids: dict[str, uuid.UUID]) -> None:
+    project_id, thread_id, task_id = ids["project"], ids["thread"], ids["task"]
+    page = dict(limit=50, cursor=None)
+
+    await projects.list_projects(db=db, **page)
+    await projects.get_project(project_id, db=db)
+    await agents.list_agents(project_id, db=db, **page)
+
+    first = await threads.list_messages(thread_id, _request(), Response(), db=db, **page)
+    await threads.list_messages(thread_id, _request(), Response(), db=db, limit=50, cursor=first.next_cursor)
+
+    await tasks.list_tasks(project_id, _request(), Response(), status=None, db=db, **page)
+    await tasks.list_tasks(project_id, _request(), Response(), status=TaskStatus.RUNNING, db=db, **page)
+    await tasks.get_task(task_id, _request(), Response(), db=db)
+
+    listed = await artifacts.list_artifacts(project_id, _request(), Response(), db=db, **page)
+    await artifacts.get_artifact(listed.items[0].id, _request(), Response(), db=db)
+
+    listed = await memos.list_memos(project_id, _request(), Response(), db=db, **page)
+    await memos.get_memo(listed.items[0].id, _request(), Response(), db=db)
+
+    filters = dict(after=None, before=None, type=None, task_id=None, thread_id=None)
+    newest = await events.list_events(project_id, _request(), Response(), db=db, **page, **filters)
+    await events.list_events(
+        project_id, _request(), Response(), db=db, **page, **{**filters, "after": newest.prev_cursor},
+    )
+    await events.list_events(
+        project_id, _request(), Response(), db=db, **page,
+        **{**filters, "type": ["AGENT_RESPONSE"], "task_id": uuid.uuid4()},
+    )
+
+
+def _run_workers(session: Session, ids: dict[str, uuid.UUID]) -> None:
+    project_id, thread_id = str(ids["project"]), str(ids["thread"])
+    meeting._get_agent_for_role(session, project_id, AgentRole.ENGINEER)
+    meeting._get_agent_session(session, thread_id, "engineer", None)
+    meeting._load_checkpoints(session, thread_id)
+    meeting._parse_ceo_approvals(session, project_id, "")
+    outbox.relay_once(session, 100)
+
+    # Inline queries of execute_action_items and resume_session
+    session.execute(
+        select(ActionItem).where(
+            ActionItem.project_id == ids["project"],
+            ActionItem.status == ActionItemStatus.OPEN,
+        ).order_by(ActionItem.created_at)
+    ).all()
+    session.execute(
+        select(Message)
+        .where(Message.thread_id == ids["thread"], Message.author_type == AuthorType.USER)
+        .order_by(Message.created_at)
+        .limit(1)
+    ).all()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=2000)
+    parser.add_argument("--verbose", action="store_true", help="print every plan checked")
+    args = parser.parse_args()
+
+    counts = {"projects": args.projects, "threads": 3, "messages": 40, "decisions": 10,
+              "tasks": 20, "memos": 3, "events": 100}
+    statements: list[tuple[str, Any]] = []
+
+    with sync_engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            print(f"Seeding {args.projects} projects...")
+            for sql in _SEED:
+                conn.exec_driver_sql(sql, counts)
+            for table in _TABLES:
+                conn.execute(text(f"ANALYZE {table}"))
+
+            ids = {
+                "project": conn.execute(text("SELECT id FROM projects ORDER BY random() LIMIT 1")).scalar_one(),
+            }
+            ids["thread"] = conn.execute(
+                text("SELECT id FROM threads WHERE project_id = :p LIMIT 1"), {"p": ids["project"]},
+            ).scalar_one()
+            ids["task"] = conn.execute(
+                text("SELECT id FROM tasks WHERE project_id = :p LIMIT 1"), {"p": ids["project"]},
+            ).scalar_one()
+
+            def record(_conn: Any, _cursor: Any, statement: str, parameters: Any, *_: Any) -> None:
+                if statement.lstrip().upper().startswith("SELECT"):
+                    statements.append((statement, parameters))
+
+            event.listen(conn, "before_cursor_execute", record)
+            # Commits and rollbacks inside the worker helpers only touch a savepoint
+            session = Session(bind=conn, join_transaction_mode="create_savepoint")
+            asyncio.run(_run_endpoints(_AsyncSessionShim(session), ids))
+            _run_workers(session, ids)
+            session.close()
+            event.remove(conn, "before_cursor_execute", record)
+
+            failures = 0
+            for statement, parameters in statements:
+                plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar_one()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                scans = _seq_scans(plan[0]["Plan"])
+                summary = " ".join(statement.split())[:160]
+                if scans:
+                    failures += 1
+                    print(f"FAIL  Seq Scan on {', '.join(scans)}: {summary}")
+                elif args.verbose:
+                    print(f"ok    {summary}")
+        finally:
+            trans.rollback()
+
+    print(f"{len(statements)} queries checked, {failures} with a sequential scan")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
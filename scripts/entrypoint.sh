@@ -9,8 +9,21 @@ case "${1:-api}" in
     exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
     ;;
   worker)
-    echo "Starting Celery worker..."
-    exec celery -A app.workers.celery_app worker --loglevel=info --concurrency=4
+    # CELERY_QUEUES picks the queues this worker consumes (meetings, tasks, batch)
+    queues="${CELERY_QUEUES:-meetings,tasks,batch}"
+    echo "Starting Celery worker for queues: ${queues}..."
+    exec celery -A app.workers.celery_app worker --loglevel=info \
+      --queues="${queues}" \
+      --concurrency="${CELERY_CONCURRENCY:-4}" \
+      --hostname="worker-${queues//,/-}@%h"
+    ;;
+  beat)
+    echo "Starting Celery beat..."
+    exec celery -A app.workers.celery_app beat --loglevel=info --schedule=/tmp/celerybeat-schedule
+    ;;
+  outbox)
+    echo "Starting outbox relay..."
+    exec python -m app.workers.outbox
     ;;
   seed)
     exec python -m app.seed
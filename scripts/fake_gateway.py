@@ -0,0 +1,109 @@
+"""Local stand-in for the OpenClaw Gateway, for testing APIAdapter offline.
+
+Speaks the request/response/event frame protocol documented in
+``app/openclaw/api_adapter.py``.  Agent requests are answered after a
+configurable delay with a canned reply that echoes the end of the prompt,
+streamed as ``agent.delta`` events when the request asks for it, and can be
+stopped early with ``agent.cancel``.
+
+Usage:
+    python scripts/fake_gateway.py                     # ws://127.0.0.1:18789
+    python scripts/fake_gateway.py --port 18790 --latency 2 --token secret
+
+Then run the workers with:
+    OPENCLAW_ADAPTER=api OPENCLAW_GATEWAY_URL=ws://127.0.0.1:18790
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from websockets.asyncio.server import serve
+
+
+def _reply(frame_id: str, payload: dict | None = None, error: str = "") -> str:
+    if error:
+        return json.dumps({"type": "res", "id": frame_id, "ok": False, "error": {"message": error}})
+    return json.dumps({"type": "res", "id": frame_id, "ok": True, "payload": payload or {}})
+
+
+async def _run_agent(ws, frame: dict, latency: float) -> None:
+    params = frame.get("params") or {}
+    message = params.get("message", "")
+    started = time.monotonic()
+
+    chunks = [
+        f"[fake-gateway] session {params.get('sessionId', '?')}",
+        f"Received {len(message)} chars of prompt.",
+        f"Prompt tail: {message[-200:]}",
+    ]
+    for chunk in chunks:
+        await asyncio.sleep(latency / len(chunks))
+        if params.get("stream"):
+            await ws.send(json.dumps({
+                "type": "event",
+                "event": "agent.delta",
+                "payload": {"requestId": frame["id"], "text": chunk},
+            }))
+
+    await ws.send(_reply(frame["id"], {
+        "payloads": [{"text": "\n".join(chunks), "mediaUrl": None}],
+        "meta": {
+            "durationMs": int((time.monotonic() - started) * 1000),
+            "agentMeta": {"sessionId": params.get("sessionId"), "model": params.get("model", "fake")},
+        },
+    }))
+
+
+def _handler(token: str, latency: float):
+    async def handle(ws) -> None:
+        authenticated = False
+        inflight: dict[str, asyncio.Task] = {}
+
+        async for raw in ws:
+            frame = json.loads(raw)
+            if frame.get("type") != "req":
+                continue
+            method = frame.get("method")
+
+            if method == "connect":
+                given = ((frame.get("params") or {}).get("auth") or {}).get("token", "")
+                authenticated = not token or given == token
+                await ws.send(_reply(frame["id"], {"server": "fake-gateway"}, "" if authenticated else "unauthorized"))
+            elif not authenticated:
+                await ws.send(_reply(frame["id"], error="connect first"))
+            elif method == "health":
+                await ws.send(_reply(frame["id"], {"ok": True}))
+            elif method == "agent":
+                task = asyncio.create_task(_run_agent(ws, frame, latency))
+                inflight[frame["id"]] = task
+                task.add_done_callback(lambda _, rid=frame["id"]: inflight.pop(rid, None))
+            elif method == "agent.cancel":
+                task = inflight.get((frame.get("params") or {}).get("requestId", ""))
+                if task is not None:
+                    task.cancel()
+                await ws.send(_reply(frame["id"], {"cancelled": task is not None}))
+            else:
+                await ws.send(_reply(frame["id"], error=f"unknown method '{method}'"))
+
+    return handle
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18789)
+    parser.add_argument("--token", default="", help="Require this auth token on connect")
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds per agent turn")
+    args = parser.parse_args()
+
+    async with serve(_handler(args.token, args.latency), args.host, args.port, max_size=None):
+        print(f"Fake OpenClaw gateway on ws://{args.host}:{args.port}")
+        await asyncio.Future()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
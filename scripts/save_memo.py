@@ -52,15 +52,18 @@ def extract_markdown(content: str) -> str:
 def main():
     project_id = sys.argv[1] if len(sys.argv) > 1 else DEMO_PROJECT
 
-    resp = httpx.get(f"{API}/projects/{project_id}/memos")
+    resp = httpx.get(f"{API}/projects/{project_id}/memos", params={"limit": 1})
     resp.raise_for_status()
-    memos = resp.json()
+    memos = resp.json()["items"]
 
     if not memos:
         print("No memos found for this project.")
         sys.exit(1)
 
-    memo = memos[0]
+    # The list only carries summaries; fetch the full body
+    resp = httpx.get(f"{API}/memos/{memos[0]['id']}")
+    resp.raise_for_status()
+    memo = resp.json()
     markdown = extract_markdown(memo["content_markdown"])
 
     slug = re.sub(r"[^\w\s-]", "", memo["title"]).strip().replace(" ", "_")